@@ -3,77 +3,272 @@ Handles all Excel automation operations on macOS.
 """
 
 import asyncio
+import functools
+import json
+import shutil
 import uuid
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Tuple
 import logging
 
 from openpyxl import Workbook, load_workbook
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils import get_column_letter, range_boundaries
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.utils.cell import coordinate_from_string
+from openpyxl.cell import WriteOnlyCell
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from integrations.applescript_bridge import AppleScriptBridge
+from integrations.applescript_bridge import get_bridge
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Seconds of inactivity before pending mutations are written to the temp file
+AUTOSAVE_DELAY = 0.5
+
+# Chart type name -> openpyxl chart class
+CHART_CLASSES = {
+    "bar": BarChart,
+    "line": LineChart,
+    "pie": PieChart
+}
+
+# (formatting key, openpyxl keyword) pairs for Font and Alignment
+_FONT_KEYS = (
+    ("bold", "bold"),
+    ("italic", "italic"),
+    ("font_size", "size"),
+    ("font_color", "color"),
+    ("font_name", "name")
+)
+_ALIGNMENT_KEYS = (
+    ("horizontal", "horizontal"),
+    ("vertical", "vertical"),
+    ("wrap_text", "wrap_text")
+)
+
+def _parse_cell(ref: str) -> Tuple[int, int]:
+    """Split a cell reference like 'B12' or '$B$12' into (column index, row).
+    
+    Reads the column letters directly instead of going through openpyxl's
+    regex-based ``coordinate_from_string``/``column_index_from_string``, and
+    accepts the same references: 1-3 ASCII letters and a row from 1, each
+    optionally anchored with '$'.
+    
+    Args:
+        ref: Cell reference without sheet name
+    
+    Returns:
+        Tuple of 1-based column index and row number
+    """
+    n = len(ref)
+    i = start = 1 if ref[:1] == "$" else 0
+    col = 0
+    while i < n and ("A" <= ref[i] <= "Z" or "a" <= ref[i] <= "z"):
+        # Masking the low five bits maps both 'A' and 'a' to 1
+        col = col * 26 + (ord(ref[i]) & 0x1F)
+        i += 1
+    letters = i - start
+    row = ref[i + 1:] if ref[i:i + 1] == "$" else ref[i:]
+    if not 1 <= letters <= 3 or not row.isdecimal() or not int(row):
+        raise ValueError(f"Invalid cell reference: {ref}")
+    return col, int(row)
+
+def _as_rows(data: Any) -> List[List[Any]]:
+    """Normalize a write_range payload to a list of row lists.
+    
+    NumPy arrays are converted with ``tolist`` (native Python scalars,
+    converted in C) and pandas DataFrames go through openpyxl's
+    ``dataframe_to_rows``; anything else is assumed to be rows already.
+    Neither library is imported unless such an object is passed in.
+    
+    Args:
+        data: 2D list, NumPy array or pandas DataFrame
+        
+    Returns:
+        List of row lists
+    """
+    if hasattr(data, "itertuples"):
+        from openpyxl.utils.dataframe import dataframe_to_rows
+        return list(dataframe_to_rows(data, index=False, header=False))
+    if hasattr(data, "tolist") and getattr(data, "ndim", None) == 2:
+        return data.tolist()
+    return data
+
+StyleBundle = Tuple[Optional[Font], Optional[PatternFill], Optional[Alignment], Optional[Border]]
+
+def _make_style_bundle(formatting: Dict[str, Any]) -> StyleBundle:
+    """Build the openpyxl style objects described by a formatting dict.
+    
+    Args:
+        formatting: Formatting options
+        
+    Returns:
+        Tuple of (font, fill, alignment, border); entries are None when
+        the corresponding options are absent
+    """
+    font = fill = alignment = border = None
+    
+    try:
+        # Font formatting
+        font_kwargs = {out: formatting[key] for key, out in _FONT_KEYS if key in formatting}
+        if font_kwargs:
+            font = Font(**font_kwargs)
+        
+        # Fill (background color)
+        if "bg_color" in formatting:
+            fill = PatternFill(start_color=formatting["bg_color"],
+                               end_color=formatting["bg_color"],
+                               fill_type="solid")
+        
+        # Alignment
+        align_kwargs = {out: formatting[key] for key, out in _ALIGNMENT_KEYS if key in formatting}
+        if align_kwargs:
+            alignment = Alignment(**align_kwargs)
+        
+        # Border
+        if "border" in formatting and formatting["border"]:
+            side = Side(style='thin')
+            border = Border(left=side, right=side, top=side, bottom=side)
+        
+    except Exception as e:
+        logger.warning(f"Failed to apply some cell formatting: {e}")
+    
+    return font, fill, alignment, border
+
+def _style_key(formatting: Dict[str, Any]) -> Union[bytes, str]:
+    """Serialize a formatting dict to a canonical, hashable cache key.
+    
+    Uses orjson when installed and falls back to the standard json module.
+    
+    Args:
+        formatting: Formatting options
+    
+    Returns:
+        Sorted-key JSON encoding of the options
+    """
+    if orjson is not None:
+        return orjson.dumps(formatting, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(formatting, sort_keys=True)
+
+@functools.lru_cache(maxsize=256)
+def _cached_style_bundle(key: Union[bytes, str]) -> StyleBundle:
+    """Memoized _make_style_bundle keyed by the encoded formatting dict.
+    
+    Args:
+        key: Result of _style_key for the formatting dict
+    
+    Returns:
+        Shared (font, fill, alignment, border) tuple
+    """
+    return _make_style_bundle(json.loads(key))
+
 class ExcelController:
-    """Controller for Excel operations using openpyxl."""
+    """Controller for Excel operations using openpyxl.
+    
+    Mutations only update the in-memory workbook and mark it dirty.
+    The temp file is rewritten by ``flush`` (debounced automatically when
+    ``autosave`` is enabled) and ``save_workbook`` writes the final file,
+    so those two calls are the durability points. Saves run in a worker
+    thread under a per-workbook lock that mutators also wait on, so the
+    event loop stays responsive while a large workbook is serialized.
+    
+    Streaming workbooks (``create_workbook(streaming=True)``) use openpyxl's
+    write-only mode: rows are serialized to a temporary sheet file as they
+    are appended, so memory stays flat regardless of row count. Cells can
+    only be written in increasing row order, merged cells are unsupported
+    and the first ``flush`` or ``save_workbook`` finalizes the file.
+    
+    With ``open_in_excel``, new workbooks are also opened in the Excel app.
+    Only ``write_range`` is mirrored into the open window, and autosave
+    skips those workbooks so it never rewrites a file Excel has open.
+    """
     
-    def __init__(self):
-        self.applescript = AppleScriptBridge()
+    def __init__(self, autosave: bool = True, open_in_excel: bool = False):
+        self.applescript = get_bridge()
         self.active_workbooks: Dict[str, Dict[str, Any]] = {}
+        self.autosave = autosave
+        self.open_in_excel = open_in_excel
         # Use system temp directory with a subdirectory
         self.temp_dir = Path(tempfile.gettempdir()) / "office365_mcp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp_str = str(self.temp_dir)
     
     async def create_workbook(
         self,
         title: str = "New Workbook",
-        template_path: Optional[str] = None
+        template_path: Optional[str] = None,
+        streaming: bool = False,
+        template_read_only: bool = True
     ) -> Dict[str, Any]:
         """Create a new Excel workbook.
         
         Args:
             title: Workbook title
             template_path: Optional template file path
+            streaming: Create a write-only workbook for large, append-only
+                writes (ignored when a template is given)
+            template_read_only: Open .xlsx templates in read-only mode and
+                only parse them fully on the first mutation
             
         Returns:
             Dict with workbook metadata
         """
         try:
-            workbook_id = str(uuid.uuid4())
+            workbook_id = sys.intern(str(uuid.uuid4()))
+            streaming = streaming and not template_path
+            next_rows: Dict[str, int] = {}
+            template_wb = None
             
             # Create workbook using openpyxl
-            if template_path and Path(template_path).exists():
+            if (template_read_only and template_path
+                    and Path(template_path).suffix.lower() == ".xlsx"
+                    and Path(template_path).exists()):
+                # Copy-on-write: metadata comes from a lazy read-only view
+                template_wb = load_workbook(template_path, read_only=True, data_only=True)
+                wb = None
+            elif streaming:
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Sheet1")
+                title_cell = WriteOnlyCell(ws, value=title)
+                title_cell.font = Font(bold=True, size=14)
+                ws.append([title_cell])
+                next_rows[ws.title] = 2
+            elif template_path and Path(template_path).exists():
                 wb = load_workbook(template_path)
             else:
                 wb = Workbook()
             
             # Set title in first cell if new workbook
-            if not template_path:
+            if not template_path and not streaming:
                 ws = wb.active
                 ws.title = "Sheet1"
                 ws['A1'] = title
                 ws['A1'].font = Font(bold=True, size=14)
             
-            # Save temporary file
-            temp_file = self.temp_dir / f"{workbook_id}.xlsx"
-            wb.save(str(temp_file))
+            # Save temporary file (write-only workbooks can only be saved once)
+            temp_file = os.path.join(self._tmp_str, f"{workbook_id}.xlsx")
+            if template_wb is not None:
+                await asyncio.to_thread(shutil.copyfile, template_path, temp_file)
+            elif not streaming:
+                await asyncio.to_thread(wb.save, temp_file)
+            sheet_view = template_wb if template_wb is not None else wb
             
-            # Try to open in Excel via AppleScript
+            # Optionally open in Excel via AppleScript
             applescript_success = False
             try:
-                # Note: Would need to implement open_excel_file in AppleScriptBridge
-                # await self.applescript.open_excel_file(str(temp_file))
-                applescript_success = False  # For now
+                # Write-only workbooks have no file until they are finalized
+                if self.open_in_excel and not streaming:
+                    applescript_success = await self.applescript.open_excel_file(temp_file)
             except Exception as e:
                 logger.warning(f"Could not open in Excel app: {e}")
             
@@ -81,20 +276,30 @@ class ExcelController:
             workbook_data = {
                 "workbook_id": workbook_id,
                 "title": title,
-                "file_path": str(temp_file),
-                "worksheet_count": len(wb.worksheets),
-                "active_sheet": wb.active.title,
+                "file_path": temp_file,
+                "worksheet_count": len(sheet_view.sheetnames),
+                "active_sheet": sheet_view.active.title,
                 "applescript_available": applescript_success,
-                "created_at": asyncio.get_event_loop().time()
+                "streaming": streaming,
+                "created_at": time.monotonic()
             }
             
             self.active_workbooks[workbook_id] = {
                 "metadata": workbook_data,
+                # Working file; deleted on close even after a save elsewhere
+                "temp_file": Path(temp_file),
                 "workbook_object": wb,
-                "worksheets": {ws.title: ws for ws in wb.worksheets}
+                "template_workbook": template_wb,
+                "template_path": template_path,
+                "dirty": False,
+                "flush_task": None,
+                "next_rows": next_rows,
+                "closed": False,
+                "pending_charts": [],
+                "lock": asyncio.Lock()
             }
             
-            logger.info(f"Created workbook: {title} ({workbook_id})")
+            logger.info("Created workbook: %s (%s)", title, workbook_id)
             return workbook_data
             
         except Exception as e:
@@ -118,10 +323,11 @@ class ExcelController:
             Dict with worksheet metadata
         """
         try:
+            sheet_name = sys.intern(sheet_name)
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
+            wb = await self._get_workbook(workbook_id)
             
             # Create worksheet
             if position is not None:
@@ -129,17 +335,15 @@ class ExcelController:
             else:
                 ws = wb.create_sheet(sheet_name)
             
-            # Update worksheets dict
-            self.active_workbooks[workbook_id]["worksheets"][sheet_name] = ws
+            if self.active_workbooks[workbook_id]["metadata"]["streaming"]:
+                self.active_workbooks[workbook_id]["next_rows"][sheet_name] = 1
             
             # Update metadata
             self.active_workbooks[workbook_id]["metadata"]["worksheet_count"] = len(wb.worksheets)
             
-            # Save workbook
-            temp_file = self.active_workbooks[workbook_id]["metadata"]["file_path"]
-            wb.save(temp_file)
+            self._mark_dirty(workbook_id)
             
-            logger.info(f"Added worksheet '{sheet_name}' to workbook {workbook_id}")
+            logger.info("Added worksheet '%s' to workbook %s", sheet_name, workbook_id)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
@@ -172,26 +376,31 @@ class ExcelController:
             Dict with operation status
         """
         try:
+            sheet_name = sys.intern(sheet_name)
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            ws = self.active_workbooks[workbook_id]["worksheets"].get(sheet_name)
+            wb = await self._get_workbook(workbook_id)
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else None
             if not ws:
                 raise ValueError(f"Worksheet '{sheet_name}' not found")
             
-            # Write value
-            ws[cell] = value
-            
-            # Apply formatting if provided
-            if formatting:
-                await self._apply_cell_formatting(ws[cell], formatting)
+            if self.active_workbooks[workbook_id]["metadata"]["streaming"]:
+                # Write-only sheets accept a single cell as a one-row append
+                col, row = _parse_cell(cell)
+                bundle = self._build_style_bundle(formatting) if formatting else None
+                self._append_streaming_rows(workbook_id, ws, row, col, [[value]], bundle)
+            else:
+                # Write value
+                ws[cell] = value
+                
+                # Apply formatting if provided
+                if formatting:
+                    self._apply_cell_formatting(ws[cell], formatting)
             
-            # Save workbook
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
-            temp_file = self.active_workbooks[workbook_id]["metadata"]["file_path"]
-            wb.save(temp_file)
+            self._mark_dirty(workbook_id)
             
-            logger.info(f"Wrote value to cell {cell} in sheet '{sheet_name}'")
+            logger.info("Wrote value to cell %s in sheet '%s'", cell, sheet_name)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
@@ -210,52 +419,79 @@ class ExcelController:
         sheet_name: str,
         start_cell: str,
         data: List[List[Any]],
-        formatting: Optional[Dict[str, Any]] = None
+        formatting: Optional[Dict[str, Any]] = None,
+        chunk_rows: int = 1000
     ) -> Dict[str, Any]:
         """Write data to a range of cells.
         
+        Large ranges are written in tiles of ``chunk_rows`` rows, yielding to
+        the event loop between tiles so other requests are not starved.
+        
         Args:
             workbook_id: ID of the workbook
             sheet_name: Name of the worksheet
             start_cell: Starting cell reference
-            data: 2D list of values
+            data: 2D list of values, NumPy array or pandas DataFrame
             formatting: Optional formatting options
+            chunk_rows: Number of rows written per tile
             
         Returns:
             Dict with operation status
         """
         try:
+            sheet_name = sys.intern(sheet_name)
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            ws = self.active_workbooks[workbook_id]["worksheets"].get(sheet_name)
+            wb = await self._get_workbook(workbook_id)
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else None
             if not ws:
                 raise ValueError(f"Worksheet '{sheet_name}' not found")
             
+            if chunk_rows < 1:
+                raise ValueError("chunk_rows must be at least 1")
+            
             # Parse start cell
-            col_letter, start_row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(col_letter)
-            
-            # Write data
-            for row_idx, row_data in enumerate(data):
-                for col_idx, value in enumerate(row_data):
-                    cell = ws.cell(row=start_row + row_idx, column=start_col + col_idx)
-                    cell.value = value
+            start_col, start_row = _parse_cell(start_cell)
+            data = _as_rows(data)
+            
+            # Build style objects once and share them across the range
+            bundle = self._build_style_bundle(formatting) if formatting else None
+            
+            max_width = max(len(row) for row in data)
+            entry = self.active_workbooks[workbook_id]
+            streaming = entry["metadata"]["streaming"]
+            
+            # Hold the save lock across tiles so no save sees a partial range
+            async with entry["lock"]:
+                for offset in range(0, len(data), chunk_rows):
+                    tile = data[offset:offset + chunk_rows]
+                    if streaming:
+                        self._append_streaming_rows(
+                            workbook_id, ws, start_row + offset, start_col, tile, bundle
+                        )
+                    else:
+                        self._write_tile(ws, start_row + offset, start_col, tile, max_width, bundle)
                     
-                    # Apply formatting if provided
-                    if formatting:
-                        await self._apply_cell_formatting(cell, formatting)
+                    if offset + chunk_rows < len(data):
+                        await asyncio.sleep(0)
+            
+            self._mark_dirty(workbook_id)
             
-            # Save workbook
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
-            temp_file = self.active_workbooks[workbook_id]["metadata"]["file_path"]
-            wb.save(temp_file)
+            # Mirror the whole block into the open Excel window in one call
+            if self.active_workbooks[workbook_id]["metadata"]["applescript_available"]:
+                try:
+                    await self.applescript.write_range(
+                        f"{workbook_id}.xlsx", sheet_name, start_cell, data
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not update range in Excel app: {e}")
             
             end_row = start_row + len(data) - 1
-            end_col = start_col + max(len(row) for row in data) - 1
+            end_col = start_col + max_width - 1
             end_cell = f"{get_column_letter(end_col)}{end_row}"
             
-            logger.info(f"Wrote data to range {start_cell}:{end_cell}")
+            logger.info("Wrote data to range %s:%s", start_cell, end_cell)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
@@ -287,26 +523,20 @@ class ExcelController:
             Dict with operation status
         """
         try:
+            sheet_name = sys.intern(sheet_name)
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            ws = self.active_workbooks[workbook_id]["worksheets"].get(sheet_name)
+            wb = await self._get_workbook(workbook_id)
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else None
             if not ws:
                 raise ValueError(f"Worksheet '{sheet_name}' not found")
             
             # Ensure formula starts with =
-            if not formula.startswith('='):
-                formula = '=' + formula
-            
-            # Write formula
-            ws[cell] = formula
-            
-            # Save workbook
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
-            temp_file = self.active_workbooks[workbook_id]["metadata"]["file_path"]
-            wb.save(temp_file)
+            formula = formula if formula[:1] == '=' else '=' + formula
+            self._add_formula_raw(workbook_id, ws, cell, formula)
             
-            logger.info(f"Added formula to cell {cell}")
+            logger.info("Added formula to cell %s", cell)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
@@ -330,6 +560,9 @@ class ExcelController:
     ) -> Dict[str, Any]:
         """Create a chart from data.
         
+        The chart is validated now but only built right before the next
+        flush or save, so many charts cost a single serialization.
+        
         Args:
             workbook_id: ID of the workbook
             sheet_name: Name of the worksheet
@@ -342,45 +575,43 @@ class ExcelController:
             Dict with operation status
         """
         try:
+            sheet_name = sys.intern(sheet_name)
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            ws = self.active_workbooks[workbook_id]["worksheets"].get(sheet_name)
+            wb = await self._get_workbook(workbook_id)
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else None
             if not ws:
                 raise ValueError(f"Worksheet '{sheet_name}' not found")
             
+            if self.active_workbooks[workbook_id]["closed"]:
+                raise ValueError(f"Streaming workbook {workbook_id} has already been saved")
+            
             # Parse data range
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(data_range)
-            
-            # Create appropriate chart
-            if chart_type.lower() == "bar":
-                chart = BarChart()
-            elif chart_type.lower() == "line":
-                chart = LineChart()
-            elif chart_type.lower() == "pie":
-                chart = PieChart()
-            else:
+            first, _, last = data_range.partition(":")
+            try:
+                min_col, min_row = _parse_cell(first)
+                max_col, max_row = _parse_cell(last or first)
+            except ValueError:
+                # Anchored, sheet-qualified or whole-column ranges
+                min_col, min_row, max_col, max_row = range_boundaries(data_range)
+            
+            chart_cls = CHART_CLASSES.get(chart_type.lower())
+            if chart_cls is None:
                 raise ValueError(f"Unsupported chart type: {chart_type}")
             
-            # Set chart title
-            if chart_title:
-                chart.title = chart_title
-            
-            # Add data
-            data = Reference(ws, min_col=min_col, min_row=min_row, 
-                           max_col=max_col, max_row=max_row)
-            chart.add_data(data, titles_from_data=True)
+            # Queue the chart; it is built right before the next save
+            self.active_workbooks[workbook_id]["pending_charts"].append({
+                "sheet": sheet_name,
+                "chart_class": chart_cls,
+                "bounds": (min_col, min_row, max_col, max_row),
+                "title": chart_title,
+                "position": position
+            })
             
-            # Add chart to worksheet
-            ws.add_chart(chart, position)
+            self._mark_dirty(workbook_id)
             
-            # Save workbook
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
-            temp_file = self.active_workbooks[workbook_id]["metadata"]["file_path"]
-            wb.save(temp_file)
-            
-            logger.info(f"Created {chart_type} chart at {position}")
+            logger.info("Queued %s chart at %s", chart_type, position)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
@@ -394,6 +625,250 @@ class ExcelController:
             logger.error(f"Failed to create chart: {e}")
             raise
     
+    async def _get_workbook(self, workbook_id: str) -> Workbook:
+        """Return the writable workbook, fully loading a lazy template first.
+        
+        Waits for any save running in a worker thread, so callers must mutate
+        the workbook without awaiting in between.
+        
+        Args:
+            workbook_id: ID of the workbook
+            
+        Returns:
+            Writable openpyxl workbook
+        """
+        entry = self.active_workbooks[workbook_id]
+        async with entry["lock"]:
+            wb = entry["workbook_object"]
+            if wb is None:
+                wb = await asyncio.to_thread(load_workbook, entry["template_path"])
+                entry["template_workbook"].close()
+                entry["template_workbook"] = None
+                entry["workbook_object"] = wb
+                logger.debug("Loaded template %s for writing", entry['template_path'])
+        return wb
+    
+    def _materialize_charts(self, entry: Dict[str, Any]) -> None:
+        """Add every queued chart to its worksheet.
+        
+        Args:
+            entry: Workbook registry entry
+        """
+        pending = entry["pending_charts"]
+        if not pending:
+            return
+        
+        wb = entry["workbook_object"]
+        for spec in pending:
+            ws = wb[spec["sheet"]]
+            chart = spec["chart_class"]()
+            if spec["title"]:
+                chart.title = spec["title"]
+            
+            min_col, min_row, max_col, max_row = spec["bounds"]
+            data = Reference(ws, min_col=min_col, min_row=min_row,
+                             max_col=max_col, max_row=max_row)
+            chart.add_data(data, titles_from_data=True)
+            ws.add_chart(chart, spec["position"])
+        
+        logger.debug("Materialized %s chart(s)", len(pending))
+        pending.clear()
+    
+    def _write_tile(
+        self,
+        ws,
+        start_row: int,
+        start_col: int,
+        rows: List[List[Any]],
+        width: int,
+        bundle: Optional[StyleBundle] = None
+    ) -> None:
+        """Write a block of rows to a regular worksheet.
+        
+        Args:
+            ws: Target worksheet
+            start_row: First row of the block
+            start_col: First column of the block
+            rows: Rows of values
+            width: Widest row of the enclosing range
+            bundle: Optional (font, fill, alignment, border) to apply
+        """
+        font = fill = alignment = border = None
+        if bundle:
+            font, fill, alignment, border = bundle
+        
+        # Let iter_rows create the target cells in one pass
+        rows_iter = ws.iter_rows(
+            min_row=start_row,
+            max_row=start_row + len(rows) - 1,
+            min_col=start_col,
+            max_col=start_col + width - 1
+        )
+        for row_cells, row_data in zip(rows_iter, rows):
+            for cell, value in zip(row_cells, row_data):
+                cell.value = value
+                if font:
+                    cell.font = font
+                if fill:
+                    cell.fill = fill
+                if alignment:
+                    cell.alignment = alignment
+                if border:
+                    cell.border = border
+    
+    def _add_formula_raw(self, workbook_id: str, ws, cell: str, formula: str) -> None:
+        """Write a formula that already carries its leading '='.
+        
+        Args:
+            workbook_id: ID of the workbook
+            ws: Target worksheet
+            cell: Cell reference
+            formula: Excel formula including the '=' prefix
+        """
+        if self.active_workbooks[workbook_id]["metadata"]["streaming"]:
+            col, row = _parse_cell(cell)
+            self._append_streaming_rows(workbook_id, ws, row, col, [[formula]])
+        else:
+            ws[cell] = formula
+        
+        self._mark_dirty(workbook_id)
+    
+    def _append_streaming_rows(
+        self,
+        workbook_id: str,
+        ws,
+        start_row: int,
+        start_col: int,
+        data: List[List[Any]],
+        bundle: Optional[Tuple[Any, Any, Any, Any]] = None
+    ) -> None:
+        """Append rows to a write-only worksheet.
+        
+        Args:
+            workbook_id: ID of the workbook
+            ws: Write-only worksheet
+            start_row: Row of the first appended row
+            start_col: Column of the first value in each row
+            data: 2D list of values
+            bundle: Optional (font, fill, alignment, border) style bundle
+        """
+        entry = self.active_workbooks[workbook_id]
+        if entry["closed"]:
+            raise ValueError(f"Streaming workbook {workbook_id} has already been saved")
+        
+        next_row = entry["next_rows"][ws.title]
+        if start_row < next_row:
+            raise ValueError(
+                f"Streaming worksheet '{ws.title}' is append-only; "
+                f"next writable row is {next_row}"
+            )
+        
+        # Skip over empty rows and leading columns
+        for _ in range(start_row - next_row):
+            ws.append([])
+        padding = [None] * (start_col - 1)
+        
+        if bundle:
+            font, fill, alignment, border = bundle
+            for row_data in data:
+                row_cells = []
+                for value in row_data:
+                    cell = WriteOnlyCell(ws, value=value)
+                    if font:
+                        cell.font = font
+                    if fill:
+                        cell.fill = fill
+                    if alignment:
+                        cell.alignment = alignment
+                    if border:
+                        cell.border = border
+                    row_cells.append(cell)
+                ws.append(padding + row_cells)
+        else:
+            for row_data in data:
+                ws.append(padding + list(row_data))
+        
+        entry["next_rows"][ws.title] = start_row + len(data)
+    
+    async def flush(self, workbook_id: str) -> Dict[str, Any]:
+        """Write pending changes of a workbook to its current file.
+        
+        For a streaming workbook this finalizes the file: openpyxl closes a
+        write-only workbook on its first save, so no rows can follow.
+        
+        Args:
+            workbook_id: ID of the workbook
+            
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if workbook_id not in self.active_workbooks:
+                raise ValueError(f"Workbook {workbook_id} not found")
+            
+            entry = self.active_workbooks[workbook_id]
+            self._cancel_pending_flush(entry)
+            
+            async with entry["lock"]:
+                file_path = entry["metadata"]["file_path"]
+                streaming = entry["metadata"]["streaming"]
+                flushed = not entry["closed"] and (entry["dirty"] or streaming)
+                if flushed:
+                    self._materialize_charts(entry)
+                    await asyncio.to_thread(entry["workbook_object"].save, file_path)
+                    entry["closed"] = streaming
+                    entry["dirty"] = False
+                    logger.debug("Flushed workbook %s to %s", workbook_id, file_path)
+            
+            return {
+                "status": "success",
+                "workbook_id": workbook_id,
+                "file_path": file_path,
+                "flushed": flushed
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to flush workbook: {e}")
+            raise
+    
+    def _mark_dirty(self, workbook_id: str) -> None:
+        """Record a mutation and, with autosave, schedule a debounced flush.
+        
+        Args:
+            workbook_id: ID of the workbook
+        """
+        entry = self.active_workbooks[workbook_id]
+        entry["dirty"] = True
+        
+        # Workbooks open in Excel are only written by explicit flush/save
+        metadata = entry["metadata"]
+        if self.autosave and not metadata["streaming"] and not metadata["applescript_available"]:
+            self._cancel_pending_flush(entry)
+            entry["flush_task"] = asyncio.create_task(self._delayed_flush(workbook_id))
+    
+    def _cancel_pending_flush(self, entry: Dict[str, Any]) -> None:
+        """Cancel a scheduled flush unless it is the task currently running.
+        
+        Args:
+            entry: Workbook registry entry
+        """
+        task = entry.get("flush_task")
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        entry["flush_task"] = None
+    
+    async def _delayed_flush(self, workbook_id: str) -> None:
+        """Flush a workbook once mutations have been quiet for AUTOSAVE_DELAY.
+        
+        Args:
+            workbook_id: ID of the workbook
+        """
+        await asyncio.sleep(AUTOSAVE_DELAY)
+        try:
+            await self.flush(workbook_id)
+        except Exception as e:
+            logger.warning(f"Autosave failed for workbook {workbook_id}: {e}")
+    
     async def save_workbook(
         self,
         workbook_id: str,
@@ -414,7 +889,6 @@ class ExcelController:
             if workbook_id not in self.active_workbooks:
                 raise ValueError(f"Workbook {workbook_id} not found")
             
-            wb = self.active_workbooks[workbook_id]["workbook_object"]
             save_path = Path(file_path)
             
             # Ensure directory exists
@@ -423,17 +897,34 @@ class ExcelController:
             # Save with appropriate extension
             if not save_path.suffix:
                 save_path = save_path.with_suffix(f".{format}")
-            
-            wb.save(str(save_path))
-            
-            # Update metadata
-            self.active_workbooks[workbook_id]["metadata"]["file_path"] = str(save_path)
-            
-            logger.info(f"Saved workbook to {save_path}")
+            save_str = str(save_path)
+            
+            # A full save supersedes any pending flush
+            entry = self.active_workbooks[workbook_id]
+            self._cancel_pending_flush(entry)
+            async with entry["lock"]:
+                wb = entry["workbook_object"]
+                if entry["closed"] or wb is None:
+                    # A write-only workbook is closed by its first save and an
+                    # untouched template is identical to its copy; reuse that
+                    # file, unless it is already the requested one
+                    current = Path(entry["metadata"]["file_path"])
+                    if current.resolve() != save_path.resolve():
+                        await asyncio.to_thread(shutil.copyfile, str(current), save_str)
+                else:
+                    self._materialize_charts(entry)
+                    await asyncio.to_thread(wb.save, save_str)
+                    entry["closed"] = entry["metadata"]["streaming"]
+                entry["dirty"] = False
+                
+                # Update metadata
+                entry["metadata"]["file_path"] = save_str
+            
+            logger.info("Saved workbook to %s", save_str)
             return {
                 "status": "success",
                 "workbook_id": workbook_id,
-                "file_path": str(save_path),
+                "file_path": save_str,
                 "format": format
             }
             
@@ -441,7 +932,70 @@ class ExcelController:
             logger.error(f"Failed to save workbook: {e}")
             raise
     
-    async def _apply_cell_formatting(
+    async def close_workbook(self, workbook_id: str) -> Dict[str, Any]:
+        """Close a workbook and release its memory and temp file.
+        
+        Workbooks saved elsewhere get pending changes flushed to their file
+        first; the temp file is always deleted.
+        
+        Args:
+            workbook_id: ID of the workbook
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if workbook_id not in self.active_workbooks:
+                raise ValueError(f"Workbook {workbook_id} not found")
+            
+            entry = self.active_workbooks[workbook_id]
+            self._cancel_pending_flush(entry)
+            
+            async with entry["lock"]:
+                file_path = Path(entry["metadata"]["file_path"])
+                temp_file = entry["temp_file"]
+                is_temp = file_path == temp_file
+                wb = entry["workbook_object"]
+                if wb is not None and entry["dirty"] and not entry["closed"] and not is_temp:
+                    self._materialize_charts(entry)
+                    await asyncio.to_thread(wb.save, str(file_path))
+                if entry["template_workbook"] is not None:
+                    entry["template_workbook"].close()
+                temp_file.unlink(missing_ok=True)
+                del self.active_workbooks[workbook_id]
+            
+            logger.info("Closed workbook %s", workbook_id)
+            return {
+                "status": "success",
+                "workbook_id": workbook_id,
+                "file_path": None if is_temp else str(file_path)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to close workbook: {e}")
+            raise
+    
+    def _build_style_bundle(self, formatting: Dict[str, Any]) -> StyleBundle:
+        """Return the style objects for a formatting dict.
+        
+        The objects are immutable once assigned, so one bundle is shared by
+        every cell in a range and, through the cache, by every call that
+        repeats the same formatting.
+        
+        Args:
+            formatting: Formatting options
+            
+        Returns:
+            Tuple of (font, fill, alignment, border)
+        """
+        try:
+            key = _style_key(formatting)
+        except (TypeError, ValueError):
+            # Values JSON cannot encode bypass the cache
+            return _make_style_bundle(formatting)
+        return _cached_style_bundle(key)
+    
+    def _apply_cell_formatting(
         self,
         cell,
         formatting: Dict[str, Any]
@@ -452,48 +1006,15 @@ class ExcelController:
             cell: Cell object
             formatting: Formatting options
         """
-        try:
-            # Font formatting
-            font_kwargs = {}
-            if "bold" in formatting:
-                font_kwargs["bold"] = formatting["bold"]
-            if "italic" in formatting:
-                font_kwargs["italic"] = formatting["italic"]
-            if "font_size" in formatting:
-                font_kwargs["size"] = formatting["font_size"]
-            if "font_color" in formatting:
-                font_kwargs["color"] = formatting["font_color"]
-            if "font_name" in formatting:
-                font_kwargs["name"] = formatting["font_name"]
-            
-            if font_kwargs:
-                cell.font = Font(**font_kwargs)
-            
-            # Fill (background color)
-            if "bg_color" in formatting:
-                cell.fill = PatternFill(start_color=formatting["bg_color"],
-                                      end_color=formatting["bg_color"],
-                                      fill_type="solid")
-            
-            # Alignment
-            align_kwargs = {}
-            if "horizontal" in formatting:
-                align_kwargs["horizontal"] = formatting["horizontal"]
-            if "vertical" in formatting:
-                align_kwargs["vertical"] = formatting["vertical"]
-            if "wrap_text" in formatting:
-                align_kwargs["wrap_text"] = formatting["wrap_text"]
-            
-            if align_kwargs:
-                cell.alignment = Alignment(**align_kwargs)
-            
-            # Border
-            if "border" in formatting and formatting["border"]:
-                side = Side(style='thin')
-                cell.border = Border(left=side, right=side, top=side, bottom=side)
-            
-        except Exception as e:
-            logger.warning(f"Failed to apply some cell formatting: {e}")
+        font, fill, alignment, border = self._build_style_bundle(formatting)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        if border:
+            cell.border = border
     
     async def get_workbook_info(self, workbook_id: str) -> Dict[str, Any]:
         """Get information about a workbook.
@@ -529,5 +1050,8 @@ class ExcelController:
         if workbook_id not in self.active_workbooks:
             raise ValueError(f"Workbook {workbook_id} not found")
         
-        wb = self.active_workbooks[workbook_id]["workbook_object"]
-        return [ws.title for ws in wb.worksheets]
\ No newline at end of file
+        entry = self.active_workbooks[workbook_id]
+        if entry["workbook_object"] is None:
+            # Untouched template: answer from the read-only view
+            return list(entry["template_workbook"].sheetnames)
+        return [ws.title for ws in entry["workbook_object"].worksheets]
\ No newline at end of file
@@ -4,10 +4,22 @@ Handles all PowerPoint automation operations on macOS.
 """
 
 import asyncio
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import shutil
+import threading
+import time
 import uuid
 import tempfile
+import urllib.error
+import urllib.request
+from urllib.parse import urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 import logging
 
 from pptx import Presentation
@@ -15,30 +27,191 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image, ImagePart
+
+try:
+    import aiohttp
+except ImportError:  # URL images fall back to urllib in the I/O pool
+    aiohttp = None
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from integrations.applescript_bridge import AppleScriptBridge
+from integrations.applescript_bridge import get_bridge
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Seconds of inactivity before a dirty presentation is written to its temp file
+AUTOSAVE_DELAY = 0.5
+
+# Parsed presentations kept in memory; older ones are flushed and dropped.
+# Concurrent loads can briefly exceed it until the next lookup trims the cache.
+PRESENTATION_CACHE_SIZE = 4
+
+# Total size of image file contents kept in memory across presentations
+IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Largest image accepted from a URL, and the per-operation timeout in seconds
+MAX_IMAGE_DOWNLOAD_BYTES = 20 * 1024 * 1024
+IMAGE_DOWNLOAD_TIMEOUT = 30
+
+# Chunk size for reading URL image bodies
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Layout names to indices in the default slide master
+_LAYOUT_MAP = {
+    "Title Slide": 0,
+    "Title and Content": 1,
+    "Section Header": 2,
+    "Two Content": 3,
+    "Comparison": 4,
+    "Title Only": 5,
+    "Blank": 6,
+    "Content with Caption": 7,
+    "Picture with Caption": 8
+}
+
+_ALIGN_MAP = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY
+}
+
+# left, top, width, height of text boxes added when no placeholder fits
+_DEFAULT_TEXTBOX = (Inches(1), Inches(1.5), Inches(8), Inches(5))
+
+def _check_image_response(url: str, content_type: str, content_length: Optional[int]) -> None:
+    """Reject a URL image response that is not an image or is too large.
+    
+    Args:
+        url: URL being fetched, for error messages
+        content_type: Content-Type header, or empty string
+        content_length: Content-Length header value, or None if not sent
+    
+    Raises:
+        ValueError: If the response cannot be used as an image
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and not media_type.startswith("image/") and media_type != "application/octet-stream":
+        raise ValueError(f"URL {url} is not an image (Content-Type: {media_type})")
+    if content_length is not None and content_length > MAX_IMAGE_DOWNLOAD_BYTES:
+        raise ValueError(f"Image at {url} exceeds {MAX_IMAGE_DOWNLOAD_BYTES} bytes")
+
+@functools.lru_cache(maxsize=64)
+def _inches(value: float) -> int:
+    """Convert inches to EMU, reusing results for recurring sizes.
+    
+    Args:
+        value: Length in inches
+    
+    Returns:
+        Length in EMU
+    """
+    return Inches(value)
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb(color: str) -> RGBColor:
+    """Convert a '#RRGGBB' string to an RGBColor.
+    
+    Args:
+        color: Hex color string, with or without the leading '#'
+    
+    Returns:
+        Shared RGBColor for the color
+    """
+    return RGBColor.from_string(color.lstrip("#"))
+
+# slots=True needs Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class PresentationMeta:
+    """Metadata of an open presentation, returned to clients via asdict()."""
+    presentation_id: str
+    title: str
+    theme: str
+    file_path: str
+    slide_count: int
+    applescript_available: bool
+    created_at: float
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class SlideMeta:
+    """Metadata of a slide, returned to clients via asdict()."""
+    slide_id: str
+    presentation_id: str
+    layout: str
+    index: int
+    created_at: float
+
+class TextSpec(TypedDict, total=False):
+    """One text write for add_texts_bulk / SlideSpec.texts."""
+    text: str
+    placeholder: str
+    formatting: Dict[str, Any]
+
+class ImageSpec(TypedDict, total=False):
+    """One image insert for SlideSpec.images (position/size in inches)."""
+    image_source: str
+    position: Dict[str, float]
+    size: Dict[str, float]
+
+class SlideSpec(TypedDict, total=False):
+    """One slide for add_slides_bulk."""
+    layout: str
+    texts: List[TextSpec]
+    images: List[ImageSpec]
+    notes: str
+
 class PowerPointController:
-    """Controller for PowerPoint operations using both AppleScript and python-pptx."""
+    """Controller for PowerPoint operations using both AppleScript and python-pptx.
+    
+    Mutations only update the in-memory presentation and mark it dirty.
+    The temp file is rewritten only when something needs it on disk: an
+    explicit ``flush``, eviction from memory, or a debounced flush when
+    ``autosave`` is enabled. ``save_presentation`` writes the final file.
+    Loads, saves and picture inserts run in a small dedicated thread pool.
+    Every edit and save holds a per-presentation lock, so work on different
+    presentations runs concurrently.
+    
+    Only the ``PRESENTATION_CACHE_SIZE`` most recently used presentations
+    stay parsed in memory. Older ones are flushed and dropped, and slides are
+    tracked by index so they can be re-read from the file on next use.
+    """
     
-    def __init__(self):
-        self.applescript = AppleScriptBridge()
+    def __init__(self, autosave: bool = False, materialize: bool = True):
+        self.applescript = get_bridge()
         self.active_presentations: Dict[str, Dict[str, Any]] = {}
-        # Use system temp directory with a subdirectory
-        self.temp_dir = Path(tempfile.gettempdir()) / "office365_mcp"
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # slide_id -> presentation_id, so slide lookups skip scanning every deck
+        self._slide_index: Dict[str, str] = {}
+        self._prs_lru: "OrderedDict[str, Any]" = OrderedDict()
+        # path -> (mtime_ns, size, bytes); filled from pool threads, hence the lock
+        self._image_bytes_cache: "OrderedDict[Path, Tuple[int, int, bytes]]" = OrderedDict()
+        self._image_cache_total = 0
+        self._image_cache_lock = threading.Lock()
+        self.autosave = autosave
+        # Default for create_presentation: write the temp file and open it in
+        # PowerPoint right away (False for headless servers)
+        self.materialize = materialize
+        # Dedicated pool so large pptx loads and saves cannot starve other
+        # users of the default executor
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pptx-io")
+        # Private temp directory, removed when the controller is collected or
+        # the process exits
+        self._tempdir = tempfile.TemporaryDirectory(prefix="office365_mcp_")
+        self.temp_dir = Path(self._tempdir.name)
+        # url -> (etag, downloaded file), revalidated with If-None-Match
+        self._url_cache: Dict[str, Tuple[str, Path]] = {}
+        self._http = None
     
     async def create_presentation(
         self,
         title: str,
         theme: str = "default",
-        template_path: Optional[str] = None
+        template_path: Optional[str] = None,
+        materialize: Optional[bool] = None,
+        subtitle: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a new PowerPoint presentation.
         
@@ -46,6 +219,11 @@ class PowerPointController:
             title: Presentation title
             theme: Theme name or path
             template_path: Optional template file path
+            materialize: Write the temp file and open it in PowerPoint now;
+                when False nothing touches disk until the first flush or save.
+                Defaults to the controller's ``materialize`` setting.
+            subtitle: Optional subtitle for the title slide, written before
+                the presentation is first saved and opened
             
         Returns:
             Dict with presentation metadata
@@ -55,14 +233,14 @@ class PowerPointController:
             
             # Create presentation using python-pptx
             if template_path and Path(template_path).exists():
-                prs = Presentation(template_path)
+                prs = await self._run_io(Presentation, template_path)
             else:
                 prs = Presentation()
             
             # Set title if first slide exists
             if prs.slides:
                 title_slide = prs.slides[0]
-                if title_slide.shapes.title:
+                if title_slide.shapes.title and title_slide.shapes.title.text != title:
                     title_slide.shapes.title.text = title
             else:
                 # Add title slide
@@ -70,37 +248,57 @@ class PowerPointController:
                 slide = prs.slides.add_slide(title_slide_layout)
                 slide.shapes.title.text = title
             
-            # Save temporary file
-            temp_file = self.temp_dir / f"{presentation_id}.pptx"
-            prs.save(str(temp_file))
+            if subtitle is not None:
+                subtitle_shape = next(
+                    (shape for shape in prs.slides[0].placeholders if shape.placeholder_format.idx == 1),
+                    None
+                )
+                if subtitle_shape is None:
+                    raise ValueError("Title slide has no subtitle placeholder")
+                subtitle_shape.text_frame.text = subtitle
             
-            # Try to open in PowerPoint via AppleScript
-            applescript_success = False
-            try:
-                await self.applescript.open_powerpoint_file(str(temp_file))
-                applescript_success = True
-            except Exception as e:
-                logger.warning(f"Could not open in PowerPoint app: {e}")
+            if materialize is None:
+                materialize = self.materialize
+            
+            temp_file = self.temp_dir / f"{presentation_id}.pptx"
+            open_task = None
+            if materialize:
+                # Save temporary file
+                await self._run_io(prs.save, str(temp_file))
+                
+                # Open in PowerPoint in the background; the result is picked up
+                # by get_presentation_info / list_presentations
+                open_task = asyncio.create_task(self.applescript.open_powerpoint_file(str(temp_file)))
             
             # Store presentation metadata
-            presentation_data = {
-                "presentation_id": presentation_id,
-                "title": title,
-                "theme": theme,
-                "file_path": str(temp_file),
-                "slide_count": len(prs.slides),
-                "applescript_available": applescript_success,
-                "created_at": asyncio.get_event_loop().time()
-            }
+            presentation_data = PresentationMeta(
+                presentation_id=presentation_id,
+                title=title,
+                theme=theme,
+                file_path=str(temp_file),
+                slide_count=len(prs.slides),
+                applescript_available=False,
+                created_at=time.monotonic()
+            )
             
+            await self._evict_presentations(incoming=1)
             self.active_presentations[presentation_id] = {
                 "metadata": presentation_data,
-                "pptx_object": prs,
-                "slides": {}
+                # Working file; deleted on close even after a save elsewhere
+                "temp_file": temp_file,
+                "slides": {},
+                "media_cache": {},
+                # Unmaterialized presentations only exist in memory so far
+                "dirty": not materialize,
+                "flush_task": None,
+                "open_task": open_task,
+                "lock": asyncio.Lock()
             }
             
-            logger.info(f"Created presentation: {title} ({presentation_id})")
-            return presentation_data
+            self._prs_lru[presentation_id] = prs
+            
+            logger.info("Created presentation: %s (%s)", title, presentation_id)
+            return dataclasses.asdict(presentation_data)
             
         except Exception as e:
             logger.error(f"Failed to create presentation: {e}")
@@ -126,59 +324,12 @@ class PowerPointController:
             if presentation_id not in self.active_presentations:
                 raise ValueError(f"Presentation {presentation_id} not found")
             
-            prs = self.active_presentations[presentation_id]["pptx_object"]
-            slide_id = str(uuid.uuid4())
-            
-            # Map layout names to indices
-            layout_map = {
-                "Title Slide": 0,
-                "Title and Content": 1,
-                "Section Header": 2,
-                "Two Content": 3,
-                "Comparison": 4,
-                "Title Only": 5,
-                "Blank": 6,
-                "Content with Caption": 7,
-                "Picture with Caption": 8
-            }
-            
-            layout_index = layout_map.get(layout, 1)  # Default to Title and Content
-            slide_layout = prs.slide_layouts[layout_index]
-            
-            # Add slide
-            if position is not None and 0 <= position <= len(prs.slides):
-                # Insert at specific position (requires manual reordering)
-                slide = prs.slides.add_slide(slide_layout)
-                # Note: python-pptx doesn't support direct insertion at position
-                # This would require AppleScript for precise positioning
-            else:
-                slide = prs.slides.add_slide(slide_layout)
-            
-            slide_index = len(prs.slides) - 1
-            
-            # Store slide metadata
-            slide_data = {
-                "slide_id": slide_id,
-                "presentation_id": presentation_id,
-                "layout": layout,
-                "index": slide_index,
-                "created_at": asyncio.get_event_loop().time()
-            }
-            
-            self.active_presentations[presentation_id]["slides"][slide_id] = {
-                "metadata": slide_data,
-                "slide_object": slide
-            }
-            
-            # Update presentation metadata
-            self.active_presentations[presentation_id]["metadata"]["slide_count"] = len(prs.slides)
-            
-            # Save updated presentation
-            temp_file = self.active_presentations[presentation_id]["metadata"]["file_path"]
-            prs.save(temp_file)
+            async with self._editing(presentation_id) as prs:
+                slide_data = self._append_slide(presentation_id, prs, layout, position)
+                self._mark_dirty(presentation_id)
             
-            logger.info(f"Added slide to presentation {presentation_id}")
-            return slide_data
+            logger.info("Added slide to presentation %s", presentation_id)
+            return dataclasses.asdict(slide_data)
             
         except Exception as e:
             logger.error(f"Failed to add slide: {e}")
@@ -203,63 +354,15 @@ class PowerPointController:
             Dict with operation status
         """
         try:
-            # Find slide
-            slide_obj = None
-            presentation_id = None
-            
-            for pres_id, pres_data in self.active_presentations.items():
-                if slide_id in pres_data["slides"]:
-                    slide_obj = pres_data["slides"][slide_id]["slide_object"]
-                    presentation_id = pres_id
-                    break
-            
-            if not slide_obj:
-                raise ValueError(f"Slide {slide_id} not found")
-            
-            # Add text based on placeholder type
-            if placeholder == "title" and slide_obj.shapes.title:
-                text_frame = slide_obj.shapes.title.text_frame
-                text_frame.text = text
-            elif placeholder == "content":
-                # Find content placeholder or add text box
-                content_placeholder = None
-                for shape in slide_obj.shapes:
-                    if hasattr(shape, "text_frame") and shape.text_frame:
-                        content_placeholder = shape
-                        break
-                
-                if content_placeholder:
-                    text_frame = content_placeholder.text_frame
-                    text_frame.text = text
-                else:
-                    # Add text box
-                    left = Inches(1)
-                    top = Inches(1.5)
-                    width = Inches(8)
-                    height = Inches(5)
-                    textbox = slide_obj.shapes.add_textbox(left, top, width, height)
-                    text_frame = textbox.text_frame
-                    text_frame.text = text
-            else:
-                # Add as text box
-                left = Inches(1)
-                top = Inches(1.5)
-                width = Inches(8)
-                height = Inches(5)
-                textbox = slide_obj.shapes.add_textbox(left, top, width, height)
-                text_frame = textbox.text_frame
-                text_frame.text = text
+            presentation_id, slide_index = self._slide_position(slide_id)
             
-            # Apply formatting if provided
-            if formatting and text_frame:
-                await self._apply_text_formatting(text_frame, formatting)
+            async with self._editing(presentation_id) as prs:
+                # Idempotent retries leave the presentation clean
+                slide_rec = self.active_presentations[presentation_id]["slides"][slide_id]
+                if await self._write_text(slide_rec, prs.slides[slide_index], text, placeholder, formatting):
+                    self._mark_dirty(presentation_id)
             
-            # Save presentation
-            prs = self.active_presentations[presentation_id]["pptx_object"]
-            temp_file = self.active_presentations[presentation_id]["metadata"]["file_path"]
-            prs.save(temp_file)
-            
-            logger.info(f"Added text to slide {slide_id}")
+            logger.info("Added text to slide %s", slide_id)
             return {
                 "status": "success",
                 "slide_id": slide_id,
@@ -290,43 +393,21 @@ class PowerPointController:
             Dict with operation status
         """
         try:
-            # Find slide
-            slide_obj = None
-            presentation_id = None
-            
-            for pres_id, pres_data in self.active_presentations.items():
-                if slide_id in pres_data["slides"]:
-                    slide_obj = pres_data["slides"][slide_id]["slide_object"]
-                    presentation_id = pres_id
-                    break
-            
-            if not slide_obj:
-                raise ValueError(f"Slide {slide_id} not found")
-            
-            # Handle image source
-            if image_source.startswith(("http://", "https://")):
-                # Download image (simplified - would need proper download logic)
-                raise NotImplementedError("URL image download not yet implemented")
-            else:
-                # Local file
-                image_path = Path(image_source)
-                if not image_path.exists():
-                    raise FileNotFoundError(f"Image file not found: {image_source}")
-            
-            # Add image to slide
-            left = Inches(position.get("x", 1))
-            top = Inches(position.get("y", 1))
-            width = Inches(size.get("width", 4))
-            height = Inches(size.get("height", 3))
+            presentation_id, slide_index = self._slide_position(slide_id)
             
-            slide_obj.shapes.add_picture(str(image_path), left, top, width, height)
+            image_path, left, top, width, height = await self._image_args(image_source, position, size)
             
-            # Save presentation
-            prs = self.active_presentations[presentation_id]["pptx_object"]
-            temp_file = self.active_presentations[presentation_id]["metadata"]["file_path"]
-            prs.save(temp_file)
+            # Reading and hashing the image runs in the pool under the lock,
+            # so no save or other mutation overlaps it
+            entry = self.active_presentations[presentation_id]
+            async with self._editing(presentation_id) as prs:
+                await self._run_io(
+                    self._insert_picture, entry, prs.slides[slide_index],
+                    image_path, left, top, width, height
+                )
+                self._mark_dirty(presentation_id)
             
-            logger.info(f"Added image to slide {slide_id}")
+            logger.info("Added image to slide %s", slide_id)
             return {
                 "status": "success",
                 "slide_id": slide_id,
@@ -354,30 +435,17 @@ class PowerPointController:
             Dict with operation status
         """
         try:
-            # Find slide
-            slide_obj = None
-            presentation_id = None
-            
-            for pres_id, pres_data in self.active_presentations.items():
-                if slide_id in pres_data["slides"]:
-                    slide_obj = pres_data["slides"][slide_id]["slide_object"]
-                    presentation_id = pres_id
-                    break
-            
-            if not slide_obj:
-                raise ValueError(f"Slide {slide_id} not found")
-            
-            # Add notes
-            notes_slide = slide_obj.notes_slide
-            text_frame = notes_slide.notes_text_frame
-            text_frame.text = notes
-            
-            # Save presentation
-            prs = self.active_presentations[presentation_id]["pptx_object"]
-            temp_file = self.active_presentations[presentation_id]["metadata"]["file_path"]
-            prs.save(temp_file)
-            
-            logger.info(f"Added speaker notes to slide {slide_id}")
+            presentation_id, slide_index = self._slide_position(slide_id)
+            
+            async with self._editing(presentation_id) as prs:
+                # Add notes
+                notes_slide = prs.slides[slide_index].notes_slide
+                text_frame = notes_slide.notes_text_frame
+                if text_frame.text != notes:
+                    text_frame.text = notes
+                    self._mark_dirty(presentation_id)
+            
+            logger.info("Added speaker notes to slide %s", slide_id)
             return {
                 "status": "success",
                 "slide_id": slide_id,
@@ -388,6 +456,113 @@ class PowerPointController:
             logger.error(f"Failed to add speaker notes: {e}")
             raise
     
+    async def add_slides_bulk(
+        self,
+        presentation_id: str,
+        slides: List[SlideSpec]
+    ) -> List[Dict[str, Any]]:
+        """Add several slides with their text, images and notes in one batch.
+        
+        All edits are applied under a single lock hold, and the presentation
+        is marked dirty once, so the batch costs one serialization.
+        
+        Args:
+            presentation_id: ID of the presentation
+            slides: Slide specifications
+        
+        Returns:
+            List of slide metadata dicts, in input order
+        """
+        try:
+            if presentation_id not in self.active_presentations:
+                raise ValueError(f"Presentation {presentation_id} not found")
+            
+            # Validate every image before touching the presentation
+            images = [
+                [await self._image_args(item["image_source"], item.get("position", {}), item.get("size", {}))
+                 for item in spec.get("images", ())]
+                for spec in slides
+            ]
+            
+            entry = self.active_presentations[presentation_id]
+            results = []
+            async with self._editing(presentation_id) as prs:
+                try:
+                    for spec, image_args in zip(slides, images):
+                        slide_data = self._append_slide(
+                            presentation_id, prs, spec.get("layout", "Title and Content")
+                        )
+                        slide_obj = prs.slides[slide_data.index]
+                        
+                        for item in spec.get("texts", ()):
+                            await self._write_text(
+                                entry["slides"][slide_data.slide_id], slide_obj, item["text"],
+                                item.get("placeholder", "content"), item.get("formatting")
+                            )
+                        for args in image_args:
+                            await self._run_io(self._insert_picture, entry, slide_obj, *args)
+                        if spec.get("notes"):
+                            notes_frame = slide_obj.notes_slide.notes_text_frame
+                            if notes_frame.text != spec["notes"]:
+                                notes_frame.text = spec["notes"]
+                        
+                        results.append(dataclasses.asdict(slide_data))
+                finally:
+                    self._mark_dirty(presentation_id)
+            
+            logger.info("Added %s slides to presentation %s", len(results), presentation_id)
+            return results
+        
+        except Exception as e:
+            logger.error(f"Failed to add slides in bulk: {e}")
+            raise
+    
+    async def add_texts_bulk(
+        self,
+        slide_id: str,
+        items: List[TextSpec]
+    ) -> Dict[str, Any]:
+        """Write several text items to one slide in a single batch.
+        
+        Args:
+            slide_id: ID of the slide
+            items: Text specifications
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            presentation_id, slide_index = self._slide_position(slide_id)
+            
+            changed = False
+            async with self._editing(presentation_id) as prs:
+                slide_rec = self.active_presentations[presentation_id]["slides"][slide_id]
+                slide_obj = prs.slides[slide_index]
+                try:
+                    for item in items:
+                        changed |= await self._write_text(
+                            slide_rec, slide_obj, item["text"],
+                            item.get("placeholder", "content"), item.get("formatting")
+                        )
+                except Exception:
+                    # A failed item may have been partially applied
+                    changed = True
+                    raise
+                finally:
+                    if changed:
+                        self._mark_dirty(presentation_id)
+            
+            logger.info("Added %s text items to slide %s", len(items), slide_id)
+            return {
+                "status": "success",
+                "slide_id": slide_id,
+                "items_written": len(items)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to add texts in bulk: {e}")
+            raise
+    
     async def save_presentation(
         self,
         presentation_id: str,
@@ -408,39 +583,620 @@ class PowerPointController:
             if presentation_id not in self.active_presentations:
                 raise ValueError(f"Presentation {presentation_id} not found")
             
-            prs = self.active_presentations[presentation_id]["pptx_object"]
+            entry = self.active_presentations[presentation_id]
             save_path = Path(file_path)
             
             # Ensure directory exists
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            if format.lower() == "pptx":
-                prs.save(str(save_path))
-            elif format.lower() == "pdf":
-                # PDF export would require AppleScript or additional libraries
-                # For now, save as PPTX and note the limitation
-                pptx_path = save_path.with_suffix(".pptx")
-                prs.save(str(pptx_path))
-                logger.warning(f"PDF export not implemented, saved as PPTX: {pptx_path}")
-                save_path = pptx_path
-            else:
+            handler = self._FORMAT_HANDLERS.get(format.lower())
+            if handler is None:
                 raise ValueError(f"Unsupported format: {format}")
             
-            # Update metadata
-            self.active_presentations[presentation_id]["metadata"]["file_path"] = str(save_path)
+            # A full save supersedes any pending flush
+            self._cancel_pending_flush(entry)
+            async with entry["lock"]:
+                save_path, fmt = await handler(self, presentation_id, save_path)
             
-            logger.info(f"Saved presentation to {save_path}")
+            logger.info("Saved presentation to %s", save_path)
             return {
                 "status": "success",
                 "presentation_id": presentation_id,
                 "file_path": str(save_path),
-                "format": format
+                "format": fmt
             }
             
         except Exception as e:
             logger.error(f"Failed to save presentation: {e}")
             raise
     
+    async def _save_pptx(self, presentation_id: str, save_path: Path) -> Tuple[Path, str]:
+        """Write a presentation as .pptx and make that its current file.
+        
+        The caller must hold the presentation's lock.
+        
+        Args:
+            presentation_id: ID of the presentation
+            save_path: Destination path
+        
+        Returns:
+            Tuple of (written path, format)
+        """
+        entry = self.active_presentations[presentation_id]
+        prs = self._prs_lru.get(presentation_id)
+        if prs is not None:
+            await self._run_io(prs.save, str(save_path))
+        elif Path(entry["metadata"].file_path) != save_path:
+            # Evicted presentations are already current on disk
+            await self._run_io(shutil.copyfile, entry["metadata"].file_path, str(save_path))
+        entry["dirty"] = False
+        
+        # Update metadata
+        entry["metadata"].file_path = str(save_path)
+        return save_path, "pptx"
+    
+    async def _save_pdf(self, presentation_id: str, save_path: Path) -> Tuple[Path, str]:
+        """Export a presentation to PDF through PowerPoint.
+        
+        PowerPoint exports from the working file, which stays the
+        presentation's file_path. Falls back to a .pptx next to the requested
+        path when the export is unavailable. The caller must hold the lock.
+        
+        Args:
+            presentation_id: ID of the presentation
+            save_path: Destination path
+        
+        Returns:
+            Tuple of (written path, format)
+        """
+        entry = self.active_presentations[presentation_id]
+        source = entry["metadata"].file_path
+        prs = self._prs_lru.get(presentation_id)
+        if prs is not None and entry["dirty"]:
+            await self._run_io(prs.save, source)
+            entry["dirty"] = False
+        
+        if await self.applescript.export_pdf(source, str(save_path)):
+            return save_path, "pdf"
+        
+        save_path = save_path.with_suffix(".pptx")
+        logger.warning(f"PDF export unavailable, saving as PPTX: {save_path}")
+        return await self._save_pptx(presentation_id, save_path)
+    
+    # Lowercased format name -> handler(self, presentation_id, save_path)
+    _FORMAT_HANDLERS = {
+        "pptx": _save_pptx,
+        "pdf": _save_pdf
+    }
+    
+    async def close_presentation(self, presentation_id: str) -> Dict[str, Any]:
+        """Close a presentation and release its memory and temp file.
+        
+        Presentations saved elsewhere get pending changes flushed to their
+        file first; the temp file is always deleted.
+        
+        Args:
+            presentation_id: ID of the presentation
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if presentation_id not in self.active_presentations:
+                raise ValueError(f"Presentation {presentation_id} not found")
+            
+            entry = self.active_presentations[presentation_id]
+            self._cancel_pending_flush(entry)
+            open_task = entry.get("open_task")
+            if open_task is not None and not open_task.done():
+                open_task.cancel()
+            
+            async with entry["lock"]:
+                file_path = Path(entry["metadata"].file_path)
+                temp_file = entry["temp_file"]
+                is_temp = file_path == temp_file
+                prs = self._prs_lru.pop(presentation_id, None)
+                if prs is not None and entry["dirty"] and not is_temp:
+                    await self._run_io(prs.save, str(file_path))
+                temp_file.unlink(missing_ok=True)
+                
+                for slide_id in entry["slides"]:
+                    self._slide_index.pop(slide_id, None)
+                del self.active_presentations[presentation_id]
+            
+            logger.info("Closed presentation %s", presentation_id)
+            return {
+                "status": "success",
+                "presentation_id": presentation_id,
+                "file_path": None if is_temp else str(file_path)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to close presentation: {e}")
+            raise
+    
+    async def flush(self, presentation_id: str) -> Dict[str, Any]:
+        """Write pending changes of a presentation to its current file.
+        
+        Args:
+            presentation_id: ID of the presentation
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if presentation_id not in self.active_presentations:
+                raise ValueError(f"Presentation {presentation_id} not found")
+            
+            entry = self.active_presentations[presentation_id]
+            self._cancel_pending_flush(entry)
+            
+            async with entry["lock"]:
+                file_path = entry["metadata"].file_path
+                prs = self._prs_lru.get(presentation_id)
+                flushed = entry["dirty"] and prs is not None
+                if flushed:
+                    await self._run_io(prs.save, file_path)
+                    entry["dirty"] = False
+                    logger.debug("Flushed presentation %s to %s", presentation_id, file_path)
+            
+            return {
+                "status": "success",
+                "presentation_id": presentation_id,
+                "file_path": file_path,
+                "flushed": flushed
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to flush presentation: {e}")
+            raise
+    
+    def _append_slide(
+        self,
+        presentation_id: str,
+        prs,
+        layout: str,
+        position: Optional[int] = None
+    ) -> SlideMeta:
+        """Append a slide and register it, without marking the presentation dirty.
+        
+        Args:
+            presentation_id: ID of the presentation
+            prs: Loaded presentation
+            layout: Slide layout name
+            position: Position to insert slide
+            
+        Returns:
+            Metadata of the new slide
+        """
+        entry = self.active_presentations[presentation_id]
+        slide_id = str(uuid.uuid4())
+        
+        layout_index = _LAYOUT_MAP.get(layout, 1)  # Default to Title and Content
+        slide_layout = prs.slide_layouts[layout_index]
+        
+        # Add slide. python-pptx can only append, so position is not applied;
+        # precise positioning would require AppleScript
+        prs.slides.add_slide(slide_layout)
+        
+        slide_index = len(prs.slides) - 1
+        
+        # Store slide metadata
+        slide_data = SlideMeta(
+            slide_id=slide_id,
+            presentation_id=presentation_id,
+            layout=layout,
+            index=slide_index,
+            created_at=time.monotonic()
+        )
+        
+        entry["slides"][slide_id] = {
+            "metadata": slide_data,
+            # First text-bearing shape, resolved on the first "content" write
+            "content_shape": None
+        }
+        self._slide_index[slide_id] = presentation_id
+        
+        # Update presentation metadata
+        entry["metadata"].slide_count = len(prs.slides)
+        
+        return slide_data
+    
+    async def _write_text(
+        self,
+        slide_rec: Dict[str, Any],
+        slide_obj,
+        text: str,
+        placeholder: str = "content",
+        formatting: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Write text into a slide placeholder or a new text box.
+        
+        Args:
+            slide_rec: Registry record of the target slide
+            slide_obj: Target slide
+            text: Text content
+            placeholder: Placeholder type (title, content, etc.)
+            formatting: Text formatting options
+        
+        Returns:
+            False if the slide was left unchanged
+        """
+        changed = True
+        
+        # Add text based on placeholder type
+        if placeholder == "title" and slide_obj.shapes.title:
+            text_frame = slide_obj.shapes.title.text_frame
+            changed = text_frame.text != text
+            if changed:
+                text_frame.text = text
+        elif placeholder == "content":
+            # Find content placeholder or add text box; shapes are only ever
+            # appended, so the first text-bearing shape stays the same
+            content_placeholder = slide_rec["content_shape"]
+            if content_placeholder is None:
+                for shape in slide_obj.shapes:
+                    if hasattr(shape, "text_frame") and shape.text_frame:
+                        content_placeholder = shape
+                        break
+            
+            if content_placeholder:
+                text_frame = content_placeholder.text_frame
+                changed = text_frame.text != text
+                if changed:
+                    text_frame.text = text
+            else:
+                # Add text box
+                textbox = slide_obj.shapes.add_textbox(*_DEFAULT_TEXTBOX)
+                content_placeholder = textbox
+                text_frame = textbox.text_frame
+                text_frame.text = text
+            slide_rec["content_shape"] = content_placeholder
+        else:
+            # Add as text box
+            textbox = slide_obj.shapes.add_textbox(*_DEFAULT_TEXTBOX)
+            text_frame = textbox.text_frame
+            text_frame.text = text
+        
+        # Apply formatting if provided
+        if formatting and text_frame:
+            await self._apply_text_formatting(text_frame, formatting)
+            changed = True
+        
+        return changed
+    
+    async def _image_args(
+        self,
+        image_source: str,
+        position: Dict[str, float],
+        size: Dict[str, float]
+    ) -> Tuple[Path, int, int, int, int]:
+        """Resolve an image source to a local file and convert its geometry to EMU.
+        
+        Args:
+            image_source: Path to image file or URL
+            position: Position dict with x, y coordinates
+            size: Size dict with width, height
+            
+        Returns:
+            Tuple of (image path, left, top, width, height)
+        """
+        # Handle image source
+        if image_source.startswith(("http://", "https://")):
+            image_path = await self._fetch_image(image_source)
+        else:
+            # Local file
+            image_path = Path(image_source)
+            if not image_path.exists():
+                raise FileNotFoundError(f"Image file not found: {image_source}")
+        
+        # Position and size are given in inches
+        left = _inches(position.get("x", 1))
+        top = _inches(position.get("y", 1))
+        width = _inches(size.get("width", 4))
+        height = _inches(size.get("height", 3))
+        
+        return image_path, left, top, width, height
+    
+    async def _fetch_image(self, url: str) -> Path:
+        """Download an image URL, reusing the previous download if unchanged.
+        
+        Args:
+            url: http(s) URL of the image
+        
+        Returns:
+            Path to the downloaded file
+        """
+        etag, cached_path = self._url_cache.get(url, ("", None))
+        if cached_path is not None and not cached_path.exists():
+            etag, cached_path = "", None
+        
+        if aiohttp is not None:
+            status, new_etag, body = await self._http_get(url, etag)
+        else:
+            status, new_etag, body = await self._run_io(self._urllib_get, url, etag)
+        
+        if status == 304 and cached_path is not None:
+            logger.debug("Image %s not modified, using cached download", url)
+            return cached_path
+        
+        download_dir = self.temp_dir / "downloads"
+        download_dir.mkdir(exist_ok=True)
+        suffix = Path(urlparse(url).path).suffix
+        image_path = download_dir / f"{hashlib.sha256(url.encode()).hexdigest()}{suffix}"
+        await self._run_io(image_path.write_bytes, body)
+        
+        self._url_cache[url] = (new_etag, image_path)
+        return image_path
+    
+    async def _http_get(self, url: str, etag: str) -> Tuple[int, str, bytes]:
+        """Conditional GET through the shared aiohttp session.
+        
+        Args:
+            url: URL to fetch
+            etag: ETag of the cached copy, or empty string
+        
+        Returns:
+            Tuple of (status, etag, body)
+        """
+        if self._http is None or self._http.closed:
+            # Same per-operation limits as the urllib fallback's timeout
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=IMAGE_DOWNLOAD_TIMEOUT,
+                sock_read=IMAGE_DOWNLOAD_TIMEOUT
+            )
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8), timeout=timeout)
+        
+        headers = {"If-None-Match": etag} if etag else {}
+        async with self._http.get(url, headers=headers) as response:
+            if response.status == 304:
+                return 304, etag, b""
+            response.raise_for_status()
+            _check_image_response(url, response.headers.get("Content-Type", ""), response.content_length)
+            
+            # Content-Length may be missing or wrong, so the read is capped too
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > MAX_IMAGE_DOWNLOAD_BYTES:
+                    raise ValueError(f"Image at {url} exceeds {MAX_IMAGE_DOWNLOAD_BYTES} bytes")
+                chunks.append(chunk)
+            return response.status, response.headers.get("ETag", ""), b"".join(chunks)
+    
+    @staticmethod
+    def _urllib_get(url: str, etag: str) -> Tuple[int, str, bytes]:
+        """Blocking conditional GET used when aiohttp is not installed.
+        
+        Args:
+            url: URL to fetch
+            etag: ETag of the cached copy, or empty string
+        
+        Returns:
+            Tuple of (status, etag, body)
+        """
+        request = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+        try:
+            with urllib.request.urlopen(request, timeout=IMAGE_DOWNLOAD_TIMEOUT) as response:
+                content_length = response.headers.get("Content-Length")
+                _check_image_response(
+                    url,
+                    response.headers.get("Content-Type", ""),
+                    int(content_length) if content_length and content_length.isdigit() else None
+                )
+                body = response.read(MAX_IMAGE_DOWNLOAD_BYTES + 1)
+                if len(body) > MAX_IMAGE_DOWNLOAD_BYTES:
+                    raise ValueError(f"Image at {url} exceeds {MAX_IMAGE_DOWNLOAD_BYTES} bytes")
+                return response.status, response.headers.get("ETag", ""), body
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, etag, b""
+            raise
+    
+    async def close(self) -> None:
+        """Release the HTTP session used for URL images."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+    
+    def _insert_picture(
+        self,
+        entry: Dict[str, Any],
+        slide_obj,
+        image_path: Path,
+        left: int,
+        top: int,
+        width: int,
+        height: int
+    ) -> None:
+        """Add a picture, reusing the image part of identical earlier images.
+        
+        Args:
+            entry: Presentation registry entry
+            slide_obj: Slide to add the picture to
+            image_path: Local image file
+            left: Left offset in EMU
+            top: Top offset in EMU
+            width: Width in EMU
+            height: Height in EMU
+        """
+        data = self._read_image(image_path)
+        digest = hashlib.sha256(data).hexdigest()
+        image_part = entry["media_cache"].get(digest)
+        if image_part is None:
+            # Package.get_or_add_image_part, fed from memory instead of the file
+            image = Image.from_blob(data, image_path.name)
+            package = slide_obj.part.package
+            image_part = package._image_parts._find_by_sha1(image.sha1) or ImagePart.new(package, image)
+            entry["media_cache"][digest] = image_part
+        rId = slide_obj.part.relate_to(image_part, RT.IMAGE)
+        
+        # Same steps as SlideShapes.add_picture, minus the image lookup
+        shapes = slide_obj.shapes
+        shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+        shapes._recalculate_extents()
+    
+    def _read_image(self, image_path: Path) -> bytes:
+        """Return an image file's contents, served from memory when unchanged.
+        
+        Args:
+            image_path: Local image file
+        
+        Returns:
+            File contents
+        """
+        stat = image_path.stat()
+        with self._image_cache_lock:
+            cached = self._image_bytes_cache.get(image_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._image_bytes_cache.move_to_end(image_path)
+                return cached[2]
+        
+        data = image_path.read_bytes()
+        if len(data) > IMAGE_CACHE_BYTES:
+            return data
+        
+        with self._image_cache_lock:
+            old = self._image_bytes_cache.pop(image_path, None)
+            if old:
+                self._image_cache_total -= len(old[2])
+            self._image_bytes_cache[image_path] = (stat.st_mtime_ns, stat.st_size, data)
+            self._image_cache_total += len(data)
+            while self._image_cache_total > IMAGE_CACHE_BYTES:
+                _, (_, _, evicted) = self._image_bytes_cache.popitem(last=False)
+                self._image_cache_total -= len(evicted)
+        return data
+    
+    def _slide_position(self, slide_id: str) -> Tuple[str, int]:
+        """Find the presentation and slide index for a slide ID.
+        
+        Args:
+            slide_id: ID of the slide
+        
+        Returns:
+            Tuple of (presentation_id, slide index)
+        """
+        presentation_id = self._slide_index.get(slide_id)
+        if presentation_id is None or presentation_id not in self.active_presentations:
+            raise ValueError(f"Slide {slide_id} not found")
+        slides = self.active_presentations[presentation_id]["slides"]
+        return presentation_id, slides[slide_id]["metadata"].index
+    
+    @contextlib.asynccontextmanager
+    async def _editing(self, presentation_id: str):
+        """Hold a presentation's lock and yield it, re-loading it if evicted.
+        
+        Edits to one presentation are serialized against each other and
+        against saves, while different presentations proceed independently.
+        
+        Args:
+            presentation_id: ID of the presentation
+        
+        Yields:
+            python-pptx Presentation
+        """
+        await self._evict_presentations(keep=presentation_id)
+        async with self.active_presentations[presentation_id]["lock"]:
+            yield await self._load_prs(presentation_id)
+    
+    async def _load_prs(self, presentation_id: str) -> Any:
+        """Return the cached presentation or parse it from its file.
+        
+        The caller must hold the presentation's lock.
+        
+        Args:
+            presentation_id: ID of the presentation
+        
+        Returns:
+            python-pptx Presentation
+        """
+        prs = self._prs_lru.get(presentation_id)
+        if prs is None:
+            file_path = self.active_presentations[presentation_id]["metadata"].file_path
+            prs = await self._run_io(Presentation, file_path)
+            self._prs_lru[presentation_id] = prs
+            logger.debug("Reloaded presentation %s from %s", presentation_id, file_path)
+        else:
+            self._prs_lru.move_to_end(presentation_id)
+        return prs
+    
+    async def _evict_presentations(self, incoming: int = 0, keep: Optional[str] = None) -> None:
+        """Flush and drop least recently used presentations over the cache size.
+        
+        Args:
+            incoming: Presentations about to be added to the cache
+            keep: Presentation that is about to be used and must not be evicted
+        """
+        if keep is not None and keep not in self._prs_lru:
+            incoming += 1
+        
+        while len(self._prs_lru) + incoming > PRESENTATION_CACHE_SIZE:
+            victim_id = next((pid for pid in self._prs_lru if pid != keep), None)
+            if victim_id is None:
+                break
+            
+            entry = self.active_presentations[victim_id]
+            async with entry["lock"]:
+                prs = self._prs_lru.pop(victim_id, None)
+                if prs is not None and entry["dirty"]:
+                    self._cancel_pending_flush(entry)
+                    await self._run_io(prs.save, entry["metadata"].file_path)
+                    entry["dirty"] = False
+                # Cached image parts and shapes belong to the dropped object graph
+                entry["media_cache"].clear()
+                for slide_rec in entry["slides"].values():
+                    slide_rec["content_shape"] = None
+            logger.debug("Evicted presentation %s from memory", victim_id)
+    
+    async def _run_io(self, func, *args) -> Any:
+        """Run a blocking python-pptx call in the controller's I/O pool.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for the callable
+        
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, functools.partial(func, *args))
+    
+    def _mark_dirty(self, presentation_id: str) -> None:
+        """Record a mutation and, with autosave, schedule a debounced flush.
+        
+        Args:
+            presentation_id: ID of the presentation
+        """
+        entry = self.active_presentations[presentation_id]
+        entry["dirty"] = True
+        
+        if self.autosave:
+            self._cancel_pending_flush(entry)
+            entry["flush_task"] = asyncio.create_task(self._delayed_flush(presentation_id))
+    
+    def _cancel_pending_flush(self, entry: Dict[str, Any]) -> None:
+        """Cancel a scheduled flush unless it is the task currently running.
+        
+        Args:
+            entry: Presentation registry entry
+        """
+        task = entry.get("flush_task")
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        entry["flush_task"] = None
+    
+    async def _delayed_flush(self, presentation_id: str) -> None:
+        """Flush a presentation once mutations have been quiet for AUTOSAVE_DELAY.
+        
+        Args:
+            presentation_id: ID of the presentation
+        """
+        await asyncio.sleep(AUTOSAVE_DELAY)
+        try:
+            await self.flush(presentation_id)
+        except Exception as e:
+            logger.warning(f"Autosave failed for presentation {presentation_id}: {e}")
+    
     async def _apply_text_formatting(
         self,
         text_frame,
@@ -475,21 +1231,13 @@ class PowerPointController:
             if "color" in formatting:
                 color = formatting["color"]
                 if isinstance(color, str) and color.startswith("#"):
-                    # Convert hex to RGB
-                    hex_color = color.lstrip("#")
-                    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                    paragraph.font.color.rgb = RGBColor(*rgb)
+                    paragraph.font.color.rgb = _hex_to_rgb(color)
             
             # Alignment
             if "alignment" in formatting:
-                align_map = {
-                    "left": PP_ALIGN.LEFT,
-                    "center": PP_ALIGN.CENTER,
-                    "right": PP_ALIGN.RIGHT,
-                    "justify": PP_ALIGN.JUSTIFY
-                }
-                if formatting["alignment"] in align_map:
-                    paragraph.alignment = align_map[formatting["alignment"]]
+                alignment = _ALIGN_MAP.get(formatting["alignment"])
+                if alignment is not None:
+                    paragraph.alignment = alignment
             
         except Exception as e:
             logger.warning(f"Failed to apply some text formatting: {e}")
@@ -506,7 +1254,7 @@ class PowerPointController:
         if presentation_id not in self.active_presentations:
             raise ValueError(f"Presentation {presentation_id} not found")
         
-        return self.active_presentations[presentation_id]["metadata"]
+        return self._refresh_open_status(self.active_presentations[presentation_id])
     
     async def list_presentations(self) -> List[Dict[str, Any]]:
         """List all active presentations.
@@ -514,4 +1262,24 @@ class PowerPointController:
         Returns:
             List of presentation metadata
         """
-        return [data["metadata"] for data in self.active_presentations.values()]
\ No newline at end of file
+        return [self._refresh_open_status(data) for data in self.active_presentations.values()]
+    
+    def _refresh_open_status(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold the background open-in-PowerPoint result into the metadata.
+        
+        Args:
+            entry: Presentation registry entry
+        
+        Returns:
+            Dict with presentation metadata
+        """
+        task = entry.get("open_task")
+        if task is not None and task.done():
+            entry["open_task"] = None
+            error = None if task.cancelled() else task.exception()
+            if error is not None:
+                logger.warning(f"Could not open in PowerPoint app: {error}")
+            entry["metadata"].applescript_available = (
+                not task.cancelled() and error is None and bool(task.result())
+            )
+        return dataclasses.asdict(entry["metadata"])
\ No newline at end of file
@@ -4,34 +4,209 @@ Handles all Word automation operations on macOS.
 """
 
 import asyncio
+import dataclasses
+import functools
+import io
+import itertools
+import re
+import shutil
+import threading
+import time
 import uuid
 import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 import logging
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from integrations.applescript_bridge import AppleScriptBridge
+from integrations.applescript_bridge import get_bridge
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Seconds of inactivity before a dirty document is written to its temp file
+AUTOSAVE_DELAY = 0.5
+
+# Parsed documents kept in memory; older ones are flushed and dropped
+DOCUMENT_CACHE_SIZE = 4
+
+# Seconds after which an unused document is dropped from memory as well
+DOCUMENT_IDLE_TTL = 300.0
+
+# Template files whose bytes are kept in memory for repeated create_document
+TEMPLATE_CACHE_SIZE = 8
+
+# slots=True needs Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class ElementMeta:
+    """Metadata of an inserted element; type-specific fields live in details."""
+    element_id: str
+    document_id: str
+    type: str
+    created_at: float
+    details: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the flat dict handed to clients.
+        
+        Returns:
+            Dict with the common fields and the type-specific details
+        """
+        return {
+            "element_id": self.element_id,
+            "document_id": self.document_id,
+            "type": self.type,
+            **self.details,
+            "created_at": self.created_at
+        }
+
+class ElementSpec(TypedDict, total=False):
+    """One element for add_elements; the fields of the matching add_* call."""
+    type: str  # heading, paragraph, list or table
+    text: str
+    level: int
+    style: str
+    formatting: Dict[str, Any]
+    items: List[str]
+    list_type: str
+    rows: int
+    columns: int
+    data: List[List[str]]
+
+_ELEMENT_TYPES = frozenset(("heading", "paragraph", "list", "table"))
+
+_ALIGN_MAP = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
+}
+
+def _write_docx(doc, file_path: str) -> None:
+    """Serialize a document in memory and write it to disk in one call.
+    
+    Args:
+        doc: python-docx Document
+        file_path: Destination path
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    Path(file_path).write_bytes(buffer.getbuffer())
+
+def _set_new_cell_text(tc, text: str) -> None:
+    """Write text into a freshly created, empty table cell.
+    
+    Produces the same XML as ``Cell.text = text`` for a new cell. Text with
+    tabs or line breaks still goes through python-docx's run text setter.
+    
+    Args:
+        tc: ``w:tc`` element holding a single empty paragraph
+        text: Cell text
+    """
+    r = tc.p_lst[0].add_r()
+    if "\t" in text or "\n" in text or "\r" in text:
+        r.text = text
+    elif text:
+        r.add_t(text)
+
+# Tables with more cells than this are filled by parsing one XML string
+_BULK_TABLE_CELLS = 200
+
+_XML_SPECIAL = re.compile(r"[&<>]")
+_RUN_BREAKS = re.compile(r"[\t\n\r]")
+
+def _table_rows_xml(
+    data: List[List[str]],
+    rows: int,
+    columns: int,
+    widths: List[Any]
+) -> Optional[str]:
+    """Build the ``w:tr`` elements of a new table as a single XML string.
+    
+    Matches what python-docx generates cell by cell. Returns None when a cell
+    contains tabs or line breaks, which need per-cell handling.
+    
+    Args:
+        data: Table data, padded with empty cells where short
+        rows: Number of rows
+        columns: Number of columns
+        widths: Grid column widths, as written in ``w:gridCol``
+    
+    Returns:
+        XML for a ``w:tbl`` wrapper holding the rows, or None
+    """
+    tc_prs = [f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{w}"/></w:tcPr>' for w in widths]
+    parts = [f"<w:tbl {nsdecls('w')}>"]
+    for row_idx in range(rows):
+        row_data = data[row_idx] if row_idx < len(data) else ()
+        parts.append("<w:tr>")
+        for col_idx in range(columns):
+            parts.append(tc_prs[col_idx])
+            if col_idx >= len(row_data):
+                # Padding cells are never written to
+                parts.append("<w:p/></w:tc>")
+                continue
+            text = str(row_data[col_idx])
+            if not text:
+                # Setting empty text still adds an empty run
+                parts.append("<w:p><w:r/></w:p></w:tc>")
+                continue
+            if _RUN_BREAKS.search(text):
+                return None
+            if _XML_SPECIAL.search(text):
+                text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            if text[0].isspace() or text[-1].isspace():
+                parts.append(f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>')
+            else:
+                parts.append(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:tc>")
+        parts.append("</w:tr>")
+    parts.append("</w:tbl>")
+    return "".join(parts)
+
 class WordController:
-    """Controller for Word operations using both AppleScript and python-docx."""
+    """Controller for Word operations using both AppleScript and python-docx.
     
-    def __init__(self):
-        self.applescript = AppleScriptBridge()
+    The add_* methods only update the in-memory document and mark it dirty.
+    The temp file is rewritten by ``flush`` (debounced automatically when
+    ``autosave`` is enabled) and ``save_document`` writes the final file.
+    Template loads and saves run in a small dedicated thread pool; saves hold
+    a per-document lock that the add_* methods also wait on. Concurrent add_*
+    calls on one document are therefore applied one at a time, and a burst
+    of them shares a single autosave task and a single save.
+    
+    Only the ``DOCUMENT_CACHE_SIZE`` most recently used documents, and none
+    idle for longer than ``DOCUMENT_IDLE_TTL``, stay parsed in memory. The
+    others are flushed and dropped, then re-read from their file on next use.
+    """
+    
+    def __init__(self, autosave: bool = False):
+        self.applescript = get_bridge()
         self.active_documents: Dict[str, Dict[str, Any]] = {}
+        self._doc_lru: "OrderedDict[str, Any]" = OrderedDict()
+        # Element IDs are only registry keys, so a counter is unique enough
+        self._element_ids = itertools.count()
+        self.autosave = autosave
+        # Dedicated pool so serializing one document neither blocks the event
+        # loop nor waits behind other users of the default executor
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="docx-io")
         # Use system temp directory with a subdirectory
         self.temp_dir = Path(tempfile.gettempdir()) / "office365_mcp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp_str = str(self.temp_dir)
+        self._template_cache: "OrderedDict[Path, Tuple[int, int, bytes]]" = OrderedDict()
+        self._template_cache_lock = threading.Lock()
     
     async def create_document(
         self,
@@ -52,7 +227,7 @@ class WordController:
             
             # Create document using python-docx
             if template_path and Path(template_path).exists():
-                doc = Document(template_path)
+                doc = await self._run_io(self._load_template, Path(template_path))
             else:
                 doc = Document()
             
@@ -61,13 +236,13 @@ class WordController:
                 doc.add_heading(title, level=1)
             
             # Save temporary file
-            temp_file = self.temp_dir / f"{document_id}.docx"
-            doc.save(str(temp_file))
+            temp_file = os.path.join(self._tmp_str, f"{document_id}.docx")
+            await self._run_io(_write_docx, doc, temp_file)
             
             # Try to open in Word via AppleScript
             applescript_success = False
             try:
-                await self.applescript.open_word_file(str(temp_file))
+                await self.applescript.open_word_file(temp_file)
                 applescript_success = True
             except Exception as e:
                 logger.warning(f"Could not open in Word app: {e}")
@@ -76,19 +251,29 @@ class WordController:
             document_data = {
                 "document_id": document_id,
                 "title": title,
-                "file_path": str(temp_file),
+                "file_path": temp_file,
                 "paragraph_count": len(doc.paragraphs),
                 "applescript_available": applescript_success,
-                "created_at": asyncio.get_event_loop().time()
+                "created_at": time.monotonic()
             }
             
+            await self._evict_documents(incoming=1)
             self.active_documents[document_id] = {
                 "metadata": document_data,
-                "docx_object": doc,
-                "elements": {}
+                # Working file; deleted on close even after a save elsewhere
+                "temp_file": Path(temp_file),
+                "elements": {},
+                "dirty": False,
+                "flush_task": None,
+                "lock": asyncio.Lock(),
+                # Style name -> style object of the loaded document
+                "style_cache": {},
+                "last_used": time.monotonic()
             }
             
-            logger.info(f"Created document: {title} ({document_id})")
+            self._doc_lru[document_id] = doc
+            
+            logger.info("Created document: %s (%s)", title, document_id)
             return document_data
             
         except Exception as e:
@@ -113,51 +298,17 @@ class WordController:
         Returns:
             Dict with operation status
         """
+        if document_id not in self.active_documents:
+            raise ValueError(f"Document {document_id} not found")
+        
         try:
-            if document_id not in self.active_documents:
-                raise ValueError(f"Document {document_id} not found")
-            
-            doc = self.active_documents[document_id]["docx_object"]
-            element_id = str(uuid.uuid4())
-            
-            # Validate level
-            level = max(1, min(6, level))
-            
-            # Add heading
-            heading = doc.add_heading(text, level=level)
-            
-            # Apply custom style if provided
-            if style:
-                try:
-                    heading.style = style
-                except Exception as e:
-                    logger.warning(f"Could not apply style '{style}': {e}")
-            
-            # Store element metadata
-            element_data = {
-                "element_id": element_id,
-                "document_id": document_id,
-                "type": "heading",
-                "text": text,
-                "level": level,
-                "style": style,
-                "created_at": asyncio.get_event_loop().time()
-            }
-            
-            self.active_documents[document_id]["elements"][element_id] = {
-                "metadata": element_data,
-                "element_object": heading
-            }
+            doc = await self._get_document(document_id)
+            element_data = self._insert_heading(document_id, doc, text, level, style)
             
-            # Update document metadata
-            self.active_documents[document_id]["metadata"]["paragraph_count"] = len(doc.paragraphs)
+            self._mark_dirty(document_id)
             
-            # Save updated document
-            temp_file = self.active_documents[document_id]["metadata"]["file_path"]
-            doc.save(temp_file)
-            
-            logger.info(f"Added heading to document {document_id}")
-            return element_data
+            logger.info("Added heading to document %s", document_id)
+            return element_data.as_dict()
             
         except Exception as e:
             logger.error(f"Failed to add heading: {e}")
@@ -181,52 +332,17 @@ class WordController:
         Returns:
             Dict with operation status
         """
+        if document_id not in self.active_documents:
+            raise ValueError(f"Document {document_id} not found")
+        
         try:
-            if document_id not in self.active_documents:
-                raise ValueError(f"Document {document_id} not found")
-            
-            doc = self.active_documents[document_id]["docx_object"]
-            element_id = str(uuid.uuid4())
-            
-            # Add paragraph
-            paragraph = doc.add_paragraph(text)
-            
-            # Apply style if provided
-            if style:
-                try:
-                    paragraph.style = style
-                except Exception as e:
-                    logger.warning(f"Could not apply style '{style}': {e}")
-            
-            # Apply formatting if provided
-            if formatting:
-                await self._apply_paragraph_formatting(paragraph, formatting)
-            
-            # Store element metadata
-            element_data = {
-                "element_id": element_id,
-                "document_id": document_id,
-                "type": "paragraph",
-                "text": text,
-                "style": style,
-                "formatting": formatting,
-                "created_at": asyncio.get_event_loop().time()
-            }
+            doc = await self._get_document(document_id)
+            element_data = self._insert_paragraph(document_id, doc, text, style, formatting)
             
-            self.active_documents[document_id]["elements"][element_id] = {
-                "metadata": element_data,
-                "element_object": paragraph
-            }
-            
-            # Update document metadata
-            self.active_documents[document_id]["metadata"]["paragraph_count"] = len(doc.paragraphs)
-            
-            # Save updated document
-            temp_file = self.active_documents[document_id]["metadata"]["file_path"]
-            doc.save(temp_file)
+            self._mark_dirty(document_id)
             
-            logger.info(f"Added paragraph to document {document_id}")
-            return element_data
+            logger.info("Added paragraph to document %s", document_id)
+            return element_data.as_dict()
             
         except Exception as e:
             logger.error(f"Failed to add paragraph: {e}")
@@ -250,49 +366,17 @@ class WordController:
         Returns:
             Dict with operation status
         """
+        if document_id not in self.active_documents:
+            raise ValueError(f"Document {document_id} not found")
+        
         try:
-            if document_id not in self.active_documents:
-                raise ValueError(f"Document {document_id} not found")
-            
-            doc = self.active_documents[document_id]["docx_object"]
-            element_id = str(uuid.uuid4())
-            
-            # Add list items
-            list_elements = []
-            for item in items:
-                if list_type == "number":
-                    paragraph = doc.add_paragraph(item, style='List Number')
-                else:
-                    paragraph = doc.add_paragraph(item, style='List Bullet')
-                
-                list_elements.append(paragraph)
-            
-            # Store element metadata
-            element_data = {
-                "element_id": element_id,
-                "document_id": document_id,
-                "type": "list",
-                "items": items,
-                "list_type": list_type,
-                "style": style,
-                "item_count": len(items),
-                "created_at": asyncio.get_event_loop().time()
-            }
-            
-            self.active_documents[document_id]["elements"][element_id] = {
-                "metadata": element_data,
-                "element_objects": list_elements
-            }
-            
-            # Update document metadata
-            self.active_documents[document_id]["metadata"]["paragraph_count"] = len(doc.paragraphs)
+            doc = await self._get_document(document_id)
+            element_data = self._insert_list(document_id, doc, items, list_type, style)
             
-            # Save updated document
-            temp_file = self.active_documents[document_id]["metadata"]["file_path"]
-            doc.save(temp_file)
+            self._mark_dirty(document_id)
             
-            logger.info(f"Added list to document {document_id}")
-            return element_data
+            logger.info("Added list to document %s", document_id)
+            return element_data.as_dict()
             
         except Exception as e:
             logger.error(f"Failed to add list: {e}")
@@ -318,58 +402,82 @@ class WordController:
         Returns:
             Dict with operation status
         """
+        if document_id not in self.active_documents:
+            raise ValueError(f"Document {document_id} not found")
+        
         try:
-            if document_id not in self.active_documents:
-                raise ValueError(f"Document {document_id} not found")
-            
-            doc = self.active_documents[document_id]["docx_object"]
-            element_id = str(uuid.uuid4())
-            
-            # Create table
-            table = doc.add_table(rows=rows, cols=columns)
-            
-            # Apply style if provided
-            if style:
-                try:
-                    table.style = style
-                except Exception as e:
-                    logger.warning(f"Could not apply table style '{style}': {e}")
-            
-            # Fill table with data if provided
-            if data:
-                for row_idx, row_data in enumerate(data[:rows]):
-                    for col_idx, cell_data in enumerate(row_data[:columns]):
-                        if row_idx < len(table.rows) and col_idx < len(table.columns):
-                            table.cell(row_idx, col_idx).text = str(cell_data)
-            
-            # Store element metadata
-            element_data = {
-                "element_id": element_id,
-                "document_id": document_id,
-                "type": "table",
-                "rows": rows,
-                "columns": columns,
-                "style": style,
-                "has_data": bool(data),
-                "created_at": asyncio.get_event_loop().time()
-            }
-            
-            self.active_documents[document_id]["elements"][element_id] = {
-                "metadata": element_data,
-                "element_object": table
-            }
+            doc = await self._get_document(document_id)
+            element_data = self._insert_table(document_id, doc, rows, columns, data, style)
             
-            # Save updated document
-            temp_file = self.active_documents[document_id]["metadata"]["file_path"]
-            doc.save(temp_file)
+            self._mark_dirty(document_id)
             
-            logger.info(f"Added table to document {document_id}")
-            return element_data
+            logger.info("Added table to document %s", document_id)
+            return element_data.as_dict()
             
         except Exception as e:
             logger.error(f"Failed to add table: {e}")
             raise
     
+    async def add_elements(
+        self,
+        document_id: str,
+        elements: List[ElementSpec]
+    ) -> List[Dict[str, Any]]:
+        """Add several headings, paragraphs, lists and tables in one batch.
+        
+        The document is acquired and marked dirty once for the whole batch.
+        
+        Args:
+            document_id: ID of the document
+            elements: Element specifications, applied in order
+        
+        Returns:
+            List of element metadata dicts, in input order
+        """
+        if document_id not in self.active_documents:
+            raise ValueError(f"Document {document_id} not found")
+        
+        # Validate every type before touching the document
+        for spec in elements:
+            if spec.get("type") not in _ELEMENT_TYPES:
+                raise ValueError(f"Unsupported element type: {spec.get('type')}")
+        
+        try:
+            doc = await self._get_document(document_id)
+            results = []
+            try:
+                for spec in elements:
+                    kind = spec["type"]
+                    if kind == "heading":
+                        element_data = self._insert_heading(
+                            document_id, doc, spec["text"], spec.get("level", 1),
+                            spec.get("style")
+                        )
+                    elif kind == "paragraph":
+                        element_data = self._insert_paragraph(
+                            document_id, doc, spec["text"], spec.get("style"), spec.get("formatting")
+                        )
+                    elif kind == "list":
+                        element_data = self._insert_list(
+                            document_id, doc, spec["items"], spec.get("list_type", "bullet"),
+                            spec.get("style")
+                        )
+                    else:
+                        element_data = self._insert_table(
+                            document_id, doc, spec["rows"], spec["columns"], spec.get("data"),
+                            spec.get("style")
+                        )
+                    results.append(element_data.as_dict())
+            finally:
+                self._mark_dirty(document_id)
+            
+            logger.info("Added %s elements to document %s", len(results), document_id)
+            return results
+        
+        except Exception as e:
+            logger.error(f"Failed to add elements: {e}")
+            raise
+    
     async def save_document(
         self,
         document_id: str,
@@ -390,28 +498,35 @@ class WordController:
             if document_id not in self.active_documents:
                 raise ValueError(f"Document {document_id} not found")
             
-            doc = self.active_documents[document_id]["docx_object"]
+            entry = self.active_documents[document_id]
             save_path = Path(file_path)
             
             # Ensure directory exists
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            if format.lower() == "docx":
-                doc.save(str(save_path))
-            elif format.lower() == "pdf":
+            if format.lower() == "pdf":
                 # PDF export would require AppleScript or additional libraries
                 # For now, save as DOCX and note the limitation
-                docx_path = save_path.with_suffix(".docx")
-                doc.save(str(docx_path))
-                logger.warning(f"PDF export not implemented, saved as DOCX: {docx_path}")
-                save_path = docx_path
-            else:
+                save_path = save_path.with_suffix(".docx")
+                logger.warning(f"PDF export not implemented, saved as DOCX: {save_path}")
+            elif format.lower() != "docx":
                 raise ValueError(f"Unsupported format: {format}")
             
-            # Update metadata
-            self.active_documents[document_id]["metadata"]["file_path"] = str(save_path)
+            # A full save supersedes any pending flush
+            self._cancel_pending_flush(entry)
+            async with entry["lock"]:
+                doc = self._doc_lru.get(document_id)
+                if doc is not None:
+                    await self._run_io(_write_docx, doc, str(save_path))
+                elif Path(entry["metadata"]["file_path"]) != save_path:
+                    # Evicted documents are already current on disk
+                    await self._run_io(shutil.copyfile, entry["metadata"]["file_path"], str(save_path))
+                entry["dirty"] = False
+                
+                # Update metadata
+                entry["metadata"]["file_path"] = str(save_path)
             
-            logger.info(f"Saved document to {save_path}")
+            logger.info("Saved document to %s", save_path)
             return {
                 "status": "success",
                 "document_id": document_id,
@@ -423,7 +538,494 @@ class WordController:
             logger.error(f"Failed to save document: {e}")
             raise
     
-    async def _apply_paragraph_formatting(
+    async def flush(self, document_id: str) -> Dict[str, Any]:
+        """Write pending changes of a document to its current file.
+        
+        Args:
+            document_id: ID of the document
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if document_id not in self.active_documents:
+                raise ValueError(f"Document {document_id} not found")
+            
+            entry = self.active_documents[document_id]
+            self._cancel_pending_flush(entry)
+            
+            async with entry["lock"]:
+                file_path = entry["metadata"]["file_path"]
+                doc = self._doc_lru.get(document_id)
+                flushed = entry["dirty"] and doc is not None
+                if flushed:
+                    await self._run_io(_write_docx, doc, file_path)
+                    entry["dirty"] = False
+                    logger.debug("Flushed document %s to %s", document_id, file_path)
+            
+            return {
+                "status": "success",
+                "document_id": document_id,
+                "file_path": file_path,
+                "flushed": flushed
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to flush document: {e}")
+            raise
+    
+    async def close_document(self, document_id: str) -> Dict[str, Any]:
+        """Close a document and release its memory and temp file.
+        
+        Documents saved elsewhere get pending changes flushed to their file
+        first; the temp file is always deleted.
+        
+        Args:
+            document_id: ID of the document
+        
+        Returns:
+            Dict with operation status
+        """
+        try:
+            if document_id not in self.active_documents:
+                raise ValueError(f"Document {document_id} not found")
+            
+            entry = self.active_documents[document_id]
+            self._cancel_pending_flush(entry)
+            
+            async with entry["lock"]:
+                file_path = Path(entry["metadata"]["file_path"])
+                temp_file = entry["temp_file"]
+                is_temp = file_path == temp_file
+                doc = self._doc_lru.pop(document_id, None)
+                if doc is not None and entry["dirty"] and not is_temp:
+                    await self._run_io(_write_docx, doc, str(file_path))
+                temp_file.unlink(missing_ok=True)
+                del self.active_documents[document_id]
+            
+            logger.info("Closed document %s", document_id)
+            return {
+                "status": "success",
+                "document_id": document_id,
+                "file_path": None if is_temp else str(file_path)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to close document: {e}")
+            raise
+    
+    def _insert_heading(
+        self,
+        document_id: str,
+        doc,
+        text: str,
+        level: int,
+        style: Optional[str]
+    ) -> ElementMeta:
+        """Insert a heading and register it.
+        
+        The caller must have obtained ``doc`` via _get_document and must not
+        await before calling this.
+        
+        Args:
+            document_id: ID of the document
+            doc: Loaded python-docx Document
+            text: Heading text
+            level: Heading level (1-6)
+            style: Optional style name
+        
+        Returns:
+            Metadata of the new element
+        """
+        element_id = f"el{next(self._element_ids)}"
+        
+        # Validate level
+        level = max(1, min(6, level))
+        
+        # Add heading
+        heading = doc.add_heading(text, level=level)
+        
+        # Apply custom style if provided
+        if style:
+            try:
+                heading.style = self._get_style(document_id, doc, style)
+            except Exception as e:
+                logger.warning(f"Could not apply style '{style}': {e}")
+        
+        # Store element metadata
+        element_data = ElementMeta(
+            element_id=element_id,
+            document_id=document_id,
+            type="heading",
+            created_at=time.monotonic(),
+            details={
+                "text": text,
+                "level": level,
+                "style": style
+            }
+        )
+        
+        self.active_documents[document_id]["elements"][element_id] = {
+            "metadata": element_data
+        }
+        
+        # Update document metadata; a running count avoids rewalking the body
+        self.active_documents[document_id]["metadata"]["paragraph_count"] += 1
+        
+        return element_data
+    
+    def _insert_paragraph(
+        self,
+        document_id: str,
+        doc,
+        text: str,
+        style: Optional[str],
+        formatting: Optional[Dict[str, Any]]
+    ) -> ElementMeta:
+        """Insert a paragraph and register it.
+        
+        The caller must have obtained ``doc`` via _get_document and must not
+        await before calling this.
+        
+        Args:
+            document_id: ID of the document
+            doc: Loaded python-docx Document
+            text: Paragraph text
+            style: Optional style name
+            formatting: Text formatting options
+        
+        Returns:
+            Metadata of the new element
+        """
+        element_id = f"el{next(self._element_ids)}"
+        
+        # Add paragraph
+        paragraph = doc.add_paragraph(text)
+        
+        # Apply style if provided
+        if style:
+            try:
+                paragraph.style = self._get_style(document_id, doc, style)
+            except Exception as e:
+                logger.warning(f"Could not apply style '{style}': {e}")
+        
+        # Apply formatting if provided
+        if formatting:
+            self._apply_paragraph_formatting(paragraph, formatting)
+        
+        # Store element metadata
+        element_data = ElementMeta(
+            element_id=element_id,
+            document_id=document_id,
+            type="paragraph",
+            created_at=time.monotonic(),
+            details={
+                "text": text,
+                "style": style,
+                "formatting": formatting
+            }
+        )
+        
+        self.active_documents[document_id]["elements"][element_id] = {
+            "metadata": element_data
+        }
+        
+        # Update document metadata
+        self.active_documents[document_id]["metadata"]["paragraph_count"] += 1
+        
+        return element_data
+    
+    def _insert_list(
+        self,
+        document_id: str,
+        doc,
+        items: List[str],
+        list_type: str,
+        style: Optional[str]
+    ) -> ElementMeta:
+        """Insert list items and register them as one element.
+        
+        The caller must have obtained ``doc`` via _get_document and must not
+        await before calling this.
+        
+        Args:
+            document_id: ID of the document
+            doc: Loaded python-docx Document
+            items: List items
+            list_type: Type of list (bullet, number)
+            style: Optional style name
+        
+        Returns:
+            Metadata of the new element
+        """
+        element_id = f"el{next(self._element_ids)}"
+        
+        # Passing the style object skips the per-paragraph lookup by name
+        list_style = self._get_style(
+            document_id, doc, 'List Number' if list_type == "number" else 'List Bullet'
+        )
+        
+        # Add list items
+        list_elements = [doc.add_paragraph(item, style=list_style) for item in items]
+        
+        # Store element metadata
+        element_data = ElementMeta(
+            element_id=element_id,
+            document_id=document_id,
+            type="list",
+            created_at=time.monotonic(),
+            details={
+                "items": items,
+                "list_type": list_type,
+                "style": style,
+                "item_count": len(items)
+            }
+        )
+        
+        self.active_documents[document_id]["elements"][element_id] = {
+            "metadata": element_data
+        }
+        
+        # Update document metadata
+        self.active_documents[document_id]["metadata"]["paragraph_count"] += len(list_elements)
+        
+        return element_data
+    
+    def _insert_table(
+        self,
+        document_id: str,
+        doc,
+        rows: int,
+        columns: int,
+        data: Optional[List[List[str]]],
+        style: Optional[str]
+    ) -> ElementMeta:
+        """Insert a table and register it.
+        
+        The caller must have obtained ``doc`` via _get_document and must not
+        await before calling this.
+        
+        Args:
+            document_id: ID of the document
+            doc: Loaded python-docx Document
+            rows: Number of rows
+            columns: Number of columns
+            data: Optional table data
+            style: Optional table style
+        
+        Returns:
+            Metadata of the new element
+        """
+        element_id = f"el{next(self._element_ids)}"
+        
+        # Large tables get all their rows from one parsed XML string
+        rows_xml = None
+        if data and rows * columns > _BULK_TABLE_CELLS:
+            table = doc.add_table(rows=0, cols=columns)
+            widths = [col.get(qn("w:w")) for col in table._tbl.tblGrid.gridCol_lst]
+            rows_xml = _table_rows_xml(data, rows, columns, widths)
+            if rows_xml is not None:
+                table._tbl.extend(list(parse_xml(rows_xml)))
+            else:
+                table._tbl.getparent().remove(table._tbl)
+        if rows_xml is None:
+            table = doc.add_table(rows=rows, cols=columns)
+        
+        # Apply style if provided
+        if style:
+            try:
+                table.style = self._get_style(document_id, doc, style)
+            except Exception as e:
+                logger.warning(f"Could not apply table style '{style}': {e}")
+        
+        # Fill table with data if provided, writing runs straight into the
+        # cells' XML instead of going through Cell/Paragraph wrappers
+        if data and rows_xml is None:
+            trs = table._tbl.tr_lst
+            for row_idx, row_data in enumerate(data[:rows]):
+                tcs = trs[row_idx].tc_lst
+                for col_idx, cell_data in enumerate(row_data[:columns]):
+                    _set_new_cell_text(tcs[col_idx], str(cell_data))
+        
+        # Store element metadata
+        element_data = ElementMeta(
+            element_id=element_id,
+            document_id=document_id,
+            type="table",
+            created_at=time.monotonic(),
+            details={
+                "rows": rows,
+                "columns": columns,
+                "style": style,
+                "has_data": bool(data)
+            }
+        )
+        
+        self.active_documents[document_id]["elements"][element_id] = {
+            "metadata": element_data
+        }
+        
+        return element_data
+    
+    async def _get_document(self, document_id: str) -> Any:
+        """Return the parsed document, re-loading it if it was evicted.
+        
+        Waits for any save running in a worker thread, so callers must mutate
+        the document without awaiting in between.
+        
+        Args:
+            document_id: ID of the document
+        
+        Returns:
+            python-docx Document
+        """
+        await self._evict_documents(keep=document_id)
+        entry = self.active_documents[document_id]
+        async with entry["lock"]:
+            doc = self._doc_lru.get(document_id)
+            if doc is None:
+                file_path = entry["metadata"]["file_path"]
+                doc = await self._run_io(Document, file_path)
+                self._doc_lru[document_id] = doc
+                logger.debug("Reloaded document %s from %s", document_id, file_path)
+            else:
+                self._doc_lru.move_to_end(document_id)
+            entry["last_used"] = time.monotonic()
+            return doc
+    
+    async def _evict_documents(self, incoming: int = 0, keep: Optional[str] = None) -> None:
+        """Flush and drop documents over the cache size or idle past the TTL.
+        
+        Args:
+            incoming: Documents about to be added to the cache
+            keep: Document that is about to be used and must not be evicted
+        """
+        if keep is not None and keep not in self._doc_lru:
+            incoming += 1
+        
+        idle_before = time.monotonic() - DOCUMENT_IDLE_TTL
+        victims = [
+            doc_id for doc_id in self._doc_lru
+            if doc_id != keep and self.active_documents[doc_id]["last_used"] < idle_before
+        ]
+        excess = len(self._doc_lru) - len(victims) + incoming - DOCUMENT_CACHE_SIZE
+        if excess > 0:
+            victims += [
+                doc_id for doc_id in self._doc_lru
+                if doc_id != keep and doc_id not in victims
+            ][:excess]
+        
+        for victim_id in victims:
+            entry = self.active_documents[victim_id]
+            async with entry["lock"]:
+                doc = self._doc_lru.pop(victim_id, None)
+                if doc is not None and entry["dirty"]:
+                    self._cancel_pending_flush(entry)
+                    await self._run_io(_write_docx, doc, entry["metadata"]["file_path"])
+                    entry["dirty"] = False
+                # Cached styles would keep the dropped XML tree alive
+                entry["style_cache"].clear()
+            logger.debug("Evicted document %s from memory", victim_id)
+    
+    def _get_style(self, document_id: str, doc, name: str) -> Any:
+        """Resolve a style by name, caching the result per document.
+        
+        Args:
+            document_id: ID of the document
+            doc: Loaded python-docx Document
+            name: Style name
+        
+        Returns:
+            python-docx style object
+        """
+        cache = self.active_documents[document_id]["style_cache"]
+        style = cache.get(name)
+        if style is None:
+            style = cache[name] = doc.styles[name]
+        return style
+    
+    def _load_template(self, template_path: Path):
+        """Parse a template, reading its bytes from memory when unchanged.
+        
+        Args:
+            template_path: Template .docx file
+        
+        Returns:
+            New python-docx Document based on the template
+        """
+        stat = template_path.stat()
+        with self._template_cache_lock:
+            cached = self._template_cache.get(template_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._template_cache.move_to_end(template_path)
+                return Document(io.BytesIO(cached[2]))
+        
+        data = template_path.read_bytes()
+        with self._template_cache_lock:
+            self._template_cache[template_path] = (stat.st_mtime_ns, stat.st_size, data)
+            self._template_cache.move_to_end(template_path)
+            while len(self._template_cache) > TEMPLATE_CACHE_SIZE:
+                self._template_cache.popitem(last=False)
+        return Document(io.BytesIO(data))
+    
+    async def _run_io(self, func, *args) -> Any:
+        """Run a blocking python-docx call in the controller's I/O pool.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for the callable
+        
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, functools.partial(func, *args))
+    
+    def _mark_dirty(self, document_id: str) -> None:
+        """Record a mutation and, with autosave, schedule a debounced flush.
+        
+        Args:
+            document_id: ID of the document
+        """
+        entry = self.active_documents[document_id]
+        entry["dirty"] = True
+        
+        if self.autosave:
+            # Push the deadline back; the running task picks it up
+            entry["flush_due"] = time.monotonic() + AUTOSAVE_DELAY
+            task = entry.get("flush_task")
+            if task is None or task.done():
+                entry["flush_task"] = asyncio.create_task(self._delayed_flush(document_id))
+    
+    def _cancel_pending_flush(self, entry: Dict[str, Any]) -> None:
+        """Cancel a scheduled flush unless it is the task currently running.
+        
+        Args:
+            entry: Document registry entry
+        """
+        task = entry.get("flush_task")
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        entry["flush_task"] = None
+    
+    async def _delayed_flush(self, document_id: str) -> None:
+        """Flush a document once mutations have been quiet for AUTOSAVE_DELAY.
+        
+        Args:
+            document_id: ID of the document
+        """
+        entry = self.active_documents[document_id]
+        while True:
+            delay = entry["flush_due"] - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        try:
+            await self.flush(document_id)
+        except Exception as e:
+            logger.warning(f"Autosave failed for document {document_id}: {e}")
+    
+    def _apply_paragraph_formatting(
         self,
         paragraph,
         formatting: Dict[str, Any]
@@ -436,15 +1038,9 @@ class WordController:
         """
         try:
             # Alignment
-            if "alignment" in formatting:
-                align_map = {
-                    "left": WD_ALIGN_PARAGRAPH.LEFT,
-                    "center": WD_ALIGN_PARAGRAPH.CENTER,
-                    "right": WD_ALIGN_PARAGRAPH.RIGHT,
-                    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
-                }
-                if formatting["alignment"] in align_map:
-                    paragraph.alignment = align_map[formatting["alignment"]]
+            alignment = _ALIGN_MAP.get(formatting.get("alignment"))
+            if alignment is not None:
+                paragraph.alignment = alignment
             
             # Apply formatting to runs (text formatting)
             if paragraph.runs:
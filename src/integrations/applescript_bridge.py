@@ -4,74 +4,1010 @@ Provides direct integration with Microsoft Office applications on macOS via Appl
 """
 
 import asyncio
-import subprocess
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import math
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.cell import coordinate_from_string
+
+try:
+    from ScriptingBridge import SBApplication
+except ImportError:  # not macOS or no PyObjC; everything goes through osascript
+    SBApplication = None
+
+try:
+    from Foundation import NSAppleScript
+except ImportError:  # no PyObjC; AppleScript runs in osascript workers
+    NSAppleScript = None
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Parameterized scripts, compiled once with osacompile and run with argv.
+# Scripts using an application's own terms must name it literally, since
+# the terms are resolved at compile time
+_COMPILED_SOURCES = {
+    "activate": """
+on run argv
+    tell application (item 1 of argv) to activate
+end run
+""",
+    "open_document": """
+on run argv
+    tell application (item 1 of argv)
+        open POSIX file (item 2 of argv)
+        activate
+    end tell
+end run
+""",
+    "export_pdf": """
+on run argv
+    tell application "Microsoft PowerPoint"
+        open POSIX file (item 1 of argv)
+        set pres to active presentation
+        save pres in POSIX file (item 2 of argv) as save as PDF
+        close pres saving no
+    end tell
+end run
+""",
+    "add_slide": """
+on run argv
+    tell application "Microsoft PowerPoint"
+        tell presentation (item 1 of argv)
+            set newSlide to make new slide at end
+            return "SLIDE_IDX:" & (index of newSlide as string)
+        end tell
+    end tell
+end run
+""",
+    "add_slide_with_text": """
+on run argv
+    tell application "Microsoft PowerPoint"
+        tell presentation (item 1 of argv)
+            set newSlide to make new slide at end
+            tell newSlide
+                if (item 2 of argv) is not "" then set text range of text frame of shape 1 to (item 2 of argv)
+                if (item 3 of argv) is not "" then set text range of text frame of shape 2 to (item 3 of argv)
+            end tell
+            return "SLIDE_IDX:" & (index of newSlide as string)
+        end tell
+    end tell
+end run
+""",
+    "set_slide_text": """
+on run argv
+    tell application "Microsoft PowerPoint"
+        tell presentation (item 1 of argv)
+            tell slide ((item 2 of argv) as integer)
+                set text range of text frame of shape ((item 3 of argv) as integer) to (item 4 of argv)
+            end tell
+        end tell
+    end tell
+end run
+""",
+    "append_document_text": """
+on run argv
+    tell application "Microsoft Word"
+        insert text (item 2 of argv) at end of text object of document (item 1 of argv)
+    end tell
+end run
+"""
+}
+
+# Long-lived osascript worker: reads one JSON request per line from stdin,
+# runs its AppleScript source with NSAppleScript (or a compiled script file
+# with "run script") and answers with one JSON line. Requests are sent ASCII-only, so chunked reads never split a char
+_COPROCESS_SOURCE = r"""
+ObjC.import('Foundation');
+var input = $.NSFileHandle.fileHandleWithStandardInput;
+var output = $.NSFileHandle.fileHandleWithStandardOutput;
+var buffer = '';
+function readLine() {
+    while (buffer.indexOf('\n') < 0) {
+        var data = input.availableData;
+        if (data.length == 0) return null;
+        buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    }
+    var end = buffer.indexOf('\n');
+    var line = buffer.slice(0, end);
+    buffer = buffer.slice(end + 1);
+    return line;
+}
+var standard = Application.currentApplication();
+standard.includeStandardAdditions = true;
+function formatValue(value) {
+    if (value === undefined || value === null) return '';
+    if (value === true) return 'true';
+    if (value === false) return 'false';
+    if (Array.isArray(value)) return value.map(formatValue).join(', ');
+    return String(value);
+}
+function format(desc) {
+    if (!desc || desc.isNil()) return '';
+    var type = desc.descriptorType;
+    if (type == 0x6C697374) {
+        var items = [];
+        for (var i = 1; i <= desc.numberOfItems; i++) items.push(format(desc.descriptorAtIndex(i)));
+        return items.join(', ');
+    }
+    if (type == 0x74727565) return 'true';
+    if (type == 0x66616C73) return 'false';
+    if (type == 0x626F6F6C) return desc.booleanValue ? 'true' : 'false';
+    var text = desc.stringValue;
+    return (!text || text.isNil()) ? '' : text.js;
+}
+for (var line = readLine(); line !== null; line = readLine()) {
+    var request = JSON.parse(line);
+    var reply = {id: request.id};
+    try {
+        if (request.path) {
+            // Compiled script file: loaded, not parsed, and run with argv
+            reply.result = formatValue(standard.runScript(Path(request.path), {withParameters: request.args}));
+        } else {
+            var error = Ref();
+            var script = $.NSAppleScript.alloc.initWithSource(request.script);
+            var result = script.executeAndReturnError(error);
+            if (!result || result.isNil()) {
+                reply.error = ObjC.unwrap(error[0].objectForKey('NSAppleScriptErrorMessage')) || 'unknown error';
+            } else {
+                reply.result = request.quiet ? '' : format(result);
+            }
+        }
+    } catch (e) {
+        reply.error = String(e);
+    }
+    output.writeData($(JSON.stringify(reply) + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+"""
+
+# Seconds an "is the app running" answer is reused
+STATUS_CACHE_TTL = 2.0
+
+# File formats to PowerPoint AppleScript save commands
+_PPT_FORMAT_MAP = {
+    "pptx": "save as PowerPoint presentation",
+    "pdf": "save as PDF",
+    "ppt": "save as PowerPoint 97-2004 presentation"
+}
+
+# File formats to Word AppleScript save commands
+_WORD_FORMAT_MAP = {
+    "docx": "save as Word document",
+    "pdf": "save as PDF",
+    "doc": "save as Word 97-2004 document",
+    "rtf": "save as rich text format",
+    "txt": "save as plain text"
+}
+
+# Separates the outputs of the steps of a run_batch script
+_BATCH_MARKER = "---STEP---"
+
+# JXA deck builder: argv[0] is a JSON {"title", "slides": [{"title", "content"}]}
+_BUILD_PRESENTATION_JXA = r"""
+function run(argv) {
+    var spec = JSON.parse(argv[0]);
+    var app = Application("Microsoft PowerPoint");
+    app.activate();
+    var pres = app.Presentation().make();
+    var deck = [{title: spec.title}].concat(spec.slides);
+    for (var i = 0; i < deck.length; i++) {
+        var slide = app.Slide().make({at: pres.slides.end});
+        var shapes = slide.shapes;
+        if (deck[i].title && shapes.length > 0) shapes[0].textFrame.textRange.content = deck[i].title;
+        if (deck[i].content && shapes.length > 1) shapes[1].textFrame.textRange.content = deck[i].content;
+    }
+    return pres.name();
+}
+"""
+
+# Most queued submissions sent to one worker in a single write
+SUBMIT_BATCH_SIZE = 16
+
+# Longest reply line accepted from the osascript worker
+_COPROCESS_LINE_LIMIT = 16 * 1024 * 1024
+
+# Compiled NSAppleScript objects kept for reuse, keyed by source
+NSAPPLESCRIPT_CACHE_SIZE = 64
+
+def _applescript_literal(value: Any) -> str:
+    """Render a Python value as an AppleScript literal.
+    
+    NaN and infinite floats, such as a DataFrame's missing values, have no
+    AppleScript literal and are written as blank cells.
+    
+    Args:
+        value: Cell value (None, bool, number or anything str()-able)
+    
+    Returns:
+        AppleScript source for the value
+    """
+    if value is None:
+        return '""'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return repr(value) if math.isfinite(value) else '""'
+    if isinstance(value, int):
+        return repr(value)
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+# Bundle identifiers used to reach the applications through ScriptingBridge
+_BUNDLE_IDS = {
+    "Microsoft PowerPoint": "com.microsoft.Powerpoint",
+    "Microsoft Word": "com.microsoft.Word",
+    "Microsoft Excel": "com.microsoft.Excel"
+}
+
+class AppleScriptError(RuntimeError):
+    """An AppleScript (or JXA) script failed.
+    
+    Attributes:
+        script: Source or compiled script path that failed
+        stderr: Error message reported by osascript
+        caller: Bridge method the failing call was made from
+    """
+    
+    def __init__(self, stderr: str, script: Optional[str] = None, caller: Optional[str] = None):
+        super().__init__(f"AppleScript execution failed: {stderr}")
+        self.script = script
+        self.stderr = stderr
+        self.caller = caller
+
+def _script_caller() -> str:
+    """Name the public bridge method a failing script was run from.
+    
+    Only called on the error path. Coroutines awaiting each other are all on
+    the stack while one runs, so this walks past the private and execute_*
+    layers to the method that issued the script.
+    
+    Returns:
+        Method name, or "unknown"
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_code.co_name
+        if frame.f_globals.get("__name__") != __name__ or not (name.startswith("_") or name.startswith("execute")):
+            return name
+        frame = frame.f_back
+    return "unknown"
+
+def _raise_script_error(stderr: str, script: Optional[str]) -> None:
+    """Log a script failure once and raise it as an AppleScriptError.
+    
+    Args:
+        stderr: Error message reported by osascript
+        script: Source or compiled script path that failed
+    """
+    caller = _script_caller()
+    logger.error(f"AppleScript error in {caller}: {stderr}")
+    raise AppleScriptError(stderr, script=script, caller=caller)
+
+def _parse_slide_index(result: str) -> int:
+    """Read the slide index from a script's "SLIDE_IDX:<n>" result.
+    
+    The tag keeps the number recognizable whatever else surrounds it in the
+    script output.
+    
+    Args:
+        result: Script output
+    
+    Returns:
+        Slide index
+    """
+    return int(result.rsplit(":", 1)[-1].strip().strip('"'))
+
+def _utf8_literal(text: str) -> str:
+    """Render text as an AppleScript expression without quoting it.
+    
+    The text is embedded as hex-encoded UTF-8 data and coerced back to text,
+    so quotes, backslashes, line breaks and non-ASCII characters need no
+    escaping.
+    
+    Args:
+        text: Text to embed
+    
+    Returns:
+        AppleScript source evaluating to the text
+    """
+    if not text:
+        return '""'
+    return f"(«data utf8{text.encode('utf-8').hex().upper()}» as text)"
+
+class ScriptingBridgeBackend:
+    """In-process Apple event access to Office through PyObjC's ScriptingBridge.
+    
+    Sends Apple events directly instead of starting osascript. SBApplication
+    objects are not thread-safe, so all calls run on one dedicated thread.
+    """
+    
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scripting-bridge")
+        self._apps: Dict[str, Any] = {}
+    
+    def _app(self, app_name: str) -> Any:
+        """Return the cached SBApplication for an application name.
+        
+        Creating it does not launch the application; sending it events does.
+        
+        Args:
+            app_name: Application name, a key of _BUNDLE_IDS
+        
+        Returns:
+            SBApplication proxy
+        """
+        app = self._apps.get(app_name)
+        if app is None:
+            app = SBApplication.applicationWithBundleIdentifier_(_BUNDLE_IDS[app_name])
+            if app is None:
+                raise RuntimeError(f"{app_name} is not installed")
+            self._apps[app_name] = app
+        return app
+    
+    async def _call(self, func, *args) -> Any:
+        """Run a ScriptingBridge call on the backend's thread.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+        
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args))
+    
+    async def is_running(self, app_name: str) -> bool:
+        """Check whether an application is running, without launching it.
+        
+        Args:
+            app_name: Application name
+        
+        Returns:
+            True if the application is running
+        """
+        return await self._call(lambda: bool(self._app(app_name).isRunning()))
+    
+    async def version(self, app_name: str) -> str:
+        """Return an application's version string.
+        
+        Args:
+            app_name: Application name
+        
+        Returns:
+            Version string
+        """
+        return await self._call(lambda: str(self._app(app_name).version()))
+    
+    async def set_slide_text(
+        self,
+        app_name: str,
+        presentation_name: str,
+        slide_index: int,
+        shape_index: int,
+        text: str
+    ) -> None:
+        """Replace the text of a shape on a PowerPoint slide.
+        
+        Args:
+            app_name: PowerPoint application name
+            presentation_name: Name of the open presentation
+            slide_index: 1-based slide index
+            shape_index: 1-based shape index
+            text: New text
+        """
+        def set_text():
+            presentation = self._app(app_name).presentations().objectWithName_(presentation_name)
+            shape = presentation.slides()[slide_index - 1].shapes()[shape_index - 1]
+            shape.textFrame().textRange().setContent_(text)
+        
+        await self._call(set_text)
+
+class NSAppleScriptBackend:
+    """In-process AppleScript execution through PyObjC's NSAppleScript.
+    
+    Runs scripts without starting osascript, and keeps the most recently used
+    scripts compiled so running the same source again skips compilation.
+    NSAppleScript may only be used from the main thread, so scripts run
+    synchronously on it and block the event loop while they execute.
+    """
+    
+    def __init__(self, cache_size: int = NSAPPLESCRIPT_CACHE_SIZE):
+        self._scripts: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+        self.cache_size = cache_size
+    
+    def _compiled(self, source: str) -> Tuple[Any, Optional[str]]:
+        """Return the compiled script for a source, compiling it if needed.
+        
+        Args:
+            source: AppleScript source
+        
+        Returns:
+            (NSAppleScript, None), or (None, error message) if it does not compile
+        """
+        script = self._scripts.get(source)
+        if script is not None:
+            self._scripts.move_to_end(source)
+            return script, None
+        
+        script = NSAppleScript.alloc().initWithSource_(source)
+        ok, error = script.compileAndReturnError_(None)
+        if not ok:
+            return None, str(error.get("NSAppleScriptErrorMessage", error))
+        self._scripts[source] = script
+        if len(self._scripts) > self.cache_size:
+            self._scripts.popitem(last=False)
+        return script, None
+    
+    def execute(self, source: str) -> Tuple[str, Optional[str]]:
+        """Compile (or reuse) and run a script in-process.
+        
+        Must be called from the main thread. Errors are returned rather than
+        raised so the bridge can report them like osascript errors.
+        
+        Args:
+            source: AppleScript source
+        
+        Returns:
+            (output, None) on success, or ("", error message) on failure
+        """
+        script, error = self._compiled(source)
+        if script is None:
+            return "", error
+        
+        descriptor, error = script.executeAndReturnError_(None)
+        if descriptor is None:
+            return "", str(error.get("NSAppleScriptErrorMessage", error))
+        return _descriptor_text(descriptor), None
+
+def _descriptor_text(descriptor: Any) -> str:
+    """Render a script result the way osascript prints it.
+    
+    Args:
+        descriptor: NSAppleEventDescriptor returned by the script
+    
+    Returns:
+        Result as text; list items are joined with ", "
+    """
+    text = descriptor.stringValue()
+    if text is not None:
+        return str(text).strip()
+    count = descriptor.numberOfItems()
+    if count:
+        return ", ".join(_descriptor_text(descriptor.descriptorAtIndex_(i)) for i in range(1, count + 1))
+    return ""
+
 class AppleScriptBridge:
     """Bridge for communicating with Office applications via AppleScript."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 2):
         self.powerpoint_app = "Microsoft PowerPoint"
         self.word_app = "Microsoft Word"
+        self.excel_app = "Microsoft Excel"
+        self.script_dir = Path(tempfile.gettempdir()) / "office365_mcp" / "scripts"
+        self._compiled: Dict[str, Optional[Path]] = {}
+        # Pool of persistent osascript workers, bound to the event loop that
+        # started them; idle ones wait in the queue, and None in the queue
+        # tells a waiting caller that a pool slot was freed
+        self.max_workers = max_workers
+        self._coprocs: List[asyncio.subprocess.Process] = []
+        self._idle_coprocs: Optional["asyncio.Queue[Optional[asyncio.subprocess.Process]]"] = None
+        self._coproc_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._starting_coprocs = 0
+        self._request_ids = 0
+        # submit()/reap(): queued scripts, drained by one pump task per worker
+        self._submissions: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._completions: Dict[int, asyncio.Future] = {}
+        self._pumps: List[asyncio.Task] = []
+        self._submit_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._submission_ids = 0
+        self._status_cache: Dict[str, Tuple[float, bool]] = {}
+        # In-process backend for the calls it covers, when PyObjC has it
+        self._scripting_bridge = ScriptingBridgeBackend() if SBApplication is not None else None
+        # Opt-in: run AppleScript in-process with NSAppleScript instead of
+        # the osascript workers
+        self.use_nsapplescript = False
+        self._nsapplescript: Optional[NSAppleScriptBackend] = None
+    
+    def _nsapplescript_backend(self) -> Optional[NSAppleScriptBackend]:
+        """Return the NSAppleScript backend if it is enabled and usable here.
+        
+        Returns:
+            The backend, or None when it is disabled, PyObjC is missing or the
+            caller is not on the main thread
+        """
+        if not self.use_nsapplescript or NSAppleScript is None:
+            return None
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        if self._nsapplescript is None:
+            self._nsapplescript = NSAppleScriptBackend()
+        return self._nsapplescript
     
     async def execute_applescript(self, script: str) -> str:
         """Execute an AppleScript and return the result.
         
+        Scripts run in a pool of up to ``max_workers`` persistent osascript
+        workers, so only a worker's first call pays for process startup. If
+        no worker can be used the script runs in a fresh osascript process;
+        a worker that fails after receiving the script raises instead, since
+        the script may already have run.
+        With ``use_nsapplescript`` set, scripts instead run in-process through
+        NSAppleScript on the main thread, compiled once per distinct source.
+        
         Args:
             script: AppleScript code to execute
+        
+        Returns:
+            Script output as string
+        
+        Raises:
+            AppleScriptError: If the script fails; already logged
+        """
+        nsapplescript = self._nsapplescript_backend()
+        if nsapplescript is not None:
+            result, error = nsapplescript.execute(script)
+            if error is not None:
+                _raise_script_error(error, script)
+            return result
+        
+        try:
+            return await self._run_in_coprocess({"script": script})
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"osascript worker unavailable, running script directly: {e}")
+        return await self._run_osascript("-", source=script)
+    
+    async def execute_applescript_void(self, script: str) -> None:
+        """Execute an AppleScript whose result is not needed.
+        
+        Same as execute_applescript, but the result is never formatted or
+        read back, and a fallback osascript process writes its stdout to
+        /dev/null rather than a pipe.
+        
+        Args:
+            script: AppleScript code to execute
+        
+        Raises:
+            AppleScriptError: If the script fails; already logged
+        """
+        nsapplescript = self._nsapplescript_backend()
+        if nsapplescript is not None:
+            _, error = nsapplescript.execute(script)
+            if error is not None:
+                _raise_script_error(error, script)
+            return
+        
+        try:
+            await self._run_in_coprocess({"script": script, "quiet": True})
+            return
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"osascript worker unavailable, running script directly: {e}")
+        await self._run_osascript("-", source=script, discard_output=True)
+    
+    def submit(self, script: str) -> int:
+        """Queue a script for execution and return without waiting for it.
+        
+        Queued scripts are fed to the osascript workers in submission order,
+        several per write when they pile up, while the caller carries on;
+        collect results with reap/reap_many.
+        Must be called from a running event loop.
+        
+        Args:
+            script: AppleScript code to execute
+        
+        Returns:
+            Submission ID to pass to reap
+        """
+        loop = asyncio.get_running_loop()
+        if self._submit_loop is not loop:
+            self._submissions = asyncio.Queue()
+            self._completions = {}
+            self._pumps = []
+            self._submit_loop = loop
+        if not self._pumps:
+            self._pumps = [loop.create_task(self._pump()) for _ in range(max(1, self.max_workers))]
+        
+        self._submission_ids += 1
+        submission_id = self._submission_ids
+        future = loop.create_future()
+        self._completions[submission_id] = future
+        self._submissions.put_nowait((script, future))
+        return submission_id
+    
+    async def reap(self, submission_id: int) -> str:
+        """Wait for a submitted script and return its result.
+        
+        Args:
+            submission_id: ID returned by submit
+        
+        Returns:
+            Script output as string
+        """
+        future = self._completions.get(submission_id)
+        if future is None:
+            raise ValueError(f"Submission {submission_id} not found")
+        try:
+            return await future
+        finally:
+            self._completions.pop(submission_id, None)
+    
+    async def reap_many(self, submission_ids: List[int]) -> List[str]:
+        """Wait for several submitted scripts.
+        
+        Args:
+            submission_ids: IDs returned by submit
+        
+        Returns:
+            Script outputs, in the order of the IDs
+        """
+        return list(await asyncio.gather(*(self.reap(i) for i in submission_ids)))
+    
+    async def _pump(self) -> None:
+        """Run queued submissions and resolve their futures.
+        
+        Takes everything already queued, up to SUBMIT_BATCH_SIZE scripts, and
+        writes it to one worker in a single exchange.
+        """
+        while True:
+            batch = [await self._submissions.get()]
+            while len(batch) < SUBMIT_BATCH_SIZE and not self._submissions.empty():
+                batch.append(self._submissions.get_nowait())
+            batch = [(script, future) for script, future in batch if not future.cancelled()]
+            if not batch:
+                continue
             
+            try:
+                replies = await self._exchange([{"script": script} for script, _ in batch])
+            except (OSError, EOFError, ValueError) as e:
+                # No usable worker: fall back to running each script alone
+                logger.warning(f"osascript worker unavailable for submitted batch: {e}")
+                replies = None
+            except AppleScriptError as e:
+                # The worker failed after receiving the batch, so any of the
+                # scripts may have run; none are retried
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for index, (script, future) in enumerate(batch):
+                try:
+                    if replies is None:
+                        result = await self.execute_applescript(script)
+                    elif "error" in replies[index]:
+                        _raise_script_error(replies[index]["error"], script)
+                    else:
+                        result = replies[index].get("result", "").strip()
+                except Exception as e:
+                    if not future.cancelled():
+                        future.set_exception(e)
+                else:
+                    if not future.cancelled():
+                        future.set_result(result)
+    
+    async def close(self) -> None:
+        """Stop all persistent osascript workers and submission pumps."""
+        pumps, self._pumps = self._pumps, []
+        for pump in pumps:
+            pump.cancel()
+        procs, self._coprocs = self._coprocs, []
+        # Workers started on another event loop can be killed but not awaited
+        same_loop = self._coproc_loop is asyncio.get_running_loop()
+        self._coproc_loop = None
+        self._starting_coprocs = 0
+        for proc in procs:
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                if same_loop:
+                    await proc.wait()
+    
+    async def _run_in_coprocess(self, request: Dict[str, Any]) -> str:
+        """Run a script in one of the persistent osascript workers.
+        
+        Args:
+            request: {"script": source} or {"path": .scpt path, "args": argv}
+        
         Returns:
             Script output as string
         """
+        reply = (await self._exchange([request]))[0]
+        if "error" in reply:
+            _raise_script_error(reply["error"], request.get("script") or request.get("path"))
+        
+        return reply.get("result", "").strip()
+    
+    async def _exchange(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send requests to one worker in a single write and read the replies.
+        
+        The worker handles its input line by line, so several requests can be
+        queued on its stdin at once and answered in order.
+        
+        Args:
+            requests: Request dicts as taken by _run_in_coprocess
+        
+        Returns:
+            Raw reply dicts, in request order
+        
+        Raises:
+            OSError, EOFError, ValueError: If no worker could take the requests;
+                they were not sent and may be run another way
+            AppleScriptError: If the worker failed after the requests were
+                sent; they may have run, so they must not be run again
+        """
+        proc = await self._checkout_coprocess()
+        healthy = False
         try:
-            # Use osascript to execute AppleScript
+            first_id = self._request_ids + 1
+            self._request_ids += len(requests)
+            proc.stdin.write(b"".join(
+                json.dumps({"id": first_id + offset, **request}).encode() + b"\n"
+                for offset, request in enumerate(requests)
+            ))
+            await proc.stdin.drain()
+            
+            replies = []
+            try:
+                for offset in range(len(requests)):
+                    line = await proc.stdout.readline()
+                    if not line:
+                        raise EOFError("osascript worker exited")
+                    reply = json.loads(line)
+                    if reply.get("id") != first_id + offset:
+                        raise ValueError("osascript worker reply out of sequence")
+                    replies.append(reply)
+            except (OSError, EOFError, ValueError) as e:
+                script = None
+                if len(requests) == 1:
+                    script = requests[0].get("script") or requests[0].get("path")
+                _raise_script_error(f"osascript worker failed after receiving the script: {e}", script)
+            healthy = True
+        finally:
+            # A worker interrupted mid-request (error or cancellation) may
+            # still answer later, so it is replaced rather than reused
+            if healthy:
+                self._idle_coprocs.put_nowait(proc)
+            else:
+                self._discard_coprocess(proc)
+        
+        return replies
+    
+    async def execute_compiled(self, name: str, *args: str) -> str:
+        """Execute one of the parameterized scripts with the given arguments.
+        
+        The script is compiled to a .scpt on first use so later calls skip
+        parsing, and runs in a persistent worker when one is available. If
+        compilation fails it is run from source instead.
+        
+        Args:
+            name: Key of the script in _COMPILED_SOURCES
+            *args: Values passed to the script's run handler as argv
+        
+        Returns:
+            Script output as string
+        
+        Raises:
+            AppleScriptError: If the script fails; already logged
+        """
+        path = await self._compiled_script(name)
+        if path is not None:
+            try:
+                return await self._run_in_coprocess({"path": str(path), "args": list(args)})
+            except (OSError, EOFError, ValueError) as e:
+                logger.warning(f"osascript worker unavailable, running '{name}' directly: {e}")
+            return await self._run_osascript(str(path), *args)
+        return await self._run_osascript("-", *args, source=_COMPILED_SOURCES[name])
+    
+    async def execute_jxa(self, script: str, *args: str) -> str:
+        """Execute a JavaScript for Automation script.
+        
+        Args:
+            script: JXA source with a ``run(argv)`` function
+            *args: Values passed to ``run`` as argv
+        
+        Returns:
+            Script output as string
+        
+        Raises:
+            AppleScriptError: If the script fails; already logged
+        """
+        return await self._run_osascript("-l", "JavaScript", "-", *args, source=script)
+    
+    async def run_batch(self, steps: List[str]) -> List[str]:
+        """Execute several scripts as one AppleScript call.
+        
+        Each step runs as its own script object, so steps may use ``return``
+        and their own ``tell`` blocks. Execution stops at the first failing
+        step, as it would when running the steps one by one.
+        
+        Args:
+            steps: AppleScript sources, executed in order
+        
+        Returns:
+            Output of each step as string ("" for steps without a result)
+        """
+        if not steps:
+            return []
+        
+        parts = ["set batchResults to {}"]
+        for index, step in enumerate(steps):
+            parts.append(f"script batchStep{index}\n{step}\nend script")
+            parts.append(f'''set stepResult to missing value
+set stepResult to run batchStep{index}
+try
+    set end of batchResults to (stepResult as text)
+on error
+    set end of batchResults to ""
+end try''')
+        parts.append(f'''set AppleScript's text item delimiters to "{_BATCH_MARKER}"
+return batchResults as text''')
+        
+        result = await self.execute_applescript("\n".join(parts))
+        return [output.strip() for output in result.split(_BATCH_MARKER)]
+    
+    async def _compiled_script(self, name: str) -> Optional[Path]:
+        """Return the compiled script for a name, compiling it on first use.
+        
+        Args:
+            name: Key of the script in _COMPILED_SOURCES
+        
+        Returns:
+            Path to the .scpt file, or None if it could not be compiled
+        """
+        if name in self._compiled:
+            return self._compiled[name]
+        
+        # Named after the source, so files from earlier runs are reused until
+        # the script changes
+        source_hash = hashlib.sha1(_COMPILED_SOURCES[name].encode()).hexdigest()[:12]
+        path: Optional[Path] = self.script_dir / f"{name}-{source_hash}.scpt"
+        if path.exists():
+            self._compiled[name] = path
+            return path
+        
+        try:
+            self.script_dir.mkdir(parents=True, exist_ok=True)
+            # Compiled under a scratch name so a failed run leaves no file behind
+            partial = path.with_name(f"{path.stem}.partial.scpt")
             process = await asyncio.create_subprocess_exec(
-                "osascript", "-e", script,
+                "osacompile", "-o", str(partial), "-e", _COMPILED_SOURCES[name],
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            
-            stdout, stderr = await process.communicate()
-            
+            _, stderr = await process.communicate()
             if process.returncode != 0:
-                error_msg = stderr.decode().strip()
-                logger.error(f"AppleScript error: {error_msg}")
-                raise RuntimeError(f"AppleScript execution failed: {error_msg}")
-            
-            return stdout.decode().strip()
-            
+                raise RuntimeError(stderr.decode().strip())
+            partial.replace(path)
+            logger.debug("Compiled AppleScript '%s' to %s", name, path)
         except Exception as e:
-            logger.error(f"Failed to execute AppleScript: {e}")
+            logger.warning(f"Could not compile AppleScript '{name}', running from source: {e}")
+            path = None
+        
+        self._compiled[name] = path
+        return path
+    
+    async def _checkout_coprocess(self) -> asyncio.subprocess.Process:
+        """Take an idle osascript worker, starting one if the pool has room.
+        
+        Returns:
+            A running worker process, owned by the caller until returned
+        """
+        loop = asyncio.get_running_loop()
+        if self._coproc_loop is not loop:
+            # Processes, streams and queues cannot be shared across event
+            # loops, so workers started on an earlier loop are stopped
+            for proc in self._coprocs:
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+            self._coprocs = []
+            self._starting_coprocs = 0
+            self._idle_coprocs = asyncio.Queue()
+            self._coproc_loop = loop
+        
+        while True:
+            pool_size = len(self._coprocs) + self._starting_coprocs
+            if self._idle_coprocs.empty() and pool_size < self.max_workers:
+                return await self._start_coprocess()
+            proc = await self._idle_coprocs.get()
+            if proc is None:
+                # A slot was freed; check the pool size again
+                continue
+            if proc.returncode is None:
+                return proc
+            # Died while idle; drop it so the pool can start a replacement
+            self._discard_coprocess(proc)
+    
+    async def _start_coprocess(self) -> asyncio.subprocess.Process:
+        """Start a new osascript worker and add it to the pool.
+        
+        Returns:
+            The new worker process
+        """
+        # Count the slot before awaiting so concurrent callers see it taken
+        self._starting_coprocs += 1
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "osascript", "-l", "JavaScript", "-e", _COPROCESS_SOURCE,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_COPROCESS_LINE_LIMIT
+            )
+        except BaseException:
+            self._starting_coprocs -= 1
+            self._idle_coprocs.put_nowait(None)
             raise
+        self._starting_coprocs -= 1
+        self._coprocs.append(proc)
+        return proc
     
+    def _discard_coprocess(self, proc: asyncio.subprocess.Process) -> None:
+        """Remove a worker from the pool, killing it if still running.
+        
+        Wakes a caller waiting for an idle worker, so it can start a
+        replacement in the freed slot.
+        
+        Args:
+            proc: Worker process
+        """
+        if proc in self._coprocs:
+            self._coprocs.remove(proc)
+            self._idle_coprocs.put_nowait(None)
+        if proc.returncode is None:
+            proc.kill()
+    
+    async def _run_osascript(
+        self,
+        *argv: str,
+        source: Optional[str] = None,
+        discard_output: bool = False
+    ) -> str:
+        """Run osascript with the given arguments.
+        
+        Args:
+            *argv: Arguments for osascript; use "-" as the program file when
+                passing ``source``
+            source: Script source written to osascript's stdin, which keeps
+                large scripts out of the argument list
+            discard_output: Send stdout to /dev/null and return ""
+        
+        Returns:
+            Script output as string
+        """
+        process = await asyncio.create_subprocess_exec(
+            "osascript", *argv,
+            stdin=asyncio.subprocess.PIPE if source is not None else None,
+            stdout=asyncio.subprocess.DEVNULL if discard_output else asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        stdout, stderr = await process.communicate(source.encode() if source is not None else None)
+        
+        if process.returncode != 0:
+            _raise_script_error(stderr.decode().strip(), source if source is not None else argv[0])
+        
+        return stdout.decode().strip() if stdout is not None else ""
+
     async def check_powerpoint_status(self) -> bool:
         """Check if PowerPoint is available and running.
         
         Returns:
             True if PowerPoint is available
         """
-        try:
-            script = f'''
-            tell application "System Events"
-                return (name of processes) contains "{self.powerpoint_app}"
-            end tell
-            '''
-            
-            result = await self.execute_applescript(script)
-            return result.lower() == "true"
-            
-        except Exception as e:
-            logger.warning(f"Could not check PowerPoint status: {e}")
-            return False
+        return await self._check_app_running(self.powerpoint_app)
     
     async def check_word_status(self) -> bool:
         """Check if Word is available and running.
@@ -79,20 +1015,74 @@ class AppleScriptBridge:
         Returns:
             True if Word is available
         """
+        return await self._check_app_running(self.word_app)
+    
+    async def check_excel_status(self) -> bool:
+        """Check if Excel is available and running.
+        
+        Returns:
+            True if Excel is available
+        """
+        return await self._check_app_running(self.excel_app)
+    
+    async def _check_app_running(self, app_name: str) -> bool:
+        """Ask whether an application is running, without launching it.
+        
+        Answers are reused for STATUS_CACHE_TTL seconds, since callers tend to
+        repeat the check in quick succession.
+        
+        Args:
+            app_name: Application process name
+        
+        Returns:
+            True if the application is running
+        """
+        cached = self._status_cache.get(app_name)
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        
         try:
-            script = f'''
-            tell application "System Events"
-                return (name of processes) contains "{self.word_app}"
-            end tell
-            '''
-            
-            result = await self.execute_applescript(script)
-            return result.lower() == "true"
-            
+            if self._scripting_bridge is not None:
+                running = await self._scripting_bridge.is_running(app_name)
+            else:
+                # Reads the running property only; no System Events process walk
+                script = f'return application "{app_name}" is running'
+                
+                result = await self.execute_applescript(script)
+                running = result.lower() == "true"
+            self._status_cache[app_name] = (time.monotonic(), running)
+            return running
+        
         except Exception as e:
-            logger.warning(f"Could not check Word status: {e}")
+            logger.warning(f"Could not check {app_name} status: {e}")
             return False
     
+    async def _app_version(self, app_name: str) -> str:
+        """Return an application's version string.
+        
+        Args:
+            app_name: Application name
+        
+        Returns:
+            Version string
+        """
+        if self._scripting_bridge is not None:
+            return await self._scripting_bridge.version(app_name)
+        return await self.execute_applescript(f'tell application "{app_name}" to return version')
+    
+    async def check_office_status(self) -> Dict[str, bool]:
+        """Check PowerPoint, Word and Excel concurrently.
+        
+        Returns:
+            Dict mapping "powerpoint", "word" and "excel" to their availability
+        """
+        powerpoint_status, word_status, excel_status = await asyncio.gather(
+            self.check_powerpoint_status(),
+            self.check_word_status(),
+            self.check_excel_status()
+        )
+        return {"powerpoint": powerpoint_status, "word": word_status, "excel": excel_status}
+    
     async def launch_powerpoint(self) -> bool:
         """Launch PowerPoint application.
         
@@ -100,13 +1090,8 @@ class AppleScriptBridge:
             True if successfully launched
         """
         try:
-            script = f'''
-            tell application "{self.powerpoint_app}"
-                activate
-            end tell
-            '''
-            
-            await self.execute_applescript(script)
+            await self.execute_compiled("activate", self.powerpoint_app)
+            self._status_cache.pop(self.powerpoint_app, None)
             logger.info("PowerPoint launched successfully")
             return True
             
@@ -121,13 +1106,8 @@ class AppleScriptBridge:
             True if successfully launched
         """
         try:
-            script = f'''
-            tell application "{self.word_app}"
-                activate
-            end tell
-            '''
-            
-            await self.execute_applescript(script)
+            await self.execute_compiled("activate", self.word_app)
+            self._status_cache.pop(self.word_app, None)
             logger.info("Word launched successfully")
             return True
             
@@ -135,6 +1115,22 @@ class AppleScriptBridge:
             logger.error(f"Failed to launch Word: {e}")
             return False
     
+    async def launch_excel(self) -> bool:
+        """Launch Excel application.
+        
+        Returns:
+            True if successfully launched
+        """
+        try:
+            await self.execute_compiled("activate", self.excel_app)
+            self._status_cache.pop(self.excel_app, None)
+            logger.info("Excel launched successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to launch Excel: {e}")
+            return False
+    
     async def open_powerpoint_file(self, file_path: str) -> bool:
         """Open a PowerPoint file.
         
@@ -145,24 +1141,33 @@ class AppleScriptBridge:
             True if successfully opened
         """
         try:
-            # Ensure PowerPoint is running
-            await self.launch_powerpoint()
-            
-            script = f'''
-            tell application "{self.powerpoint_app}"
-                open POSIX file "{file_path}"
-                activate
-            end tell
-            '''
-            
-            await self.execute_applescript(script)
-            logger.info(f"Opened PowerPoint file: {file_path}")
+            await self.execute_compiled("open_document", self.powerpoint_app, file_path)
+            logger.info("Opened PowerPoint file: %s", file_path)
             return True
             
         except Exception as e:
             logger.error(f"Failed to open PowerPoint file: {e}")
             return False
     
+    async def export_pdf(self, input_path: str, output_path: str) -> bool:
+        """Export a PowerPoint file to PDF through PowerPoint.
+        
+        Args:
+            input_path: Path to the .pptx file
+            output_path: Path of the PDF to write
+        
+        Returns:
+            True if the PDF was written
+        """
+        try:
+            await self.execute_compiled("export_pdf", input_path, output_path)
+            logger.info("Exported %s to PDF: %s", input_path, output_path)
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to export PDF: {e}")
+            return False
+    
     async def open_word_file(self, file_path: str) -> bool:
         """Open a Word file.
         
@@ -173,23 +1178,89 @@ class AppleScriptBridge:
             True if successfully opened
         """
         try:
-            # Ensure Word is running
-            await self.launch_word()
+            await self.execute_compiled("open_document", self.word_app, file_path)
+            logger.info("Opened Word file: %s", file_path)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to open Word file: {e}")
+            return False
+    
+    async def open_excel_file(self, file_path: str) -> bool:
+        """Open an Excel file.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            True if successfully opened
+        """
+        try:
+            await self.execute_compiled("open_document", self.excel_app, file_path)
+            logger.info("Opened Excel file: %s", file_path)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to open Excel file: {e}")
+            return False
+    
+    async def write_range(
+        self,
+        workbook_name: str,
+        sheet_name: str,
+        start_cell: str,
+        data: List[List[Any]]
+    ) -> Dict[str, Any]:
+        """Write a 2D block of values to Excel in a single AppleScript call.
+        
+        The whole block is sent as one list literal assigned to the target
+        range, so the cost is one osascript spawn regardless of cell count.
+        
+        Args:
+            workbook_name: Name of the open workbook in Excel
+            sheet_name: Name of the worksheet
+            start_cell: Top-left cell reference (e.g., 'A1')
+            data: 2D list of values; short rows are padded with blanks
+            
+        Returns:
+            Dict with operation status
+        """
+        try:
+            col_letter, start_row = coordinate_from_string(start_cell)
+            start_col = column_index_from_string(col_letter)
+            width = max(len(row) for row in data)
+            end_cell = f"{get_column_letter(start_col + width - 1)}{start_row + len(data) - 1}"
+            target = f"{col_letter}{start_row}:{end_cell}"
+            
+            rows = []
+            for row in data:
+                cells = [_applescript_literal(value) for value in row]
+                cells.extend(['""'] * (width - len(cells)))
+                rows.append("{" + ", ".join(cells) + "}")
+            values = "{" + ", ".join(rows) + "}"
             
             script = f'''
-            tell application "{self.word_app}"
-                open POSIX file "{file_path}"
-                activate
+            tell application "{self.excel_app}"
+                tell worksheet {_utf8_literal(sheet_name)} of workbook {_utf8_literal(workbook_name)}
+                    set value of range "{target}" to {values}
+                end tell
             end tell
             '''
             
-            await self.execute_applescript(script)
-            logger.info(f"Opened Word file: {file_path}")
-            return True
+            await self.execute_applescript_void(script)
+            logger.info("Wrote range %s in %s", target, workbook_name)
+            
+            return {
+                "status": "success",
+                "workbook_name": workbook_name,
+                "sheet_name": sheet_name,
+                "range": target,
+                "method": "applescript"
+            }
             
         except Exception as e:
-            logger.error(f"Failed to open Word file: {e}")
-            return False
+            logger.error(f"Failed to write range via AppleScript: {e}")
+            raise
     
     async def create_powerpoint_presentation(self, title: str = "New Presentation") -> Dict[str, Any]:
         """Create a new PowerPoint presentation via AppleScript.
@@ -201,15 +1272,14 @@ class AppleScriptBridge:
             Dict with presentation information
         """
         try:
-            await self.launch_powerpoint()
-            
             script = f'''
             tell application "{self.powerpoint_app}"
+                activate
                 set newPres to make new presentation
                 tell newPres
                     set slide1 to make new slide at beginning
                     tell slide1
-                        set title of text range of text frame of shape 1 to "{title}"
+                        set title of text range of text frame of shape 1 to {_utf8_literal(title)}
                     end tell
                 end tell
                 return name of newPres
@@ -217,7 +1287,7 @@ class AppleScriptBridge:
             '''
             
             result = await self.execute_applescript(script)
-            logger.info(f"Created PowerPoint presentation via AppleScript: {title}")
+            logger.info("Created PowerPoint presentation via AppleScript: %s", title)
             
             return {
                 "status": "success",
@@ -230,56 +1300,102 @@ class AppleScriptBridge:
             logger.error(f"Failed to create PowerPoint presentation via AppleScript: {e}")
             raise
     
+    async def build_presentation(
+        self,
+        title: str,
+        slides: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Create a whole PowerPoint deck in a single JXA call.
+        
+        Args:
+            title: Presentation title, placed on the first slide
+            slides: One dict per further slide with optional "title" and
+                "content" text
+        
+        Returns:
+            Dict with presentation information
+        """
+        try:
+            spec = {"title": title, "slides": [dict(slide) for slide in slides]}
+            result = await self.execute_jxa(_BUILD_PRESENTATION_JXA, json.dumps(spec))
+            logger.info("Built PowerPoint presentation via JXA: %s (%s slides)", title, len(slides) + 1)
+            
+            return {
+                "status": "success",
+                "title": title,
+                "slide_count": len(slides) + 1,
+                "applescript_name": result,
+                "method": "jxa"
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to build PowerPoint presentation via JXA: {e}")
+            raise
+    
     async def add_slide_to_presentation(self, presentation_name: str, layout: str = "Title and Content") -> Dict[str, Any]:
         """Add a slide to a PowerPoint presentation via AppleScript.
         
         Args:
             presentation_name: Name of the presentation
-            layout: Slide layout
-            
+            layout: Slide layout; not applied, the slide gets PowerPoint's
+                default layout
+        
         Returns:
             Dict with slide information
         """
         try:
-            # Map layout names to PowerPoint constants
-            layout_map = {
-                "Title Slide": "title slide",
-                "Title and Content": "title and content",
-                "Section Header": "section header",
-                "Two Content": "two content",
-                "Comparison": "comparison",
-                "Title Only": "title only",
-                "Blank": "blank",
-                "Content with Caption": "content with caption",
-                "Picture with Caption": "picture with caption"
-            }
+            result = await self.execute_compiled("add_slide", presentation_name)
+            slide_index = _parse_slide_index(result)
             
-            ppt_layout = layout_map.get(layout, "title and content")
+            logger.info("Added slide to presentation %s", presentation_name)
             
-            script = f'''
-            tell application "{self.powerpoint_app}"
-                tell presentation "{presentation_name}"
-                    set newSlide to make new slide at end
-                    return index of newSlide
-                end tell
-            end tell
-            '''
+            return {
+                "status": "success",
+                "presentation_name": presentation_name,
+                "slide_index": slide_index,
+                "method": "applescript"
+            }
             
-            result = await self.execute_applescript(script)
-            slide_index = int(result)
+        except Exception as e:
+            logger.error(f"Failed to add slide via AppleScript: {e}")
+            raise
+    
+    async def add_slide_with_text(
+        self,
+        presentation_name: str,
+        layout: str = "Title and Content",
+        title: str = "",
+        content: str = ""
+    ) -> Dict[str, Any]:
+        """Add a slide and fill its title and content in one AppleScript call.
+        
+        Args:
+            presentation_name: Name of the presentation
+            layout: Slide layout; not applied, the slide gets PowerPoint's
+                default layout
+            title: Text for the title placeholder (shape 1)
+            content: Text for the content placeholder (shape 2)
+        
+        Returns:
+            Dict with slide information
+        """
+        try:
+            # Text travels as script arguments, so it needs no escaping
+            result = await self.execute_compiled("add_slide_with_text", presentation_name, title, content)
+            slide_index = _parse_slide_index(result)
             
-            logger.info(f"Added slide to presentation {presentation_name}")
+            logger.info("Added slide with text to presentation %s", presentation_name)
             
             return {
                 "status": "success",
                 "presentation_name": presentation_name,
                 "slide_index": slide_index,
-                "layout": layout,
+                "text_length": len(title) + len(content),
                 "method": "applescript"
             }
-            
+        
         except Exception as e:
-            logger.error(f"Failed to add slide via AppleScript: {e}")
+            logger.error(f"Failed to add slide with text via AppleScript: {e}")
             raise
     
     async def add_text_to_slide(
@@ -301,26 +1417,26 @@ class AppleScriptBridge:
             Dict with operation status
         """
         try:
-            # Escape quotes in text
-            escaped_text = text.replace('"', '\\"')
-            
             if placeholder == "title":
                 shape_index = 1  # Title is usually shape 1
             else:
                 shape_index = 2  # Content is usually shape 2
             
-            script = f'''
-            tell application "{self.powerpoint_app}"
-                tell presentation "{presentation_name}"
-                    tell slide {slide_index}
-                        set text range of text frame of shape {shape_index} to "{escaped_text}"
-                    end tell
-                end tell
-            end tell
-            '''
-            
-            await self.execute_applescript(script)
-            logger.info(f"Added text to slide {slide_index} in {presentation_name}")
+            sent = False
+            if self._scripting_bridge is not None:
+                try:
+                    await self._scripting_bridge.set_slide_text(
+                        self.powerpoint_app, presentation_name, slide_index, shape_index, text
+                    )
+                    sent = True
+                except Exception as e:
+                    logger.warning(f"ScriptingBridge call failed, using AppleScript: {e}")
+            
+            if not sent:
+                await self.execute_compiled(
+                    "set_slide_text", presentation_name, str(slide_index), str(shape_index), text
+                )
+            logger.info("Added text to slide %s in %s", slide_index, presentation_name)
             
             return {
                 "status": "success",
@@ -352,25 +1468,18 @@ class AppleScriptBridge:
             Dict with operation status
         """
         try:
-            # Map format to PowerPoint save format
-            format_map = {
-                "pptx": "save as PowerPoint presentation",
-                "pdf": "save as PDF",
-                "ppt": "save as PowerPoint 97-2004 presentation"
-            }
-            
-            save_format = format_map.get(format.lower(), "save as PowerPoint presentation")
+            save_format = _PPT_FORMAT_MAP.get(format.lower(), "save as PowerPoint presentation")
             
             script = f'''
             tell application "{self.powerpoint_app}"
-                tell presentation "{presentation_name}"
+                tell presentation {_utf8_literal(presentation_name)}
                     {save_format} in POSIX file "{file_path}"
                 end tell
             end tell
             '''
             
-            await self.execute_applescript(script)
-            logger.info(f"Saved presentation {presentation_name} to {file_path}")
+            await self.execute_applescript_void(script)
+            logger.info("Saved presentation %s to %s", presentation_name, file_path)
             
             return {
                 "status": "success",
@@ -394,20 +1503,20 @@ class AppleScriptBridge:
             Dict with document information
         """
         try:
-            await self.launch_word()
-            
+            content = _utf8_literal(title + "\n\n")
             script = f'''
             tell application "{self.word_app}"
+                activate
                 set newDoc to make new document
                 tell newDoc
-                    set content to "{title}\\n\\n"
+                    set content to {content}
                 end tell
                 return name of newDoc
             end tell
             '''
             
             result = await self.execute_applescript(script)
-            logger.info(f"Created Word document via AppleScript: {title}")
+            logger.info("Created Word document via AppleScript: %s", title)
             
             return {
                 "status": "success",
@@ -437,19 +1546,9 @@ class AppleScriptBridge:
             Dict with operation status
         """
         try:
-            # Escape quotes in text
-            escaped_text = text.replace('"', '\\"')
-            
-            script = f'''
-            tell application "{self.word_app}"
-                tell document "{document_name}"
-                    set content to (content & "{escaped_text}\\n")
-                end tell
-            end tell
-            '''
-            
-            await self.execute_applescript(script)
-            logger.info(f"Added text to document {document_name}")
+            # Insert at the end instead of reading and rewriting all content
+            await self.execute_compiled("append_document_text", document_name, text + "\n")
+            logger.info("Added text to document %s", document_name)
             
             return {
                 "status": "success",
@@ -480,27 +1579,18 @@ class AppleScriptBridge:
             Dict with operation status
         """
         try:
-            # Map format to Word save format
-            format_map = {
-                "docx": "save as Word document",
-                "pdf": "save as PDF",
-                "doc": "save as Word 97-2004 document",
-                "rtf": "save as rich text format",
-                "txt": "save as plain text"
-            }
-            
-            save_format = format_map.get(format.lower(), "save as Word document")
+            save_format = _WORD_FORMAT_MAP.get(format.lower(), "save as Word document")
             
             script = f'''
             tell application "{self.word_app}"
-                tell document "{document_name}"
+                tell document {_utf8_literal(document_name)}
                     {save_format} in POSIX file "{file_path}"
                 end tell
             end tell
             '''
             
-            await self.execute_applescript(script)
-            logger.info(f"Saved document {document_name} to {file_path}")
+            await self.execute_applescript_void(script)
+            logger.info("Saved document %s to %s", document_name, file_path)
             
             return {
                 "status": "success",
@@ -521,30 +1611,15 @@ class AppleScriptBridge:
             Dict with version information
         """
         try:
-            powerpoint_version = "unknown"
-            word_version = "unknown"
-            
-            # Get PowerPoint version
-            try:
-                script = f'''
-                tell application "{self.powerpoint_app}"
-                    return version
-                end tell
-                '''
-                powerpoint_version = await self.execute_applescript(script)
-            except Exception:
-                pass
-            
-            # Get Word version
-            try:
-                script = f'''
-                tell application "{self.word_app}"
-                    return version
-                end tell
-                '''
-                word_version = await self.execute_applescript(script)
-            except Exception:
-                pass
+            # Probe both applications concurrently; a failed probe is "unknown"
+            powerpoint_version, word_version = [
+                "unknown" if isinstance(version, Exception) else version
+                for version in await asyncio.gather(
+                    self._app_version(self.powerpoint_app),
+                    self._app_version(self.word_app),
+                    return_exceptions=True
+                )
+            ]
             
             return {
                 "powerpoint_version": powerpoint_version,
@@ -560,3 +1635,15 @@ class AppleScriptBridge:
                 "applescript_available": False,
                 "error": str(e)
             }
+
+@functools.lru_cache(maxsize=1)
+def get_bridge() -> AppleScriptBridge:
+    """Return the process-wide AppleScript bridge.
+    
+    Sharing one instance means each parameterized script is compiled once
+    per process rather than once per controller.
+    
+    Returns:
+        The shared AppleScriptBridge
+    """
+    return AppleScriptBridge()
@@ -6,48 +6,115 @@ By: Adam Bluhm
 """
 
 import asyncio
+import functools
+import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # MCP imports - using the correct import path
 from mcp.server.fastmcp import FastMCP
-from mcp import Tool
 
-# Local imports
-from controllers.powerpoint_controller import PowerPointController
-from controllers.word_controller import WordController
-from controllers.excel_controller import ExcelController
-from integrations.applescript_bridge import AppleScriptBridge
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio loop is used
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # optional; the standard json module is used instead
+    orjson = None
+
+# Local imports; the controllers are imported on first use
+from integrations.applescript_bridge import get_bridge
 from utils.config import Config
 from utils.logger import setup_logger
-from utils.validators import validate_input
+from utils.registry import ActiveRegistry
 
 # Initialize logging
 logger = setup_logger(__name__)
 
+config = Config()
+
+# Install uvloop before the server creates its event loop
+if uvloop is not None and config.get("use_uvloop"):
+    uvloop.install()
+
 # Initialize FastMCP server
 mcp = FastMCP("Office365 MCP Server")
 
-# Initialize controllers
-powerpoint = PowerPointController()
-word = WordController()
-excel = ExcelController()
-applescript = AppleScriptBridge()
-config = Config()
-
-# Track active documents/presentations/workbooks
-active_presentations: Dict[str, Any] = {}
-active_documents: Dict[str, Any] = {}
-active_workbooks: Dict[str, Any] = {}
+# Shared AppleScript bridge; its worker pool starts lazily on first use
+applescript = get_bridge()
+applescript.max_workers = config.get("applescript_workers")
+applescript.use_nsapplescript = config.get("use_nsapplescript")
+
+# Controllers are created on first use, so startup does not import
+# python-pptx, python-docx and openpyxl for tools that are never called
+@functools.lru_cache(maxsize=None)
+def _powerpoint():
+    """Return the PowerPoint controller, creating it on first use."""
+    from controllers.powerpoint_controller import PowerPointController
+    return PowerPointController(materialize=not config.get("headless"))
+
+@functools.lru_cache(maxsize=None)
+def _word():
+    """Return the Word controller, creating it on first use."""
+    from controllers.word_controller import WordController
+    return WordController()
+
+@functools.lru_cache(maxsize=None)
+def _excel():
+    """Return the Excel controller, creating it on first use."""
+    from controllers.excel_controller import ExcelController
+    return ExcelController(open_in_excel=config.get("open_excel_workbooks"))
+
+# Track active documents/presentations/workbooks; items evicted over the
+# limits are closed in their controller
+active_presentations = ActiveRegistry(
+    config.get("max_presentations"),
+    lambda presentation_id: _powerpoint().close_presentation(presentation_id)
+)
+active_documents = ActiveRegistry(
+    config.get("max_documents"),
+    lambda document_id: _word().close_document(document_id)
+)
+active_workbooks = ActiveRegistry(
+    config.get("max_workbooks"),
+    lambda workbook_id: _excel().close_workbook(workbook_id)
+)
+
+def _log_errors(action: str):
+    """Log a tool's failure as "Failed to <action>" before re-raising it.
+    
+    Args:
+        action: Description of what the tool does, e.g. "add slide"
+    
+    Returns:
+        Decorator for an async tool function; the signature FastMCP inspects
+        is kept through functools.wraps
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to {action}: {e}")
+                raise
+        return wrapper
+    return decorator
 
 # PowerPoint Tools
 @mcp.tool()
+@_log_errors("create presentation")
 async def create_presentation(
     title: str,
     theme: str = "default",
-    template_path: Optional[str] = None
+    template_path: Optional[str] = None,
+    materialize: Optional[bool] = None,
+    subtitle: Optional[str] = None
 ) -> Dict[str, Any]:
     """Create a new PowerPoint presentation.
     
@@ -55,28 +122,29 @@ async def create_presentation(
         title: Presentation title
         theme: Theme name (default, modern, classic, etc.)
         template_path: Optional path to custom template
+        materialize: Write and open the file in PowerPoint immediately
+            (defaults to off when the server runs headless)
+        subtitle: Optional subtitle for the title slide
         
     Returns:
         Dict with presentation_id and metadata
     """
-    try:
-        result = await powerpoint.create_presentation(
-            title=title,
-            theme=theme,
-            template_path=template_path
-        )
-        
-        # Store in active presentations
-        active_presentations[result["presentation_id"]] = result
-        
-        logger.info(f"Created presentation: {title}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to create presentation: {e}")
-        raise
+    result = await _powerpoint().create_presentation(
+        title=title,
+        theme=theme,
+        template_path=template_path,
+        materialize=materialize,
+        subtitle=subtitle
+    )
+    
+    # Store in active presentations
+    await active_presentations.add(result["presentation_id"], result)
+    
+    logger.info("Created presentation: %s", title)
+    return result
 
 @mcp.tool()
+@_log_errors("add slide")
 async def add_slide(
     presentation_id: str,
     layout: str = "Title and Content",
@@ -92,21 +160,17 @@ async def add_slide(
     Returns:
         Dict with slide_id and metadata
     """
-    try:
-        result = await powerpoint.add_slide(
-            presentation_id=presentation_id,
-            layout=layout,
-            position=position
-        )
-        
-        logger.info(f"Added slide to presentation {presentation_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add slide: {e}")
-        raise
+    result = await _powerpoint().add_slide(
+        presentation_id=presentation_id,
+        layout=layout,
+        position=position
+    )
+    
+    logger.info("Added slide to presentation %s", presentation_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add text")
 async def add_text_to_slide(
     slide_id: str,
     text: str,
@@ -124,22 +188,18 @@ async def add_text_to_slide(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await powerpoint.add_text(
-            slide_id=slide_id,
-            text=text,
-            placeholder=placeholder,
-            formatting=formatting or {}
-        )
-        
-        logger.info(f"Added text to slide {slide_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add text: {e}")
-        raise
+    result = await _powerpoint().add_text(
+        slide_id=slide_id,
+        text=text,
+        placeholder=placeholder,
+        formatting=formatting
+    )
+    
+    logger.info("Added text to slide %s", slide_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add image")
 async def add_image_to_slide(
     slide_id: str,
     image_source: str,
@@ -157,22 +217,18 @@ async def add_image_to_slide(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await powerpoint.add_image(
-            slide_id=slide_id,
-            image_source=image_source,
-            position=position or {"x": 100, "y": 100},
-            size=size or {"width": 400, "height": 300}
-        )
-        
-        logger.info(f"Added image to slide {slide_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add image: {e}")
-        raise
+    result = await _powerpoint().add_image(
+        slide_id=slide_id,
+        image_source=image_source,
+        position=position or {"x": 100, "y": 100},
+        size=size or {"width": 400, "height": 300}
+    )
+    
+    logger.info("Added image to slide %s", slide_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add speaker notes")
 async def add_speaker_notes(
     slide_id: str,
     notes: str
@@ -186,20 +242,64 @@ async def add_speaker_notes(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await powerpoint.add_speaker_notes(
-            slide_id=slide_id,
-            notes=notes
-        )
-        
-        logger.info(f"Added speaker notes to slide {slide_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add speaker notes: {e}")
-        raise
+    result = await _powerpoint().add_speaker_notes(
+        slide_id=slide_id,
+        notes=notes
+    )
+    
+    logger.info("Added speaker notes to slide %s", slide_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add slides in bulk")
+async def add_slides_bulk(
+    presentation_id: str,
+    slides: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Add several slides, with their text, images and notes, in one call.
+    
+    Args:
+        presentation_id: ID of the presentation
+        slides: List of slide specs with optional keys: layout, texts
+            (list of {text, placeholder, formatting}), images (list of
+            {image_source, position, size}) and notes
+    
+    Returns:
+        List of slide metadata dicts
+    """
+    result = await _powerpoint().add_slides_bulk(
+        presentation_id=presentation_id,
+        slides=slides
+    )
+    
+    logger.info("Added %s slides to presentation %s", len(result), presentation_id)
+    return result
+
+@mcp.tool()
+@_log_errors("add texts in bulk")
+async def add_texts_bulk(
+    slide_id: str,
+    items: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Add several text items to a slide in one call.
+    
+    Args:
+        slide_id: ID of the slide
+        items: List of {text, placeholder, formatting} dicts
+    
+    Returns:
+        Dict with operation status
+    """
+    result = await _powerpoint().add_texts_bulk(
+        slide_id=slide_id,
+        items=items
+    )
+    
+    logger.info("Added %s text items to slide %s", len(items), slide_id)
+    return result
+
+@mcp.tool()
+@_log_errors("save presentation")
 async def save_presentation(
     presentation_id: str,
     file_path: str,
@@ -215,22 +315,35 @@ async def save_presentation(
     Returns:
         Dict with operation status and file path
     """
-    try:
-        result = await powerpoint.save_presentation(
-            presentation_id=presentation_id,
-            file_path=file_path,
-            format=format
-        )
-        
-        logger.info(f"Saved presentation to {file_path}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to save presentation: {e}")
-        raise
+    result = await _powerpoint().save_presentation(
+        presentation_id=presentation_id,
+        file_path=file_path,
+        format=format
+    )
+    
+    logger.info("Saved presentation to %s", file_path)
+    return result
+
+@mcp.tool()
+@_log_errors("close presentation")
+async def close_presentation(presentation_id: str) -> Dict[str, Any]:
+    """Close a presentation and free its resources.
+    
+    Args:
+        presentation_id: ID of the presentation
+    
+    Returns:
+        Dict with operation status
+    """
+    result = await _powerpoint().close_presentation(presentation_id=presentation_id)
+    active_presentations.discard(presentation_id)
+    
+    logger.info("Closed presentation %s", presentation_id)
+    return result
 
 # Word Tools
 @mcp.tool()
+@_log_errors("create document")
 async def create_document(
     title: str = "New Document",
     template_path: Optional[str] = None
@@ -244,23 +357,19 @@ async def create_document(
     Returns:
         Dict with document_id and metadata
     """
-    try:
-        result = await word.create_document(
-            title=title,
-            template_path=template_path
-        )
-        
-        # Store in active documents
-        active_documents[result["document_id"]] = result
-        
-        logger.info(f"Created document: {title}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to create document: {e}")
-        raise
+    result = await _word().create_document(
+        title=title,
+        template_path=template_path
+    )
+    
+    # Store in active documents
+    await active_documents.add(result["document_id"], result)
+    
+    logger.info("Created document: %s", title)
+    return result
 
 @mcp.tool()
+@_log_errors("add heading")
 async def add_heading(
     document_id: str,
     text: str,
@@ -278,22 +387,18 @@ async def add_heading(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await word.add_heading(
-            document_id=document_id,
-            text=text,
-            level=level,
-            style=style
-        )
-        
-        logger.info(f"Added heading to document {document_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add heading: {e}")
-        raise
+    result = await _word().add_heading(
+        document_id=document_id,
+        text=text,
+        level=level,
+        style=style
+    )
+    
+    logger.info("Added heading to document %s", document_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add paragraph")
 async def add_paragraph(
     document_id: str,
     text: str,
@@ -311,22 +416,18 @@ async def add_paragraph(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await word.add_paragraph(
-            document_id=document_id,
-            text=text,
-            style=style,
-            formatting=formatting or {}
-        )
-        
-        logger.info(f"Added paragraph to document {document_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add paragraph: {e}")
-        raise
+    result = await _word().add_paragraph(
+        document_id=document_id,
+        text=text,
+        style=style,
+        formatting=formatting
+    )
+    
+    logger.info("Added paragraph to document %s", document_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add list")
 async def add_list(
     document_id: str,
     items: List[str],
@@ -344,22 +445,18 @@ async def add_list(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await word.add_list(
-            document_id=document_id,
-            items=items,
-            list_type=list_type,
-            style=style
-        )
-        
-        logger.info(f"Added list to document {document_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add list: {e}")
-        raise
+    result = await _word().add_list(
+        document_id=document_id,
+        items=items,
+        list_type=list_type,
+        style=style
+    )
+    
+    logger.info("Added list to document %s", document_id)
+    return result
 
 @mcp.tool()
+@_log_errors("add table")
 async def add_table(
     document_id: str,
     rows: int,
@@ -379,23 +476,82 @@ async def add_table(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await word.add_table(
-            document_id=document_id,
-            rows=rows,
-            columns=columns,
-            data=data,
-            style=style
-        )
-        
-        logger.info(f"Added table to document {document_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add table: {e}")
-        raise
+    result = await _word().add_table(
+        document_id=document_id,
+        rows=rows,
+        columns=columns,
+        data=data,
+        style=style
+    )
+    
+    logger.info("Added table to document %s", document_id)
+    return result
+
+@mcp.tool()
+@_log_errors("add elements")
+async def add_elements(
+    document_id: str,
+    elements: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Add several headings, paragraphs, lists and tables in one call.
+    
+    Args:
+        document_id: ID of the document
+        elements: List of dicts with a "type" (heading, paragraph, list,
+            table) and the arguments of the matching add_* tool
+    
+    Returns:
+        List of element metadata, in input order
+    """
+    result = await _word().add_elements(
+        document_id=document_id,
+        elements=elements
+    )
+    
+    logger.info("Added %s elements to document %s", len(elements), document_id)
+    return result
+
+# Operations accepted by batch_apply, mapped to add_elements element types
+_BATCH_OPS = {
+    "add_heading": "heading",
+    "add_paragraph": "paragraph",
+    "add_list": "list",
+    "add_table": "table"
+}
+
+@mcp.tool()
+@_log_errors("apply batch operations")
+async def batch_apply(
+    document_id: str,
+    ops: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Apply a sequence of document operations in one call.
+    
+    Args:
+        document_id: ID of the document
+        ops: List of {"op": tool name, "args": tool arguments} where op is
+            add_heading, add_paragraph, add_list or add_table
+    
+    Returns:
+        List of element metadata, one per operation
+    """
+    elements = []
+    for op in ops:
+        element_type = _BATCH_OPS.get(op.get("op"))
+        if element_type is None:
+            raise ValueError(f"Unsupported batch operation: {op.get('op')}")
+        elements.append({**op.get("args", {}), "type": element_type})
+    
+    result = await _word().add_elements(
+        document_id=document_id,
+        elements=elements
+    )
+    
+    logger.info("Applied %s operations to document %s", len(ops), document_id)
+    return result
 
 @mcp.tool()
+@_log_errors("save document")
 async def save_document(
     document_id: str,
     file_path: str,
@@ -411,52 +567,48 @@ async def save_document(
     Returns:
         Dict with operation status and file path
     """
-    try:
-        result = await word.save_document(
-            document_id=document_id,
-            file_path=file_path,
-            format=format
-        )
-        
-        logger.info(f"Saved document to {file_path}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to save document: {e}")
-        raise
+    result = await _word().save_document(
+        document_id=document_id,
+        file_path=file_path,
+        format=format
+    )
+    
+    logger.info("Saved document to %s", file_path)
+    return result
 
 # Excel Tools
 @mcp.tool()
+@_log_errors("create workbook")
 async def create_workbook(
     title: str = "New Workbook",
-    template_path: Optional[str] = None
+    template_path: Optional[str] = None,
+    streaming: bool = False
 ) -> Dict[str, Any]:
     """Create a new Excel workbook.
     
     Args:
         title: Workbook title
         template_path: Optional template file path
+        streaming: Write-only mode for large append-only workbooks; rows must
+            be written top to bottom and the file is produced by save_workbook
         
     Returns:
         Dict with workbook_id and metadata
     """
-    try:
-        result = await excel.create_workbook(
-            title=title,
-            template_path=template_path
-        )
-        
-        # Store in active workbooks
-        active_workbooks[result["workbook_id"]] = result
-        
-        logger.info(f"Created workbook: {title}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to create workbook: {e}")
-        raise
+    result = await _excel().create_workbook(
+        title=title,
+        template_path=template_path,
+        streaming=streaming
+    )
+    
+    # Store in active workbooks
+    await active_workbooks.add(result["workbook_id"], result)
+    
+    logger.info("Created workbook: %s", title)
+    return result
 
 @mcp.tool()
+@_log_errors("add worksheet")
 async def add_worksheet(
     workbook_id: str,
     sheet_name: str,
@@ -472,21 +624,17 @@ async def add_worksheet(
     Returns:
         Dict with worksheet metadata
     """
-    try:
-        result = await excel.add_worksheet(
-            workbook_id=workbook_id,
-            sheet_name=sheet_name,
-            position=position
-        )
-        
-        logger.info(f"Added worksheet '{sheet_name}' to workbook {workbook_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add worksheet: {e}")
-        raise
+    result = await _excel().add_worksheet(
+        workbook_id=workbook_id,
+        sheet_name=sheet_name,
+        position=position
+    )
+    
+    logger.info("Added worksheet '%s' to workbook %s", sheet_name, workbook_id)
+    return result
 
 @mcp.tool()
+@_log_errors("write cell")
 async def write_cell(
     workbook_id: str,
     sheet_name: str,
@@ -506,29 +654,26 @@ async def write_cell(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await excel.write_cell(
-            workbook_id=workbook_id,
-            sheet_name=sheet_name,
-            cell=cell,
-            value=value,
-            formatting=formatting
-        )
-        
-        logger.info(f"Wrote value to cell {cell}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to write cell: {e}")
-        raise
+    result = await _excel().write_cell(
+        workbook_id=workbook_id,
+        sheet_name=sheet_name,
+        cell=cell,
+        value=value,
+        formatting=formatting
+    )
+    
+    logger.info("Wrote value to cell %s", cell)
+    return result
 
 @mcp.tool()
+@_log_errors("write range")
 async def write_range(
     workbook_id: str,
     sheet_name: str,
     start_cell: str,
     data: List[List[Any]],
-    formatting: Optional[Dict[str, Any]] = None
+    formatting: Optional[Dict[str, Any]] = None,
+    chunk_rows: int = 1000
 ) -> Dict[str, Any]:
     """Write data to a range of cells.
     
@@ -538,27 +683,25 @@ async def write_range(
         start_cell: Starting cell reference
         data: 2D list of values
         formatting: Optional formatting options
+        chunk_rows: Number of rows written per tile for large ranges
         
     Returns:
         Dict with operation status
     """
-    try:
-        result = await excel.write_range(
-            workbook_id=workbook_id,
-            sheet_name=sheet_name,
-            start_cell=start_cell,
-            data=data,
-            formatting=formatting
-        )
-        
-        logger.info(f"Wrote data to range starting at {start_cell}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to write range: {e}")
-        raise
+    result = await _excel().write_range(
+        workbook_id=workbook_id,
+        sheet_name=sheet_name,
+        start_cell=start_cell,
+        data=data,
+        formatting=formatting,
+        chunk_rows=chunk_rows
+    )
+    
+    logger.info("Wrote data to range starting at %s", start_cell)
+    return result
 
 @mcp.tool()
+@_log_errors("add formula")
 async def add_formula(
     workbook_id: str,
     sheet_name: str,
@@ -576,22 +719,18 @@ async def add_formula(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await excel.add_formula(
-            workbook_id=workbook_id,
-            sheet_name=sheet_name,
-            cell=cell,
-            formula=formula
-        )
-        
-        logger.info(f"Added formula to cell {cell}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to add formula: {e}")
-        raise
+    result = await _excel().add_formula(
+        workbook_id=workbook_id,
+        sheet_name=sheet_name,
+        cell=cell,
+        formula=formula
+    )
+    
+    logger.info("Added formula to cell %s", cell)
+    return result
 
 @mcp.tool()
+@_log_errors("create chart")
 async def create_chart(
     workbook_id: str,
     sheet_name: str,
@@ -613,24 +752,20 @@ async def create_chart(
     Returns:
         Dict with operation status
     """
-    try:
-        result = await excel.create_chart(
-            workbook_id=workbook_id,
-            sheet_name=sheet_name,
-            chart_type=chart_type,
-            data_range=data_range,
-            chart_title=chart_title,
-            position=position
-        )
-        
-        logger.info(f"Created {chart_type} chart at {position}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to create chart: {e}")
-        raise
+    result = await _excel().create_chart(
+        workbook_id=workbook_id,
+        sheet_name=sheet_name,
+        chart_type=chart_type,
+        data_range=data_range,
+        chart_title=chart_title,
+        position=position
+    )
+    
+    logger.info("Created %s chart at %s", chart_type, position)
+    return result
 
 @mcp.tool()
+@_log_errors("save workbook")
 async def save_workbook(
     workbook_id: str,
     file_path: str,
@@ -646,21 +781,17 @@ async def save_workbook(
     Returns:
         Dict with operation status and file path
     """
-    try:
-        result = await excel.save_workbook(
-            workbook_id=workbook_id,
-            file_path=file_path,
-            format=format
-        )
-        
-        logger.info(f"Saved workbook to {file_path}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to save workbook: {e}")
-        raise
+    result = await _excel().save_workbook(
+        workbook_id=workbook_id,
+        file_path=file_path,
+        format=format
+    )
+    
+    logger.info("Saved workbook to %s", file_path)
+    return result
 
 @mcp.tool()
+@_log_errors("list worksheets")
 async def list_worksheets(
     workbook_id: str
 ) -> List[str]:
@@ -672,14 +803,9 @@ async def list_worksheets(
     Returns:
         List of worksheet names
     """
-    try:
-        result = await excel.list_worksheets(workbook_id)
-        logger.info(f"Listed worksheets for workbook {workbook_id}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to list worksheets: {e}")
-        raise
+    result = await _excel().list_worksheets(workbook_id)
+    logger.info("Listed worksheets for workbook %s", workbook_id)
+    return result
 
 # Utility Tools
 @mcp.tool()
@@ -689,7 +815,7 @@ async def list_active_presentations() -> List[Dict[str, Any]]:
     Returns:
         List of active presentation metadata
     """
-    return list(active_presentations.values())
+    return active_presentations.listing()
 
 @mcp.tool()
 async def list_active_documents() -> List[Dict[str, Any]]:
@@ -698,7 +824,7 @@ async def list_active_documents() -> List[Dict[str, Any]]:
     Returns:
         List of active document metadata
     """
-    return list(active_documents.values())
+    return active_documents.listing()
 
 @mcp.tool()
 async def list_active_workbooks() -> List[Dict[str, Any]]:
@@ -707,7 +833,7 @@ async def list_active_workbooks() -> List[Dict[str, Any]]:
     Returns:
         List of active workbook metadata
     """
-    return list(active_workbooks.values())
+    return active_workbooks.listing()
 
 @mcp.tool()
 async def check_office_status() -> Dict[str, Any]:
@@ -717,15 +843,12 @@ async def check_office_status() -> Dict[str, Any]:
         Dict with Office application status
     """
     try:
-        powerpoint_status = await applescript.check_powerpoint_status()
-        word_status = await applescript.check_word_status()
-        # Note: Would need to implement check_excel_status in AppleScriptBridge
-        excel_status = False  # For now
+        status = await applescript.check_office_status()
         
         return {
-            "powerpoint_available": powerpoint_status,
-            "word_available": word_status,
-            "excel_available": excel_status,
+            "powerpoint_available": status["powerpoint"],
+            "word_available": status["word"],
+            "excel_available": status["excel"],
             "server_status": "running"
         }
         
@@ -740,36 +863,80 @@ async def check_office_status() -> Dict[str, Any]:
         }
 
 # Resources
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+# Templates listing, rebuilt only when the templates directory changes:
+# (directory mtime_ns or None if missing, rendered listing)
+_templates_cache: Optional[Tuple[Optional[int], str]] = None
+
 @mcp.resource("office365://templates")
 async def get_templates() -> str:
-    """Get available Office templates."""
-    templates_dir = Path(__file__).parent / "templates"
-    templates = []
+    """Get available Office templates as JSON."""
+    global _templates_cache
+    try:
+        mtime = _TEMPLATES_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime = None
     
-    if templates_dir.exists():
-        for template_file in templates_dir.glob("*"):
-            templates.append({
-                "name": template_file.stem,
-                "path": str(template_file),
-                "type": template_file.suffix[1:]
-            })
+    if _templates_cache is not None and _templates_cache[0] == mtime:
+        return _templates_cache[1]
     
-    return f"Available templates: {templates}"
+    templates = []
+    if mtime is not None:
+        with os.scandir(_TEMPLATES_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                name, _, extension = entry.name.rpartition(".")
+                templates.append({
+                    "name": name or extension,
+                    "path": entry.path,
+                    "type": extension if name else ""
+                })
+    
+    listing = (
+        orjson.dumps({"templates": templates}).decode() if orjson is not None
+        else json.dumps({"templates": templates})
+    )
+    _templates_cache = (mtime, listing)
+    return listing
+
+# Server status as JSON; only the counts change between calls
+_STATUS_TEMPLATE = (
+    '{"active_presentations": %d, "active_documents": %d, "active_workbooks": %d, '
+    '"server_version": "1.1.0", "platform": "macOS"}'
+)
 
 @mcp.resource("office365://status")
 async def get_server_status() -> str:
-    """Get server status information."""
-    status = {
-        "active_presentations": len(active_presentations),
-        "active_documents": len(active_documents),
-        "active_workbooks": len(active_workbooks),
-        "server_version": "1.1.0",
-        "platform": "macOS"
-    }
+    """Get server status information as JSON."""
+    return _STATUS_TEMPLATE % (
+        len(active_presentations),
+        len(active_documents),
+        len(active_workbooks)
+    )
+
+async def _serve() -> None:
+    """Run the server over stdio with eager task execution.
     
-    return f"Server Status: {status}"
+    Most tool calls finish without suspending, so on Python 3.12+ tasks run
+    inline until their first real await instead of being scheduled. The
+    osascript workers and the HTTP session are released on the same loop
+    when the server stops, including on Ctrl-C.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        if _powerpoint.cache_info().currsize:
+            await _powerpoint().close()
+        await applescript.close()
 
 if __name__ == "__main__":
     logger.info("Starting Office 365 MCP Server...")
     # Run the server using stdio transport
-    mcp.run()
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        logger.info("Office 365 MCP Server stopped")
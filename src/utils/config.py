@@ -4,19 +4,56 @@ Configuration management for Office 365 MCP Server
 
 import os
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional; the standard json module is used instead
+    orjson = None
+
+# slots=True needs Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_DEFAULT_CONFIG_PATH = str(Path(__file__).parent.parent.parent / "config.json")
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.lower() in ("true", "1", "yes")
+
+# Environment overrides: (setting, variable name, conversion)
+_ENV_OVERRIDES = (
+    ("log_level", "OFFICE365_MCP_LOG_LEVEL", str),
+    ("temp_dir", "OFFICE365_MCP_TEMP_DIR", str),
+    ("max_presentations", "OFFICE365_MCP_MAX_PRESENTATIONS", int),
+    ("max_documents", "OFFICE365_MCP_MAX_DOCUMENTS", int),
+    ("max_workbooks", "OFFICE365_MCP_MAX_WORKBOOKS", int),
+    ("enable_applescript", "OFFICE365_MCP_ENABLE_APPLESCRIPT", _to_bool),
+    ("enable_cloud_api", "OFFICE365_MCP_ENABLE_CLOUD_API", _to_bool),
+    ("headless", "OFFICE365_MCP_HEADLESS", _to_bool),
+    ("applescript_workers", "OFFICE365_MCP_APPLESCRIPT_WORKERS", int),
+    ("use_uvloop", "OFFICE365_MCP_USE_UVLOOP", _to_bool),
+    ("use_nsapplescript", "OFFICE365_MCP_USE_NSAPPLESCRIPT", _to_bool),
+    ("open_excel_workbooks", "OFFICE365_MCP_OPEN_EXCEL_WORKBOOKS", _to_bool),
+)
+
+@dataclass(**_DATACLASS_SLOTS)
 class ServerConfig:
     """Server configuration settings."""
     log_level: str = "INFO"
     temp_dir: str = "~/tmp/office365_mcp"
     max_presentations: int = 10
     max_documents: int = 10
+    max_workbooks: int = 10
     enable_applescript: bool = True
     enable_cloud_api: bool = False
+    headless: bool = False
+    applescript_workers: int = 2
+    use_uvloop: bool = True
+    use_nsapplescript: bool = False
+    open_excel_workbooks: bool = False
     
 class Config:
     """Configuration manager for the MCP server."""
@@ -27,7 +64,7 @@ class Config:
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        return str(Path(__file__).parent.parent.parent / "config.json")
+        return _DEFAULT_CONFIG_PATH
     
     def _load_config(self) -> ServerConfig:
         """Load configuration from file or environment variables."""
@@ -36,30 +73,16 @@ class Config:
         # Load from file if it exists
         if Path(self.config_file).exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+                raw = Path(self.config_file).read_bytes()
+                config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             except Exception:
                 pass
         
         # Override with environment variables
-        env_overrides = {
-            "log_level": os.getenv("OFFICE365_MCP_LOG_LEVEL"),
-            "temp_dir": os.getenv("OFFICE365_MCP_TEMP_DIR"),
-            "max_presentations": os.getenv("OFFICE365_MCP_MAX_PRESENTATIONS"),
-            "max_documents": os.getenv("OFFICE365_MCP_MAX_DOCUMENTS"),
-            "enable_applescript": os.getenv("OFFICE365_MCP_ENABLE_APPLESCRIPT"),
-            "enable_cloud_api": os.getenv("OFFICE365_MCP_ENABLE_CLOUD_API"),
-        }
-        
-        # Apply non-None environment variables
-        for key, value in env_overrides.items():
+        for key, env_name, convert in _ENV_OVERRIDES:
+            value = os.environ.get(env_name)
             if value is not None:
-                if key in ["max_presentations", "max_documents"]:
-                    config_data[key] = int(value)
-                elif key in ["enable_applescript", "enable_cloud_api"]:
-                    config_data[key] = value.lower() in ("true", "1", "yes")
-                else:
-                    config_data[key] = value
+                config_data[key] = convert(value)
         
         return ServerConfig(**config_data)
     
@@ -70,15 +93,24 @@ class Config:
             "temp_dir": self.settings.temp_dir,
             "max_presentations": self.settings.max_presentations,
             "max_documents": self.settings.max_documents,
+            "max_workbooks": self.settings.max_workbooks,
             "enable_applescript": self.settings.enable_applescript,
             "enable_cloud_api": self.settings.enable_cloud_api,
+            "headless": self.settings.headless,
+            "applescript_workers": self.settings.applescript_workers,
+            "use_uvloop": self.settings.use_uvloop,
+            "use_nsapplescript": self.settings.use_nsapplescript,
+            "open_excel_workbooks": self.settings.open_excel_workbooks,
         }
         
         config_path = Path(self.config_file)
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        if orjson is not None:
+            config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(config_data, f, indent=2)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
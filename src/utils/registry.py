@@ -0,0 +1,72 @@
+"""
+Registry of open items for Office 365 MCP Server
+"""
+
+import collections
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class ActiveRegistry:
+    """Metadata of the open presentations, documents or workbooks of one kind.
+    
+    At most ``max_items`` entries are kept; adding one more evicts the
+    least recently added, and ``release`` closes it in its controller so
+    the listing and the controller agree on what is open. The listing
+    returned by the list_active_* tools is built once and reused until the
+    registry changes.
+    """
+    
+    def __init__(self, max_items: int, release: Callable[[str], Awaitable[Any]]):
+        self.max_items = max_items
+        self.release = release
+        self._items: "collections.OrderedDict[str, Dict[str, Any]]" = collections.OrderedDict()
+        self._listing: Optional[List[Dict[str, Any]]] = None
+    
+    async def add(self, item_id: str, metadata: Dict[str, Any]) -> List[str]:
+        """Record an item, replacing any earlier entry with the same ID.
+        
+        Args:
+            item_id: Presentation, document or workbook ID
+            metadata: Result returned when the item was created
+        
+        Returns:
+            IDs of the items evicted and closed to make room
+        """
+        self._items[item_id] = metadata
+        self._items.move_to_end(item_id)
+        self._listing = None
+        
+        evicted = []
+        while len(self._items) > self.max_items:
+            evicted_id, _ = self._items.popitem(last=False)
+            evicted.append(evicted_id)
+            try:
+                await self.release(evicted_id)
+            except Exception as e:
+                logger.warning(f"Could not close evicted item {evicted_id}: {e}")
+        return evicted
+    
+    def discard(self, item_id: str) -> None:
+        """Forget an item, if it is tracked.
+        
+        Args:
+            item_id: Presentation, document or workbook ID
+        """
+        if self._items.pop(item_id, None) is not None:
+            self._listing = None
+    
+    def listing(self) -> List[Dict[str, Any]]:
+        """Return the metadata of all items, in the order they were added.
+        
+        Returns:
+            List of item metadata
+        """
+        if self._listing is None:
+            self._listing = list(self._items.values())
+        return self._listing
+    
+    def __len__(self) -> int:
+        return len(self._items)
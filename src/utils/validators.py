@@ -2,9 +2,27 @@
 Input validation utilities for Office 365 MCP Server
 """
 
+import functools
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+# Patterns used by the schemas below, compiled once
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+_UUID_CHARS = frozenset("0123456789abcdef-")
+
+def _is_uuid(value: str) -> bool:
+    """Check that a string has the shape of a lowercase UUID.
+    
+    Args:
+        value: String to check
+    
+    Returns:
+        True if it is 36 characters of hex digits and dashes
+    """
+    return len(value) == 36 and _UUID_CHARS.issuperset(value)
 
 def validate_input(data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
     """Validate input data against a schema.
@@ -23,9 +41,10 @@ def validate_input(data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, An
     
     for field, rules in schema.items():
         value = data.get(field)
+        get = rules.get
         
         # Check required fields
-        if rules.get("required", False) and value is None:
+        if get("required", False) and value is None:
             raise ValueError(f"Required field '{field}' is missing")
         
         # Skip validation for optional None values
@@ -33,15 +52,15 @@ def validate_input(data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, An
             continue
         
         # Type validation
-        expected_type = rules.get("type")
+        expected_type = get("type")
         if expected_type and not isinstance(value, expected_type):
-            raise ValueError(f"Field '{field}' must be of type {expected_type.__name__}")
+            raise ValueError(f"Field '{field}' must be of type {_type_name(expected_type)}")
         
         # String validations
         if isinstance(value, str):
             # Length validation
-            min_length = rules.get("min_length")
-            max_length = rules.get("max_length")
+            min_length = get("min_length")
+            max_length = get("max_length")
             
             if min_length and len(value) < min_length:
                 raise ValueError(f"Field '{field}' must be at least {min_length} characters")
@@ -49,15 +68,23 @@ def validate_input(data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, An
             if max_length and len(value) > max_length:
                 raise ValueError(f"Field '{field}' must be at most {max_length} characters")
             
-            # Pattern validation
-            pattern = rules.get("pattern")
-            if pattern and not re.match(pattern, value):
+            # Pattern validation; schemas may give a string or a compiled pattern
+            pattern = get("pattern")
+            if pattern:
+                if not isinstance(pattern, re.Pattern):
+                    pattern = re.compile(pattern)
+                if not pattern.match(value):
+                    raise ValueError(f"Field '{field}' does not match required pattern")
+            
+            # Custom check: a callable returning whether the value is valid
+            validator = get("validator")
+            if validator and not validator(value):
                 raise ValueError(f"Field '{field}' does not match required pattern")
         
         # Numeric validations
-        if isinstance(value, (int, float)):
-            min_value = rules.get("min_value")
-            max_value = rules.get("max_value")
+        elif isinstance(value, (int, float)):
+            min_value = get("min_value")
+            max_value = get("max_value")
             
             if min_value is not None and value < min_value:
                 raise ValueError(f"Field '{field}' must be at least {min_value}")
@@ -66,25 +93,185 @@ def validate_input(data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, An
                 raise ValueError(f"Field '{field}' must be at most {max_value}")
         
         # Choice validation
-        choices = rules.get("choices")
+        choices = get("choices")
         if choices and value not in choices:
-            raise ValueError(f"Field '{field}' must be one of {choices}")
+            raise ValueError(f"Field '{field}' must be one of {sorted(choices)}")
         
         validated[field] = value
     
     return validated
 
-def validate_file_path(file_path: str, must_exist: bool = False, extensions: Optional[List[str]] = None) -> str:
+def _type_name(expected_type: Any) -> str:
+    """Name a type, or a tuple of types, for an error message."""
+    if isinstance(expected_type, tuple):
+        return " or ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+def _field_checks(field: str, rules: Dict[str, Any]) -> List[Callable[[Any], None]]:
+    """Build the checks one field's rules call for, in validate_input's order.
+    
+    String and numeric checks only apply to values of those types. When
+    the field's declared type already guarantees that, the checks run
+    without testing the value's type again.
+    
+    Args:
+        field: Field name, used in error messages
+        rules: The field's rules from the schema
+    
+    Returns:
+        Check functions raising ValueError for an invalid, non-None value
+    """
+    checks = []
+    
+    expected_type = rules.get("type")
+    if expected_type:
+        type_error = f"Field '{field}' must be of type {_type_name(expected_type)}"
+        def check_type(value):
+            if not isinstance(value, expected_type):
+                raise ValueError(type_error)
+        checks.append(check_type)
+    
+    str_checks = []
+    
+    min_length = rules.get("min_length")
+    if min_length:
+        def check_min_length(value):
+            if len(value) < min_length:
+                raise ValueError(f"Field '{field}' must be at least {min_length} characters")
+        str_checks.append(check_min_length)
+    
+    max_length = rules.get("max_length")
+    if max_length:
+        def check_max_length(value):
+            if len(value) > max_length:
+                raise ValueError(f"Field '{field}' must be at most {max_length} characters")
+        str_checks.append(check_max_length)
+    
+    pattern = rules.get("pattern")
+    if pattern:
+        match = (pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)).match
+        def check_pattern(value):
+            if not match(value):
+                raise ValueError(f"Field '{field}' does not match required pattern")
+        str_checks.append(check_pattern)
+    
+    validator = rules.get("validator")
+    if validator:
+        def check_validator(value):
+            if not validator(value):
+                raise ValueError(f"Field '{field}' does not match required pattern")
+        str_checks.append(check_validator)
+    
+    checks.extend(_for_type(str_checks, str, expected_type))
+    
+    num_checks = []
+    
+    min_value = rules.get("min_value")
+    if min_value is not None:
+        def check_min_value(value):
+            if value < min_value:
+                raise ValueError(f"Field '{field}' must be at least {min_value}")
+        num_checks.append(check_min_value)
+    
+    max_value = rules.get("max_value")
+    if max_value is not None:
+        def check_max_value(value):
+            if value > max_value:
+                raise ValueError(f"Field '{field}' must be at most {max_value}")
+        num_checks.append(check_max_value)
+    
+    checks.extend(_for_type(num_checks, (int, float), expected_type))
+    
+    choices = rules.get("choices")
+    if choices:
+        def check_choices(value):
+            if value not in choices:
+                raise ValueError(f"Field '{field}' must be one of {sorted(choices)}")
+        checks.append(check_choices)
+    
+    return checks
+
+def _for_type(
+    checks: List[Callable[[Any], None]],
+    applies_to: Any,
+    expected_type: Any
+) -> List[Callable[[Any], None]]:
+    """Restrict checks to values of one type, unless the schema ensures it.
+    
+    Args:
+        checks: Checks that assume the value has type ``applies_to``
+        applies_to: Type or tuple of types the checks apply to
+        expected_type: The field's declared type, already checked, or None
+    
+    Returns:
+        The checks themselves, or one check running them for matching values
+    """
+    if not checks:
+        return []
+    
+    declared = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+    if expected_type and all(isinstance(t, type) and issubclass(t, applies_to) for t in declared):
+        return checks
+    
+    def check_if_applicable(value):
+        if isinstance(value, applies_to):
+            for check in checks:
+                check(value)
+    return [check_if_applicable]
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a validator specialized to one schema.
+    
+    The returned function performs the same checks as validate_input and
+    raises the same errors, but the schema's rules are read once here, and
+    each field only runs the checks it has rules for.
+    
+    Args:
+        schema: Validation schema
+    
+    Returns:
+        Function taking input data and returning validated data
+    """
+    fields: List[Tuple[str, bool, List[Callable[[Any], None]]]] = [
+        (field, rules.get("required", False), _field_checks(field, rules))
+        for field, rules in schema.items()
+    ]
+    
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        validated = {}
+        for field, required, checks in fields:
+            value = data.get(field)
+            if value is None:
+                if required:
+                    raise ValueError(f"Required field '{field}' is missing")
+                continue
+            for check in checks:
+                check(value)
+            validated[field] = value
+        return validated
+    
+    return validate
+
+@functools.lru_cache(maxsize=None)
+def _lowered_extensions(extensions: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return a set of allowed extensions, lower-cased, built once per list."""
+    return frozenset(ext.lower() for ext in extensions)
+
+def validate_file_path(
+    file_path: str,
+    must_exist: bool = False,
+    extensions: Optional[List[str]] = None
+) -> str:
     """Validate a file path.
     
     Args:
         file_path: Path to validate
         must_exist: Whether the file must exist
         extensions: Allowed file extensions
-        
+    
     Returns:
         Validated file path
-        
+    
     Raises:
         ValueError: If validation fails
     """
@@ -97,11 +284,31 @@ def validate_file_path(file_path: str, must_exist: bool = False, extensions: Opt
         raise ValueError(f"File does not exist: {file_path}")
     
     if extensions:
-        if path.suffix.lower() not in [ext.lower() for ext in extensions]:
+        if path.suffix.lower() not in _lowered_extensions(tuple(extensions)):
             raise ValueError(f"File must have one of these extensions: {extensions}")
     
     return str(path.resolve())
 
+_PRESENTATION_SCHEMA = {
+    "title": {
+        "type": str,
+        "required": True,
+        "min_length": 1,
+        "max_length": 255
+    },
+    "theme": {
+        "type": str,
+        "required": False,
+        "choices": frozenset(["default", "modern", "classic", "minimal", "corporate"])
+    },
+    "template_path": {
+        "type": str,
+        "required": False
+    }
+}
+
+_validate_presentation = compile_schema(_PRESENTATION_SCHEMA)
+
 def validate_presentation_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate presentation creation data.
     
@@ -111,25 +318,7 @@ def validate_presentation_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "title": {
-            "type": str,
-            "required": True,
-            "min_length": 1,
-            "max_length": 255
-        },
-        "theme": {
-            "type": str,
-            "required": False,
-            "choices": ["default", "modern", "classic", "minimal", "corporate"]
-        },
-        "template_path": {
-            "type": str,
-            "required": False
-        }
-    }
-    
-    validated = validate_input(data, schema)
+    validated = _validate_presentation(data)
     
     # Validate template path if provided
     if validated.get("template_path"):
@@ -141,6 +330,36 @@ def validate_presentation_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     return validated
 
+_SLIDE_SCHEMA = {
+    "presentation_id": {
+        "type": str,
+        "required": True,
+        "validator": _is_uuid
+    },
+    "layout": {
+        "type": str,
+        "required": False,
+        "choices": frozenset([
+            "Title Slide",
+            "Title and Content",
+            "Section Header",
+            "Two Content",
+            "Comparison",
+            "Title Only",
+            "Blank",
+            "Content with Caption",
+            "Picture with Caption"
+        ])
+    },
+    "position": {
+        "type": int,
+        "required": False,
+        "min_value": 0
+    }
+}
+
+_validate_slide = compile_schema(_SLIDE_SCHEMA)
+
 def validate_slide_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate slide creation data.
     
@@ -150,35 +369,28 @@ def validate_slide_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "presentation_id": {
-            "type": str,
-            "required": True,
-            "pattern": r"^[a-f0-9-]{36}$"  # UUID pattern
-        },
-        "layout": {
-            "type": str,
-            "required": False,
-            "choices": [
-                "Title Slide",
-                "Title and Content",
-                "Section Header",
-                "Two Content",
-                "Comparison",
-                "Title Only",
-                "Blank",
-                "Content with Caption",
-                "Picture with Caption"
-            ]
-        },
-        "position": {
-            "type": int,
-            "required": False,
-            "min_value": 0
-        }
+    return _validate_slide(data)
+
+_TEXT_SCHEMA = {
+    "slide_id": {
+        "type": str,
+        "required": True,
+        "validator": _is_uuid
+    },
+    "text": {
+        "type": str,
+        "required": True,
+        "min_length": 1,
+        "max_length": 10000
+    },
+    "placeholder": {
+        "type": str,
+        "required": False,
+        "choices": frozenset(["title", "content", "subtitle"])
     }
-    
-    return validate_input(data, schema)
+}
+
+_validate_text = compile_schema(_TEXT_SCHEMA)
 
 def validate_text_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate text addition data.
@@ -189,26 +401,7 @@ def validate_text_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "slide_id": {
-            "type": str,
-            "required": True,
-            "pattern": r"^[a-f0-9-]{36}$"  # UUID pattern
-        },
-        "text": {
-            "type": str,
-            "required": True,
-            "min_length": 1,
-            "max_length": 10000
-        },
-        "placeholder": {
-            "type": str,
-            "required": False,
-            "choices": ["title", "content", "subtitle"]
-        }
-    }
-    
-    validated = validate_input(data, schema)
+    validated = _validate_text(data)
     
     # Validate formatting if provided
     formatting = data.get("formatting", {})
@@ -217,6 +410,40 @@ def validate_text_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     return validated
 
+_FORMATTING_SCHEMA = {
+    "font_size": {
+        "type": (int, float),
+        "required": False,
+        "min_value": 8,
+        "max_value": 72
+    },
+    "font_name": {
+        "type": str,
+        "required": False,
+        "max_length": 100
+    },
+    "bold": {
+        "type": bool,
+        "required": False
+    },
+    "italic": {
+        "type": bool,
+        "required": False
+    },
+    "color": {
+        "type": str,
+        "required": False,
+        "pattern": _HEX_COLOR_RE
+    },
+    "alignment": {
+        "type": str,
+        "required": False,
+        "choices": frozenset(["left", "center", "right", "justify"])
+    }
+}
+
+_validate_formatting = compile_schema(_FORMATTING_SCHEMA)
+
 def validate_formatting_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate text formatting data.
     
@@ -226,39 +453,58 @@ def validate_formatting_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "font_size": {
-            "type": (int, float),
-            "required": False,
-            "min_value": 8,
-            "max_value": 72
-        },
-        "font_name": {
-            "type": str,
-            "required": False,
-            "max_length": 100
-        },
-        "bold": {
-            "type": bool,
-            "required": False
-        },
-        "italic": {
-            "type": bool,
-            "required": False
-        },
-        "color": {
-            "type": str,
-            "required": False,
-            "pattern": r"^#[0-9A-Fa-f]{6}$"  # Hex color pattern
-        },
-        "alignment": {
-            "type": str,
-            "required": False,
-            "choices": ["left", "center", "right", "justify"]
-        }
+    return _validate_formatting(data)
+
+_IMAGE_SCHEMA = {
+    "slide_id": {
+        "type": str,
+        "required": True,
+        "validator": _is_uuid
+    },
+    "image_source": {
+        "type": str,
+        "required": True,
+        "min_length": 1
+    },
+    "position": {
+        "type": dict,
+        "required": False
+    },
+    "size": {
+        "type": dict,
+        "required": False
     }
+}
+
+_validate_image = compile_schema(_IMAGE_SCHEMA)
+
+def _validate_pair(
+    data: Dict[str, Any],
+    first: str,
+    second: str,
+    min_value: float
+) -> Dict[str, Any]:
+    """Validate a two-field numeric struct such as a position or size.
+    
+    Args:
+        data: Struct to validate
+        first: Name of the first field
+        second: Name of the second field
+        min_value: Smallest value allowed for either field
     
-    return validate_input(data, schema)
+    Returns:
+        Validated struct holding just the two fields
+    """
+    a = data.get(first)
+    b = data.get(second)
+    for field, value in ((first, a), (second, b)):
+        if value is None:
+            raise ValueError(f"Required field '{field}' is missing")
+        if not isinstance(value, (int, float)):
+            raise ValueError(f"Field '{field}' must be of type int or float")
+        if value < min_value:
+            raise ValueError(f"Field '{field}' must be at least {min_value}")
+    return {first: a, second: b}
 
 def validate_image_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate image addition data.
@@ -269,51 +515,36 @@ def validate_image_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "slide_id": {
-            "type": str,
-            "required": True,
-            "pattern": r"^[a-f0-9-]{36}$"  # UUID pattern
-        },
-        "image_source": {
-            "type": str,
-            "required": True,
-            "min_length": 1
-        },
-        "position": {
-            "type": dict,
-            "required": False
-        },
-        "size": {
-            "type": dict,
-            "required": False
-        }
-    }
-    
-    validated = validate_input(data, schema)
+    validated = _validate_image(data)
     
     # Validate image source
     image_source = validated["image_source"]
-    if not (image_source.startswith(("http://", "https://")) or Path(image_source).exists()):
+    if not (image_source.startswith(("http://", "https://")) or os.path.exists(image_source)):
         raise ValueError("Image source must be a valid URL or existing file path")
     
     # Validate position and size
     if "position" in validated:
-        pos_schema = {
-            "x": {"type": (int, float), "required": True, "min_value": 0},
-            "y": {"type": (int, float), "required": True, "min_value": 0}
-        }
-        validated["position"] = validate_input(validated["position"], pos_schema)
+        validated["position"] = _validate_pair(validated["position"], "x", "y", 0)
     
     if "size" in validated:
-        size_schema = {
-            "width": {"type": (int, float), "required": True, "min_value": 0.1},
-            "height": {"type": (int, float), "required": True, "min_value": 0.1}
-        }
-        validated["size"] = validate_input(validated["size"], size_schema)
+        validated["size"] = _validate_pair(validated["size"], "width", "height", 0.1)
     
     return validated
 
+_DOCUMENT_SCHEMA = {
+    "title": {
+        "type": str,
+        "required": False,
+        "max_length": 255
+    },
+    "template_path": {
+        "type": str,
+        "required": False
+    }
+}
+
+_validate_document = compile_schema(_DOCUMENT_SCHEMA)
+
 def validate_document_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate document creation data.
     
@@ -323,19 +554,7 @@ def validate_document_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated data
     """
-    schema = {
-        "title": {
-            "type": str,
-            "required": False,
-            "max_length": 255
-        },
-        "template_path": {
-            "type": str,
-            "required": False
-        }
-    }
-    
-    validated = validate_input(data, schema)
+    validated = _validate_document(data)
     
     # Validate template path if provided
     if validated.get("template_path"):
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+osascript worker tests for Office 365 MCP Server
+Runs the bridge's worker protocol against a fake osascript executable.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from integrations.applescript_bridge import AppleScriptBridge, AppleScriptError
+
+# Stands in for osascript. With -e it acts as a worker speaking the bridge's
+# JSON-lines protocol; otherwise it runs the script from stdin once. Every
+# script it runs is appended to $FAKE_OSASCRIPT_LOG.
+FAKE_OSASCRIPT = '''#!{python}
+import json, os, sys
+
+def log(entry):
+    with open(os.environ["FAKE_OSASCRIPT_LOG"], "a") as f:
+        f.write(entry + "\\n")
+
+if "-e" in sys.argv:
+    for line in sys.stdin:
+        request = json.loads(line)
+        script = request["script"]
+        log("worker:" + script)
+        if script == "crash":
+            sys.stdout.write('{{"id": ' + str(request["id"]) + ', "res')
+            sys.stdout.flush()
+            sys.exit(1)
+        if script == "garbage":
+            print("not json", flush=True)
+            continue
+        if script == "fail":
+            print(json.dumps({{"id": request["id"], "error": "script failed"}}), flush=True)
+            continue
+        print(json.dumps({{"id": request["id"], "result": script.upper()}}), flush=True)
+else:
+    script = sys.stdin.read()
+    log("oneshot:" + script)
+    print(script.upper())
+'''
+
+@contextlib.contextmanager
+def _fake_osascript():
+    """Put the fake osascript first on PATH and yield its log file."""
+    directory = Path(tempfile.mkdtemp())
+    fake = directory / "osascript"
+    fake.write_text(FAKE_OSASCRIPT.format(python=sys.executable))
+    fake.chmod(0o755)
+    log = directory / "log.txt"
+    log.write_text("")
+    saved_path = os.environ["PATH"]
+    os.environ["PATH"] = f"{directory}{os.pathsep}{saved_path}"
+    os.environ["FAKE_OSASCRIPT_LOG"] = str(log)
+    try:
+        yield log
+    finally:
+        os.environ["PATH"] = saved_path
+        del os.environ["FAKE_OSASCRIPT_LOG"]
+
+def _runs(log):
+    """Return the scripts the fake osascript has run, in order."""
+    return log.read_text().splitlines()
+
+def test_worker_round_trip():
+    """Scripts run in a reused worker, singly and as a submitted batch."""
+    print("Testing osascript worker round trips...")
+    
+    async def run():
+        bridge = AppleScriptBridge(max_workers=1)
+        try:
+            assert await bridge.execute_applescript("one") == "ONE"
+            ids = [bridge.submit(script) for script in ("a", "b", "c")]
+            assert await bridge.reap_many(ids) == ["A", "B", "C"]
+            try:
+                await bridge.execute_applescript("fail")
+            except AppleScriptError as e:
+                assert e.stderr == "script failed"
+            else:
+                raise AssertionError("a failing script did not raise")
+            assert await bridge.execute_applescript("two") == "TWO"
+            assert len(bridge._coprocs) == 1
+        finally:
+            await bridge.close()
+    
+    with _fake_osascript() as log:
+        asyncio.run(run())
+    assert _runs(log) == ["worker:one", "worker:a", "worker:b", "worker:c", "worker:fail", "worker:two"]
+    print("✓ Worker round trips work")
+
+def test_crash_mid_reply_is_not_retried():
+    """A worker dying after receiving a script raises and never reruns it."""
+    print("\nTesting worker crash mid-reply...")
+    
+    async def run():
+        bridge = AppleScriptBridge(max_workers=1)
+        try:
+            for script in ("crash", "garbage"):
+                try:
+                    await bridge.execute_applescript(script)
+                except AppleScriptError as e:
+                    assert "after receiving the script" in e.stderr
+                else:
+                    raise AssertionError(f"{script} did not raise")
+            
+            ids = [bridge.submit(script) for script in ("crash", "after")]
+            results = await asyncio.gather(*(bridge.reap(i) for i in ids), return_exceptions=True)
+            assert all(isinstance(result, AppleScriptError) for result in results), results
+            
+            # The pool replaces the lost workers
+            assert await bridge.execute_applescript("next") == "NEXT"
+        finally:
+            await bridge.close()
+    
+    with _fake_osascript() as log:
+        asyncio.run(run())
+    runs = _runs(log)
+    assert runs.count("worker:crash") == 2, runs
+    assert runs.count("worker:garbage") == 1, runs
+    assert not [entry for entry in runs if entry.startswith("oneshot:")], runs
+    print("✓ Crashed scripts are not run again")
+
+def test_unsent_script_falls_back():
+    """A script no worker could take runs once in a one-shot osascript."""
+    print("\nTesting fallback when no worker is available...")
+    
+    async def run():
+        bridge = AppleScriptBridge(max_workers=1)
+        
+        async def no_worker():
+            raise OSError("no worker")
+        
+        bridge._checkout_coprocess = no_worker
+        assert await bridge.execute_applescript("alone") == "ALONE"
+        await bridge.close()
+    
+    with _fake_osascript() as log:
+        asyncio.run(run())
+    assert _runs(log) == ["oneshot:alone"]
+    print("✓ Unsent scripts fall back to osascript")
+
+def main():
+    """Run all tests."""
+    print("Office 365 MCP Server - osascript Worker Tests")
+    print("=" * 40)
+    
+    tests = [
+        test_worker_round_trip,
+        test_crash_mid_reply_is_not_retried,
+        test_unsent_script_falls_back
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+    
+    print("\n" + "=" * 40)
+    print(f"Tests completed: {passed}/{total} passed")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
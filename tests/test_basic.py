@@ -4,103 +4,74 @@ Basic test script for Office 365 MCP Server
 Tests core functionality without requiring full MCP setup.
 """
 
+import importlib
 import sys
-import os
 from pathlib import Path
 
 # Add src to path for imports (updated for new location)
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+# Modules the server is built from, imported once each
+MODULES = [
+    ("utils.logger", "Logger"),
+    ("utils.config", "Config"),
+    ("utils.validators", "Validators"),
+    ("integrations.applescript_bridge", "AppleScript bridge"),
+    ("controllers.powerpoint_controller", "PowerPoint controller"),
+    ("controllers.word_controller", "Word controller"),
+]
 
 def test_imports():
     """Test that all modules can be imported."""
     print("Testing imports...")
     
-    try:
-        from utils.logger import setup_logger
-        print("✓ Logger import successful")
-        
-        from utils.config import Config
-        print("✓ Config import successful")
-        
-        from utils.validators import validate_input
-        print("✓ Validators import successful")
-        
-        from integrations.applescript_bridge import AppleScriptBridge
-        print("✓ AppleScript bridge import successful")
-        
-        from controllers.powerpoint_controller import PowerPointController
-        print("✓ PowerPoint controller import successful")
-        
-        from controllers.word_controller import WordController
-        print("✓ Word controller import successful")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"✗ Import failed: {e}")
-        return False
+    for module_name, label in MODULES:
+        importlib.import_module(module_name)
+        print(f"✓ {label} import successful")
 
 def test_logger():
     """Test logger functionality."""
     print("\nTesting logger...")
     
-    try:
-        from utils.logger import setup_logger
-        logger = setup_logger("test")
-        logger.info("Test log message")
-        print("✓ Logger working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Logger test failed: {e}")
-        return False
+    from utils.logger import setup_logger
+    logger = setup_logger("test")
+    logger.info("Test log message")
+    print("✓ Logger working correctly")
 
 def test_config():
     """Test configuration functionality."""
     print("\nTesting configuration...")
     
-    try:
-        from utils.config import Config
-        config = Config()
-        log_level = config.get("log_level", "INFO")
-        print(f"✓ Config working correctly (log_level: {log_level})")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Config test failed: {e}")
-        return False
+    from utils.config import Config
+    config = Config()
+    log_level = config.get("log_level", "INFO")
+    assert log_level
+    print(f"✓ Config working correctly (log_level: {log_level})")
 
 def test_applescript():
     """Test AppleScript bridge (basic initialization)."""
     print("\nTesting AppleScript bridge...")
     
-    try:
-        from integrations.applescript_bridge import AppleScriptBridge
-        bridge = AppleScriptBridge()
-        print("✓ AppleScript bridge initialized successfully")
-        return True
-        
-    except Exception as e:
-        print(f"✗ AppleScript bridge test failed: {e}")
-        return False
+    from integrations.applescript_bridge import AppleScriptBridge
+    bridge = AppleScriptBridge()
+    assert bridge.powerpoint_app == "Microsoft PowerPoint"
+    print("✓ AppleScript bridge initialized successfully")
 
 def test_controllers():
     """Test controller initialization."""
     print("\nTesting controllers...")
     
-    try:
-        from controllers.powerpoint_controller import PowerPointController
-        from controllers.word_controller import WordController
-        
-        ppt_controller = PowerPointController()
-        word_controller = WordController()
-        
-        print("✓ Controllers initialized successfully")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Controller test failed: {e}")
-        return False
+    from controllers.powerpoint_controller import PowerPointController
+    from controllers.word_controller import WordController
+    
+    ppt_controller = PowerPointController()
+    word_controller = WordController()
+    assert ppt_controller.active_presentations == {}
+    assert word_controller.active_documents == {}
+    
+    print("✓ Controllers initialized successfully")
 
 def main():
     """Run all tests."""
@@ -119,8 +90,11 @@ def main():
     total = len(tests)
     
     for test in tests:
-        if test():
+        try:
+            test()
             passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
     
     print("\n" + "=" * 40)
     print(f"Tests completed: {passed}/{total} passed")
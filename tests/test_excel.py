@@ -8,7 +8,9 @@ import sys
 from pathlib import Path
 
 # Add src to path (updated for new location)
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 from controllers.excel_controller import ExcelController
 
@@ -33,45 +35,42 @@ async def test_excel_operations():
         )
         print(f"✓ Added worksheet: {worksheet['sheet_name']}")
         
-        # Test 3: Write cell
-        print("\n3. Writing to cell...")
-        await excel.write_cell(
-            workbook_id=workbook_id,
-            sheet_name="Sheet1",
-            cell="A1",
-            value="Product",
-            formatting={"bold": True, "font_size": 14}
-        )
-        print("✓ Wrote to cell A1")
-        
-        # Test 4: Write range
-        print("\n4. Writing data range...")
+        # Tests 3-5: Write cell, write range and add formula
+        # These touch separate cells, so they run concurrently
+        print("\n3-5. Writing cell, data range and formula...")
         data = [
             ["Product", "Q1", "Q2", "Q3", "Q4"],
             ["Laptops", 100, 150, 200, 180],
             ["Tablets", 80, 90, 110, 120],
             ["Phones", 200, 250, 300, 350]
         ]
-        await excel.write_range(
-            workbook_id=workbook_id,
-            sheet_name="Sales Data",
-            start_cell="A1",
-            data=data,
-            formatting={"bold": True}  # Bold headers
+        await asyncio.gather(
+            excel.write_cell(
+                workbook_id=workbook_id,
+                sheet_name="Sheet1",
+                cell="A1",
+                value="Product",
+                formatting={"bold": True, "font_size": 14}
+            ),
+            excel.write_range(
+                workbook_id=workbook_id,
+                sheet_name="Sales Data",
+                start_cell="A1",
+                data=data,
+                formatting={"bold": True}  # Bold headers
+            ),
+            excel.add_formula(
+                workbook_id=workbook_id,
+                sheet_name="Sales Data",
+                cell="F2",
+                formula="=SUM(B2:E2)"
+            )
         )
+        print("✓ Wrote to cell A1")
         print("✓ Wrote data range")
-        
-        # Test 5: Add formula
-        print("\n5. Adding formula...")
-        await excel.add_formula(
-            workbook_id=workbook_id,
-            sheet_name="Sales Data",
-            cell="F2",
-            formula="=SUM(B2:E2)"
-        )
         print("✓ Added SUM formula")
         
-        # Test 6: Create chart
+        # Test 6: Create chart (needs the data range written above)
         print("\n6. Creating chart...")
         await excel.create_chart(
             workbook_id=workbook_id,
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Excel workbook tests for Office 365 MCP Server
+Exercises ExcelController against openpyxl only; Excel itself is not needed.
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from openpyxl import Workbook, load_workbook
+
+from controllers.excel_controller import ExcelController, _parse_cell
+
+def test_streaming_resave():
+    """A streaming workbook can be saved to the same path twice."""
+    print("Testing streaming workbook re-save...")
+    
+    async def run():
+        excel = ExcelController(autosave=False)
+        workbook = await excel.create_workbook(title="Stream", streaming=True)
+        workbook_id = workbook["workbook_id"]
+        await excel.write_range(workbook_id, "Sheet1", "A2", [[1, 2], [3, 4]])
+        
+        save_path = Path(tempfile.mkdtemp()) / "stream.xlsx"
+        await excel.save_workbook(workbook_id, str(save_path))
+        result = await excel.save_workbook(workbook_id, str(save_path))
+        assert result["file_path"] == str(save_path)
+        
+        ws = load_workbook(save_path).active
+        assert ws["A1"].value == "Stream"
+        assert ws["B3"].value == 4
+    
+    asyncio.run(run())
+    print("✓ Streaming workbook saved twice")
+
+def test_template_resave():
+    """An untouched read-only template can be saved to the same path twice."""
+    print("\nTesting template workbook re-save...")
+    
+    async def run():
+        directory = Path(tempfile.mkdtemp())
+        template_path = directory / "template.xlsx"
+        template = Workbook()
+        template.active["A1"] = "Template"
+        template.save(template_path)
+        
+        excel = ExcelController(autosave=False)
+        workbook = await excel.create_workbook(template_path=str(template_path))
+        workbook_id = workbook["workbook_id"]
+        
+        save_path = directory / "copy.xlsx"
+        await excel.save_workbook(workbook_id, str(save_path))
+        await excel.save_workbook(workbook_id, str(save_path))
+        assert excel.active_workbooks[workbook_id]["workbook_object"] is None
+        
+        assert load_workbook(save_path).active["A1"].value == "Template"
+    
+    asyncio.run(run())
+    print("✓ Template workbook saved twice")
+
+def test_cell_references():
+    """Anchored references work; non-ASCII and 4-letter columns are rejected."""
+    print("\nTesting cell references...")
+    
+    async def run():
+        excel = ExcelController(autosave=False)
+        workbook = await excel.create_workbook(title="Refs")
+        workbook_id = workbook["workbook_id"]
+        
+        result = await excel.write_range(workbook_id, "Sheet1", "$B$2", [[1, 2]])
+        assert result["range"] == "$B$2:C2"
+        ws = excel.active_workbooks[workbook_id]["workbook_object"]["Sheet1"]
+        assert (ws["B2"].value, ws["C2"].value) == (1, 2)
+        
+        for ref in ("é1", "AAAA1"):
+            try:
+                await excel.write_range(workbook_id, "Sheet1", ref, [[1]])
+            except ValueError as e:
+                assert str(e) == f"Invalid cell reference: {ref}"
+            else:
+                raise AssertionError(f"write_range accepted {ref}")
+    
+    asyncio.run(run())
+    assert _parse_cell("$A$1") == _parse_cell("A$1") == _parse_cell("$a1") == (1, 1)
+    assert _parse_cell("XFD1048576") == (16384, 1048576)
+    print("✓ Cell references handled")
+
+def test_open_in_excel_is_opt_in():
+    """Workbooks only open in Excel on request, and then skip autosave."""
+    print("\nTesting the open_in_excel option...")
+    
+    async def run():
+        opened = []
+        
+        async def open_excel_file(path):
+            opened.append(path)
+            return True
+        
+        default = ExcelController()
+        bridge = default.applescript
+        saved = bridge.open_excel_file
+        bridge.open_excel_file = open_excel_file
+        try:
+            workbook = await default.create_workbook(title="Closed")
+            assert opened == [] and not workbook["applescript_available"]
+            await default.write_cell(workbook["workbook_id"], "Sheet1", "B1", 1)
+            assert default.active_workbooks[workbook["workbook_id"]]["flush_task"] is not None
+            
+            excel = ExcelController(open_in_excel=True)
+            workbook = await excel.create_workbook(title="Open")
+            assert opened == [workbook["file_path"]] and workbook["applescript_available"]
+            await excel.write_cell(workbook["workbook_id"], "Sheet1", "B1", 1)
+            entry = excel.active_workbooks[workbook["workbook_id"]]
+            assert entry["flush_task"] is None and entry["dirty"]
+        finally:
+            bridge.open_excel_file = saved
+    
+    asyncio.run(run())
+    print("✓ Opening in Excel is opt-in")
+
+def main():
+    """Run all tests."""
+    print("Office 365 MCP Server - Excel Workbook Tests")
+    print("=" * 40)
+    
+    tests = [
+        test_streaming_resave,
+        test_template_resave,
+        test_cell_references,
+        test_open_in_excel_is_opt_in
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"Tests completed: {passed}/{total} passed")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Active registry tests for Office 365 MCP Server
+Checks that items evicted from a registry are closed in their controller.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from controllers.excel_controller import ExcelController
+from controllers.word_controller import WordController
+from utils.registry import ActiveRegistry
+
+def test_eviction_closes_workbooks():
+    """Evicted workbooks leave the controller and lose their temp file."""
+    print("Testing workbook eviction...")
+    
+    async def run():
+        excel = ExcelController()
+        registry = ActiveRegistry(2, excel.close_workbook)
+        results = []
+        for i in range(4):
+            result = await excel.create_workbook(title=f"Book {i}")
+            results.append(result)
+            await registry.add(result["workbook_id"], result)
+        
+        listed = [item["workbook_id"] for item in registry.listing()]
+        assert listed == [result["workbook_id"] for result in results[2:]]
+        assert list(excel.active_workbooks) == listed
+        for result in results[:2]:
+            assert not Path(result["file_path"]).exists()
+        for result in results[2:]:
+            assert Path(result["file_path"]).exists()
+    
+    asyncio.run(run())
+    print("✓ Evicted workbooks are closed")
+
+def test_eviction_closes_documents():
+    """Evicted documents leave the controller and lose their temp file."""
+    print("\nTesting document eviction...")
+    
+    async def run():
+        word = WordController()
+        registry = ActiveRegistry(1, word.close_document)
+        first = await word.create_document(title="First")
+        await registry.add(first["document_id"], first)
+        await word.add_paragraph(first["document_id"], "Unsaved text")
+        second = await word.create_document(title="Second")
+        evicted = await registry.add(second["document_id"], second)
+        
+        assert evicted == [first["document_id"]]
+        assert [item["document_id"] for item in registry.listing()] == [second["document_id"]]
+        assert list(word.active_documents) == [second["document_id"]]
+        assert not Path(first["file_path"]).exists()
+    
+    asyncio.run(run())
+    print("✓ Evicted documents are closed")
+
+def test_failed_release_still_evicts():
+    """An item its controller cannot close still leaves the listing."""
+    print("\nTesting eviction when closing fails...")
+    
+    async def run():
+        async def release(item_id):
+            raise ValueError(f"{item_id} not found")
+        
+        registry = ActiveRegistry(1, release)
+        await registry.add("a", {"id": "a"})
+        assert await registry.add("b", {"id": "b"}) == ["a"]
+        assert registry.listing() == [{"id": "b"}]
+        assert len(registry) == 1
+    
+    asyncio.run(run())
+    print("✓ Failed releases are logged and evicted")
+
+def main():
+    """Run all tests."""
+    print("Office 365 MCP Server - Active Registry Tests")
+    print("=" * 40)
+    
+    tests = [
+        test_eviction_closes_workbooks,
+        test_eviction_closes_documents,
+        test_failed_release_still_evicts
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"Tests completed: {passed}/{total} passed")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Validator tests for Office 365 MCP Server
+Checks that the compiled schema validators behave exactly like validate_input.
+"""
+
+import random
+import sys
+import uuid
+from pathlib import Path
+
+# Add src to path for imports
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from utils import validators
+from utils.validators import _validate_pair, compile_schema, validate_input
+
+# Every schema defined by the validators module
+MODULE_SCHEMAS = {
+    name: schema
+    for name, schema in vars(validators).items()
+    if name.endswith("_SCHEMA") and isinstance(schema, dict)
+}
+
+# Extra schemas for rule combinations the module schemas do not use
+EXTRA_SCHEMAS = {
+    "position": {
+        "x": {"type": (int, float), "required": True, "min_value": 0},
+        "y": {"type": (int, float), "required": True, "min_value": 0}
+    },
+    "size": {
+        "width": {"type": (int, float), "required": True, "min_value": 0.1},
+        "height": {"type": (int, float), "required": True, "min_value": 0.1}
+    },
+    "untyped": {
+        "value": {"min_length": 2, "max_length": 4, "min_value": 1, "max_value": 9},
+        "choice": {"choices": frozenset(["a", 1, True])}
+    },
+    "typed_tuple": {
+        "number_or_text": {"type": (int, str), "required": True, "min_value": 3, "max_length": 3}
+    }
+}
+
+# Values tried for every field; MISSING leaves the field out of the data
+MISSING = object()
+VALUES = [
+    MISSING, None, True, False, 0, 1, -1, 5, 8, 72, 73, 0.05, 0.1, 1.5, 7.9,
+    float("nan"), "", "a", "ab", "abcde", "x" * 300, "default", "modern",
+    "Blank", "Title Slide", "title", "content", "left", "justify",
+    "#FF00AA", "FF00AA", "#ff00aa", str(uuid.uuid4()), str(uuid.uuid4()).upper(),
+    "https://example.com/a.png", {}, {"x": 1, "y": 2}, [], ("a",), 10 ** 20
+]
+
+def _outcome(validate, data):
+    """Return a comparable result: ("ok", dict) or ("error", type, message)."""
+    try:
+        return ("ok", validate(data))
+    except Exception as e:
+        return ("error", type(e).__name__, str(e))
+
+def _random_data(schema, rng):
+    """Build input data for a schema from randomly chosen VALUES."""
+    data = {}
+    for field in schema:
+        value = rng.choice(VALUES)
+        if value is not MISSING:
+            data[field] = value
+    if rng.random() < 0.2:
+        data["unknown_field"] = rng.choice(VALUES[1:])
+    return data
+
+def _assert_same(schema, data):
+    """Assert that compile_schema and validate_input agree on one input."""
+    expected = _outcome(lambda d: validate_input(d, schema), data)
+    actual = _outcome(compile_schema(schema), data)
+    # NaN never equals itself, so compare its repr instead
+    assert repr(actual) == repr(expected), f"{data!r}: {actual!r} != {expected!r}"
+
+def test_compiled_schemas_match_validate_input():
+    """Compiled validators give the same results and errors on random inputs."""
+    print("Testing compiled schemas against validate_input...")
+    
+    rng = random.Random(1234)
+    for name, schema in {**MODULE_SCHEMAS, **EXTRA_SCHEMAS}.items():
+        for _ in range(2000):
+            _assert_same(schema, _random_data(schema, rng))
+        print(f"✓ {name} matches")
+
+def test_edge_cases():
+    """Tuple types, bools as ints, and missing versus None fields."""
+    print("\nTesting validator edge cases...")
+    
+    formatting = validators._FORMATTING_SCHEMA
+    slide = validators._SLIDE_SCHEMA
+    presentation = validators._PRESENTATION_SCHEMA
+    cases = [
+        (formatting, {"font_size": 12.5}),
+        (formatting, {"font_size": "12"}),
+        (formatting, {"font_size": True}),
+        (formatting, {"font_size": 100}),
+        (formatting, {"bold": 1}),
+        (slide, {"presentation_id": str(uuid.uuid4()), "position": True}),
+        (slide, {"presentation_id": str(uuid.uuid4()), "position": -1}),
+        (slide, {"presentation_id": str(uuid.uuid4()), "position": 1.0}),
+        (slide, {}),
+        (slide, {"presentation_id": None}),
+        (presentation, {"title": "Deck", "theme": None}),
+        (presentation, {"title": ""}),
+    ]
+    for schema, data in cases:
+        _assert_same(schema, data)
+    
+    try:
+        validate_input({"font_size": "big"}, formatting)
+    except ValueError as e:
+        assert str(e) == "Field 'font_size' must be of type int or float"
+    else:
+        raise AssertionError("validate_input accepted a string font_size")
+    print("✓ Edge cases match")
+
+def test_validate_pair_matches_schemas():
+    """The inlined position/size check matches the two-field schemas."""
+    print("\nTesting position and size checks...")
+    
+    rng = random.Random(5678)
+    for name, first, second, min_value in (("position", "x", "y", 0), ("size", "width", "height", 0.1)):
+        schema = EXTRA_SCHEMAS[name]
+        for _ in range(2000):
+            data = _random_data(schema, rng)
+            expected = _outcome(lambda d: validate_input(d, schema), data)
+            actual = _outcome(lambda d: _validate_pair(d, first, second, min_value), data)
+            assert repr(actual) == repr(expected), f"{data!r}: {actual!r} != {expected!r}"
+        print(f"✓ {name} matches")
+
+def main():
+    """Run all tests."""
+    print("Office 365 MCP Server - Validator Tests")
+    print("=" * 40)
+    
+    tests = [
+        test_compiled_schemas_match_validate_input,
+        test_edge_cases,
+        test_validate_pair_matches_schemas
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"Tests completed: {passed}/{total} passed")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
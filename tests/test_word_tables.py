@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Word table tests for Office 365 MCP Server
+Checks that bulk-built table XML matches the cell-by-cell path.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from controllers.word_controller import _set_new_cell_text, _table_rows_xml
+
+# Table data covering escaping, whitespace, padding and truncation
+TABLES = [
+    [["Product", "Q1", "Q2"], ["Laptops", 100, 150.5], ["Tablets", 80, 90]],
+    [["a & b", "<tag>", "x > y"], ["  leading", "trailing  ", " both "], ["", None, 0]],
+    [["Ünïcödé", "日本語", "emoji 🎉"], ['"quoted"', "it's", "back\\slash"]],
+    [["short row"], [], ["too", "many", "cells", "here", "dropped"]],
+]
+
+def _bulk_table(doc, data, rows, columns):
+    """Build a table the way _insert_table does for large tables."""
+    table = doc.add_table(rows=0, cols=columns)
+    widths = [col.get(qn("w:w")) for col in table._tbl.tblGrid.gridCol_lst]
+    rows_xml = _table_rows_xml(data, rows, columns, widths)
+    assert rows_xml is not None
+    table._tbl.extend(list(parse_xml(rows_xml)))
+    return table._tbl
+
+def _per_cell_table(doc, data, rows, columns):
+    """Build a table the way _insert_table does for small tables."""
+    table = doc.add_table(rows=rows, cols=columns)
+    trs = table._tbl.tr_lst
+    for row_idx, row_data in enumerate(data[:rows]):
+        tcs = trs[row_idx].tc_lst
+        for col_idx, cell_data in enumerate(row_data[:columns]):
+            _set_new_cell_text(tcs[col_idx], str(cell_data))
+    return table._tbl
+
+def _docx_table(doc, data, rows, columns):
+    """Build a table through python-docx's public Cell.text setter."""
+    table = doc.add_table(rows=rows, cols=columns)
+    for row_idx, row_data in enumerate(data[:rows]):
+        for col_idx, cell_data in enumerate(row_data[:columns]):
+            table.cell(row_idx, col_idx).text = str(cell_data)
+    return table._tbl
+
+def test_bulk_rows_match_per_cell():
+    """Bulk table XML equals the XML written cell by cell."""
+    print("Testing bulk table XML...")
+    
+    doc = Document()
+    for data in TABLES:
+        for rows, columns in ((len(data), 3), (len(data) + 2, 4), (1, 2)):
+            bulk = etree.tostring(_bulk_table(doc, data, rows, columns))
+            per_cell = etree.tostring(_per_cell_table(doc, data, rows, columns))
+            docx = etree.tostring(_docx_table(doc, data, rows, columns))
+            assert bulk == per_cell, f"{data!r} ({rows}x{columns})"
+            assert bulk == docx, f"{data!r} ({rows}x{columns})"
+    print("✓ Bulk table XML matches")
+
+def test_breaks_fall_back():
+    """Cells with tabs or line breaks are left to the per-cell path."""
+    print("\nTesting table cells with breaks...")
+    
+    for text in ("a\tb", "line\nbreak", "carriage\rreturn"):
+        assert _table_rows_xml([["ok", text]], 1, 2, ["100", "100"]) is None
+    print("✓ Cells with breaks fall back")
+
+def main():
+    """Run all tests."""
+    print("Office 365 MCP Server - Word Table Tests")
+    print("=" * 40)
+    
+    tests = [
+        test_bulk_rows_match_per_cell,
+        test_breaks_fall_back
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"Tests completed: {passed}/{total} passed")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())